@@ -0,0 +1,46 @@
+/* Shared page chrome behaviour, loaded by every redesign page (scripts/layout.py).
+
+   Theme toggle: #theme-toggle flips data-theme on <html> between dark and light,
+   remembers the choice in localStorage ('preferred-theme'; the inline script in
+   <head> applies it before first paint) and shows ☾ / ☀.
+   Mobile nav: #hamburger toggles .nav-open on .nav; .nav-trigger buttons open
+   their .nav-group; following a link or clicking outside closes the menu. */
+(function () {
+  var root = document.documentElement;
+  var b = document.getElementById('theme-toggle');
+  function icon() { b.textContent = root.getAttribute('data-theme') === 'dark' ? '☾' : '☀'; }
+  if (b) {
+    b.addEventListener('click', function () {
+      var nx = root.getAttribute('data-theme') === 'dark' ? 'light' : 'dark';
+      root.setAttribute('data-theme', nx);
+      try { localStorage.setItem('preferred-theme', nx); } catch (e) {}
+      icon();
+    });
+    icon();
+  }
+
+  var n = document.querySelector('.nav');
+  var h = document.getElementById('hamburger');
+  function close() {
+    if (n) n.classList.remove('nav-open');
+    if (h) h.setAttribute('aria-expanded', 'false');
+  }
+  if (h && n) {
+    h.addEventListener('click', function () {
+      var o = n.classList.toggle('nav-open');
+      h.setAttribute('aria-expanded', o ? 'true' : 'false');
+    });
+  }
+  document.querySelectorAll('.nav-trigger').forEach(function (t) {
+    t.addEventListener('click', function () {
+      var o = t.parentElement.classList.toggle('open');
+      t.setAttribute('aria-expanded', o ? 'true' : 'false');
+    });
+  });
+  if (n) {
+    n.querySelectorAll('.nav-links a').forEach(function (a) { a.addEventListener('click', close); });
+    document.addEventListener('click', function (e) {
+      if (n.classList.contains('nav-open') && !n.contains(e.target)) close();
+    });
+  }
+})();
@@ -0,0 +1,108 @@
+"""
+Atomic, write-if-changed file output shared by the pipeline, post-processor and build.
+
+`write_if_changed` hashes the new content against the file on disk and leaves the
+file alone (mtime included) when they match, so downstream mtime/hash caches stay
+valid. Otherwise it writes a temp file in the same directory, fsyncs it and renames
+it over the target, so an interrupted run never leaves a truncated file behind.
+
+Every call is tallied in the module-level `stats`; `stats.report()` summarizes
+files written/unchanged and the bytes that did not need writing.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Union
+
+import json_codec
+
+
+class WriteStats:
+    """Running totals of write_if_changed calls in this process."""
+
+    def __init__(self):
+        self.written = 0
+        self.unchanged = 0
+        self.bytes_written = 0
+        self.bytes_avoided = 0
+
+    def report(self) -> str:
+        return (
+            f"{self.written} file(s) written ({self.bytes_written / 1024:.1f} KB), "
+            f"{self.unchanged} unchanged ({self.bytes_avoided / 1024:.1f} KB not rewritten)"
+        )
+
+
+stats = WriteStats()
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def _same_content(path: Path, payload: bytes) -> bool:
+    try:
+        if path.stat().st_size != len(payload):
+            return False
+        existing = path.read_bytes()
+    except FileNotFoundError:
+        return False
+    return hashlib.sha256(existing).digest() == hashlib.sha256(payload).digest()
+
+
+def write_if_changed(path: Union[str, Path], content: Union[str, bytes], encoding: str = "utf-8") -> bool:
+    """Atomically write `content` to `path` unless it already holds exactly that.
+
+    Returns True if the file was written, False if it was already up to date.
+    """
+    path = Path(path)
+    payload = content.encode(encoding) if isinstance(content, str) else content
+    if _same_content(path, payload):
+        stats.unchanged += 1
+        stats.bytes_avoided += len(payload)
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o666 & ~_umask()
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    # Persist the rename itself (best effort; not supported on every platform)
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except OSError:
+        pass
+
+    stats.written += 1
+    stats.bytes_written += len(payload)
+    return True
+
+
+def write_json_if_changed(path: Union[str, Path], obj: Any, trailing_newline: bool = False, **json_kwargs) -> bool:
+    """json_codec.dumps `obj` (indent=2, ensure_ascii=False unless overridden) and write_if_changed."""
+    payload = json_codec.dumps_bytes(obj, **json_kwargs)
+    if trailing_newline:
+        payload += b"\n"
+    return write_if_changed(path, payload)
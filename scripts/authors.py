@@ -0,0 +1,101 @@
+"""
+Author names: the interned author table and the display/search strings cards use.
+
+Collaboration papers list hundreds of authors, most of them shared with other
+papers. The hot index (see publication_store) stores each distinct name once in
+an `AuthorTable` and every paper as a list of integer ids plus an author count,
+and the store renders the card's display string ('F. Last, F. Last, F. Last
+et al.') and the search string from those when it loads the index.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pages_shared import esc
+
+DISPLAY_AUTHORS = 3
+
+
+def normalize_name(name: str) -> str:
+    """Collapse runs of whitespace, so spacing variants share one table entry."""
+    return " ".join(str(name).split())
+
+
+class AuthorTable:
+    """Interned author names; an author's id is its position in `names`."""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: str) -> int:
+        name = normalize_name(name)
+        author_id = self._ids.get(name)
+        if author_id is None:
+            author_id = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return author_id
+
+    def ids(self, names: Iterable[str]) -> List[int]:
+        return [self.intern(name) for name in names]
+
+    def lookup(self, ids: Iterable[int]) -> List[str]:
+        names = self.names
+        return [names[i] for i in ids]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def format_author(author: str) -> str:
+    """Convert an author string to 'F. Last' initials form (HTML-escaped).
+
+    Handles 'Last, First M.' and 'First M. Last' formats; Speagle is bolded.
+    """
+    is_speagle = "speagle" in author.lower()
+    if "," in author:
+        last, _, first = author.partition(",")
+        last = last.strip()
+        first = first.strip()
+    else:
+        parts = author.strip().split()
+        if len(parts) >= 2:
+            last = parts[-1]
+            first = " ".join(parts[:-1])
+        else:
+            last = author.strip()
+            first = ""
+    initial = ""
+    fp = first.strip()
+    if fp:
+        # Use the first alphabetic character of the first name as the initial
+        for ch in fp:
+            if ch.isalpha():
+                initial = ch.upper() + ". "
+                break
+    display = esc(f"{initial}{last}".strip())
+    if is_speagle:
+        display = f"<strong>{display}</strong>"
+    return display
+
+
+def format_authors_html(authors: List[str], count: Optional[int] = None) -> str:
+    """Show the first 3 authors as 'F. Last', append ' et al.' if there are more.
+
+    `count` is the full author count when `authors` is already truncated.
+    """
+    if not authors:
+        return ""
+    html = ", ".join(format_author(a) for a in authors[:DISPLAY_AUTHORS])
+    if (len(authors) if count is None else count) > DISPLAY_AUTHORS:
+        html += " et al."
+    return html
+
+
+def author_strings(pub: Dict) -> Tuple[str, str]:
+    """(display HTML, search text) for a hot-index record or a full publication."""
+    if "authorsDisplay" in pub:
+        return pub["authorsDisplay"], pub.get("authorsText", "")
+    authors = pub.get("authors", []) or []
+    return format_authors_html(authors), " ".join(authors)
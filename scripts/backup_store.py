@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Content-addressed backup store for publications_data.json.
+
+Each snapshot is identified by the SHA-256 of its canonical JSON (sorted keys,
+compact separators), so formatting differences never create a new snapshot and
+identical data is stored once. Snapshots are kept gzip-compressed under
+
+    assets/data/backups/objects/<hh>/<hash>.json.gz
+
+next to a small index.json listing when each snapshot was taken. A retention
+policy (CONFIG["backups"]) keeps the N most recent snapshots plus the newest of
+each recent day and ISO week; unreferenced objects are deleted on prune.
+
+Usage:
+  python scripts/backup_store.py list
+  python scripts/backup_store.py save [--label manual]
+  python scripts/backup_store.py restore <ref> [--to PATH]
+  python scripts/backup_store.py diff <ref> [<ref>|current]
+  python scripts/backup_store.py prune [--dry-run]
+  python scripts/backup_store.py import-legacy [--delete]
+
+<ref> is a snapshot hash prefix, "latest", or "-N" for the N-th newest.
+"""
+
+import argparse
+import gzip
+import hashlib
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import json_codec
+import publication_store
+from atomic_write import write_if_changed
+from config import CONFIG, get_backup_dir, get_data_path
+from paper_index import paper_keys
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+
+def content_hash(data: Dict) -> str:
+    """SHA-256 of the canonical JSON form of `data`."""
+    canonical = json_codec.dumps_bytes(data, indent=None, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical).hexdigest()
+
+
+class BackupStore:
+    """Deduplicating, compressed snapshot store with a retention policy."""
+
+    def __init__(self, root: Optional[Path] = None, policy: Optional[Dict] = None):
+        self.root = Path(root) if root else get_backup_dir()
+        self.objects_dir = self.root / "objects"
+        self.index_path = self.root / "index.json"
+        self.policy = dict(CONFIG["backups"], **(policy or {}))
+        self.snapshots: List[Dict] = []
+        self.bytes_written = 0
+        self._load_index()
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _load_index(self):
+        if self.index_path.exists():
+            index = json_codec.load(self.index_path)
+            if index.get("version") == INDEX_VERSION:
+                self.snapshots = index.get("snapshots", [])
+
+    def _save_index(self):
+        payload = json_codec.dumps_bytes(
+            {"version": INDEX_VERSION, "snapshots": self.snapshots}, ensure_ascii=True
+        )
+        if write_if_changed(self.index_path, payload):
+            self.bytes_written += len(payload)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.json.gz"
+
+    # ------------------------------------------------------------------
+    # Save / load
+    # ------------------------------------------------------------------
+
+    def save(
+        self, data: Dict, label: str = "", raw: Optional[bytes] = None
+    ) -> Tuple[str, bool]:
+        """Snapshot `data`. Returns (hash, stored) where stored is False if deduplicated.
+
+        `raw` is the file's exact bytes, when available, so restore reproduces
+        the file byte for byte; otherwise the data is stored pretty-printed.
+        """
+        start = time.perf_counter()
+        digest, stored = self._add(data, label, raw)
+        self.prune()
+        self._save_index()
+        elapsed = (time.perf_counter() - start) * 1000
+        logger.info(
+            f"Backup {digest[:12]} ({label or 'unlabelled'}): "
+            f"{'stored' if stored else 'deduplicated'} in {elapsed:.0f} ms"
+        )
+        return digest, stored
+
+    def _add(
+        self,
+        data: Dict,
+        label: str,
+        raw: Optional[bytes] = None,
+        created: Optional[datetime] = None,
+    ) -> Tuple[str, bool]:
+        digest = content_hash(data)
+        path = self._object_path(digest)
+        stored = False
+        if not path.exists():
+            if raw is None:
+                raw = json_codec.dumps_bytes(data)
+            compressed = gzip.compress(
+                raw, compresslevel=self.policy["compression_level"], mtime=0
+            )
+            write_if_changed(path, compressed)
+            self.bytes_written += len(compressed)
+            stored = True
+
+        # Consecutive identical snapshots collapse into one index entry
+        if not self.snapshots or self.snapshots[-1]["hash"] != digest:
+            self.snapshots.append(
+                {
+                    "hash": digest,
+                    "created": (created or datetime.now()).isoformat(timespec="seconds"),
+                    "label": label,
+                    "publications": len(data.get("publications", [])),
+                    "size": path.stat().st_size,
+                }
+            )
+        return digest, stored
+
+    def resolve(self, ref: str) -> Dict:
+        """Return the index entry for a hash prefix, 'latest', or '-N'."""
+        if not self.snapshots:
+            raise LookupError("no snapshots in backup store")
+        if ref == "latest":
+            return self.snapshots[-1]
+        if ref.startswith("-") and ref[1:].isdigit():
+            n = int(ref[1:])
+            if not 1 <= n <= len(self.snapshots):
+                raise LookupError(f"only {len(self.snapshots)} snapshots")
+            return self.snapshots[-n]
+        matches = {s["hash"] for s in self.snapshots if s["hash"].startswith(ref)}
+        if len(matches) != 1:
+            raise LookupError(f"snapshot ref {ref!r} matches {len(matches)} snapshots")
+        digest = matches.pop()
+        return next(s for s in reversed(self.snapshots) if s["hash"] == digest)
+
+    def read_bytes(self, ref: str) -> bytes:
+        return gzip.decompress(self._object_path(self.resolve(ref)["hash"]).read_bytes())
+
+    def load(self, ref: str) -> Dict:
+        return json_codec.loads(self.read_bytes(ref))
+
+    def restore(self, ref: str, dest: Optional[Path] = None) -> Path:
+        """Write snapshot `ref` to `dest` (default: the live data file).
+
+        Restoring the live file also refreshes the hot index and cold shards
+        (see publication_store), as DataStore.save does.
+        """
+        dest = Path(dest) if dest else get_data_path()
+        raw = self.read_bytes(ref)
+        write_if_changed(dest, raw)
+        if dest.resolve() == get_data_path().resolve():
+            publication_store.write(json_codec.loads(raw), raw)
+        return dest
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def _retained(self) -> List[Dict]:
+        n = len(self.snapshots)
+        keep = set(range(max(0, n - self.policy["keep_recent"]), n))
+        ordered = list(enumerate(self.snapshots))
+        for period, limit in (
+            (lambda d: d.date(), self.policy["keep_daily"]),
+            (lambda d: d.isocalendar()[:2], self.policy["keep_weekly"]),
+        ):
+            seen = []
+            for i, snap in reversed(ordered):
+                bucket = period(datetime.fromisoformat(snap["created"]))
+                if bucket in seen:
+                    continue
+                if len(seen) >= limit:
+                    break
+                seen.append(bucket)
+                keep.add(i)
+        return [snap for i, snap in ordered if i in keep]
+
+    def prune(self, dry_run: bool = False) -> List[Path]:
+        """Apply the retention policy; return object files that were (or would be) deleted."""
+        retained = self._retained()
+        live = {s["hash"] for s in retained}
+        doomed = []
+        if self.objects_dir.exists():
+            for path in self.objects_dir.glob("*/*.json.gz"):
+                if path.name[: -len(".json.gz")] not in live:
+                    doomed.append(path)
+        if not dry_run:
+            self.snapshots = retained
+            for path in doomed:
+                path.unlink()
+        return doomed
+
+    # ------------------------------------------------------------------
+    # Legacy backups
+    # ------------------------------------------------------------------
+
+    def import_legacy(self, delete: bool = False) -> int:
+        """Ingest old timestamped *.json backups (oldest first)."""
+        legacy = sorted(self.root.glob("publications_*.json"), key=lambda p: p.stat().st_mtime)
+        for path in legacy:
+            raw = path.read_bytes()
+            created = datetime.fromtimestamp(path.stat().st_mtime)
+            self._add(json_codec.loads(raw), f"legacy:{path.stem}", raw=raw, created=created)
+            if delete:
+                path.unlink()
+        self.snapshots.sort(key=lambda s: s["created"])
+        self.prune()
+        self._save_index()
+        return len(legacy)
+
+
+# ---------------------------------------------------------------------------
+# Diff
+# ---------------------------------------------------------------------------
+
+
+def diff_data(old: Dict, new: Dict) -> Dict:
+    """Summarize publication-level differences between two data snapshots."""
+
+    def by_key(data):
+        out = {}
+        for pub in data.get("publications", []):
+            keys = paper_keys(pub)
+            out[keys[0] if keys else pub.get("title", "")] = pub
+        return out
+
+    old_pubs, new_pubs = by_key(old), by_key(new)
+    changed = {}
+    for key in old_pubs.keys() & new_pubs.keys():
+        a, b = old_pubs[key], new_pubs[key]
+        fields = sorted(f for f in a.keys() | b.keys() if a.get(f) != b.get(f))
+        if fields:
+            changed[key] = fields
+    metrics = {
+        k: (old.get("metrics", {}).get(k), new.get("metrics", {}).get(k))
+        for k in ("totalPapers", "totalCitations", "hIndex", "i10Index")
+        if old.get("metrics", {}).get(k) != new.get("metrics", {}).get(k)
+    }
+    return {
+        "added": sorted(new_pubs[k].get("title", k) for k in new_pubs.keys() - old_pubs.keys()),
+        "removed": sorted(old_pubs[k].get("title", k) for k in old_pubs.keys() - new_pubs.keys()),
+        "changed": {new_pubs[k].get("title", k): f for k, f in sorted(changed.items())},
+        "metrics": metrics,
+    }
+
+
+def _print_diff(diff: Dict):
+    for title in diff["added"]:
+        print(f"+ {title}")
+    for title in diff["removed"]:
+        print(f"- {title}")
+    for title, fields in diff["changed"].items():
+        print(f"~ {title}: {', '.join(fields)}")
+    for metric, (a, b) in diff["metrics"].items():
+        print(f"  {metric}: {a} -> {b}")
+    print(
+        f"{len(diff['added'])} added, {len(diff['removed'])} removed, "
+        f"{len(diff['changed'])} changed"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publications data backup store")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="List snapshots, newest last")
+    p = sub.add_parser("save", help="Snapshot the live data file")
+    p.add_argument("--label", default="manual")
+    p = sub.add_parser("restore", help="Restore a snapshot")
+    p.add_argument("ref")
+    p.add_argument("--to", type=Path, help="Write here instead of the live data file")
+    p = sub.add_parser("diff", help="Compare two snapshots (or a snapshot and the live file)")
+    p.add_argument("old")
+    p.add_argument("new", nargs="?", default="current")
+    p = sub.add_parser("prune", help="Apply the retention policy")
+    p.add_argument("--dry-run", action="store_true")
+    p = sub.add_parser("import-legacy", help="Ingest old publications_*.json backups")
+    p.add_argument("--delete", action="store_true", help="Delete them once stored")
+    args = parser.parse_args()
+
+    store = BackupStore()
+
+    if args.command == "list":
+        for i, snap in enumerate(store.snapshots):
+            print(
+                f"{i - len(store.snapshots):>4}  {snap['hash'][:12]}  {snap['created']}  "
+                f"{snap['publications']:>4} pubs  {snap['size'] / 1024:>7.1f} KB  {snap['label']}"
+            )
+    elif args.command == "save":
+        path = get_data_path()
+        raw = path.read_bytes()
+        digest, stored = store.save(json_codec.loads(raw), label=args.label, raw=raw)
+        print(f"{digest[:12]} {'stored' if stored else 'already stored'}")
+    elif args.command == "restore":
+        dest = store.restore(args.ref, args.to)
+        print(f"Restored {store.resolve(args.ref)['hash'][:12]} to {dest}")
+    elif args.command == "diff":
+        old = store.load(args.old)
+        if args.new == "current":
+            new = json_codec.load(get_data_path())
+        else:
+            new = store.load(args.new)
+        _print_diff(diff_data(old, new))
+    elif args.command == "prune":
+        doomed = store.prune(dry_run=args.dry_run)
+        if not args.dry_run:
+            store._save_index()
+        verb = "Would delete" if args.dry_run else "Deleted"
+        print(f"{verb} {len(doomed)} snapshot objects")
+    elif args.command == "import-legacy":
+        print(f"Imported {store.import_legacy(delete=args.delete)} legacy backups")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark build_html page rendering against worker count.
+
+Renders every page template (nothing is written) with build_html.render_pages
+at each worker count, on the real content and on synthetic content scaled up
+from it: every list in content.json repeated, and publications_data.json
+copied with a per-copy title suffix so every copy is a distinct paper (split
+in memory from a temporary file, the cube built directly, so neither the
+store nor the build cache is touched). Every worker count must render the
+same pages as the serial path.
+
+Usage: python scripts/bench_build.py [--scales 1 8] [--workers 1 2 4] [--repeat 3]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import json_codec
+from build_html import CONTENT_JSON, HTML_FILES, render_pages
+from config import get_data_path
+from publication_cube import PublicationCube, build_cube
+from publication_store import PublicationStore
+
+
+def scale_content(value, scale):
+    if isinstance(value, dict):
+        return {k: scale_content(v, scale) for k, v in value.items()}
+    if isinstance(value, list):
+        return [scale_content(v, scale) for v in value] * scale
+    return value
+
+
+def snapshot(scale, tmp):
+    content = json_codec.load(CONTENT_JSON)
+    if scale == 1:
+        return {"content": content}
+    data = json_codec.load(get_data_path())
+    data["publications"] = [
+        dict(p, title=f"{p.get('title', '')} [{k}]") for k in range(scale) for p in data["publications"]
+    ]
+    source = Path(tmp) / f"publications_x{scale}.json"
+    source.write_bytes(json_codec.dumps_bytes(data))
+    store = PublicationStore(source, Path(tmp) / f"store_x{scale}")
+    cube = PublicationCube(build_cube(store.publications, store.metrics, store.source_digest()))
+    return {"content": scale_content(content, scale), "store": store, "cube": cube}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--scales", type=int, nargs="+", default=[1, 8])
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    ap.add_argument("--repeat", type=int, default=3, help="timing repeats (best is reported)")
+    args = ap.parse_args()
+
+    tasks = [(name, path.read_text(encoding="utf-8")) for name, path in HTML_FILES.items() if path.exists()]
+    print(f"{'scale':>6} {'papers':>7} {'workers':>8} {'time s':>8} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            snap = snapshot(scale, tmp)
+            papers = len((snap["store"] if "store" in snap else PublicationStore()).publications)
+            baseline = None
+            for workers in args.workers:
+                best = float("inf")
+                for _ in range(args.repeat):
+                    # A fresh copy each time, so the pool pays for loading what it shares
+                    run = dict(snap)
+                    t0 = time.perf_counter()
+                    pages = [html for html, _ in render_pages(tasks, run, workers)]
+                    best = min(best, time.perf_counter() - t0)
+                if baseline is None:
+                    baseline = (pages, best)
+                elif pages != baseline[0]:
+                    raise SystemExit(f"MISMATCH at scale {scale}, {workers} workers")
+                print(f"{scale:>6} {papers:>7} {workers:>8} {best:>8.2f} {baseline[1] / best:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
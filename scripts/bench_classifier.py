@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Benchmark the compiled keyword classifier against the per-keyword substring scan.
+
+Classifies every publication in assets/data/publications_data.json (title + abstract +
+keywords) with keyword maps of increasing size: the real CONFIG map, padded with
+synthetic multi-word keywords. Both implementations must agree on every paper.
+
+Usage: python scripts/bench_classifier.py [--sizes 24 100 500 2000] [--repeat 3]
+"""
+import argparse
+import json
+import random
+import time
+
+from config import CONFIG, get_data_path
+from keyword_classifier import KeywordClassifier
+
+
+def naive_classify(title, abstract, keywords, keyword_mapping, default_category):
+    """The original fetcher implementation: one `keyword in text` scan per keyword."""
+    text = f"{title} {abstract} {' '.join(keywords)}".lower()
+    category_scores = {}
+    for keyword, category in keyword_mapping.items():
+        if keyword in text:
+            category_scores[category] = category_scores.get(category, 0) + 1
+    if category_scores:
+        return max(category_scores, key=category_scores.get)
+    return default_category
+
+
+def scaled_mapping(size, vocabulary, seed=0):
+    """The real keyword map padded to `size` entries with 2-3 word phrases from the corpus."""
+    base = dict(CONFIG["categories"]["keywords_mapping"])
+    categories = list(dict.fromkeys(base.values()))
+    rng = random.Random(seed)
+    while len(base) < size:
+        phrase = " ".join(rng.choice(vocabulary) for _ in range(rng.choice((2, 2, 3))))
+        base.setdefault(phrase, rng.choice(categories))
+    return base
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", type=int, nargs="+", default=[24, 100, 500, 2000])
+    ap.add_argument("--repeat", type=int, default=3, help="timing repeats (best is reported)")
+    args = ap.parse_args()
+
+    with open(get_data_path(), encoding="utf-8") as f:
+        pubs = json.load(f).get("publications", [])
+    records = [
+        (p.get("title", "") or "", p.get("abstract", "") or "", p.get("keywords", []) or [])
+        for p in pubs
+    ]
+    vocabulary = sorted({w for t, a, _ in records for w in f"{t} {a}".lower().split() if w.isalpha() and len(w) > 3})
+    default = CONFIG["categories"]["default_category"]
+
+    print(f"{len(records)} publications, vocabulary {len(vocabulary)} words")
+    print(f"{'keywords':>9} {'compile ms':>11} {'naive ms':>10} {'compiled ms':>12} {'speedup':>8}")
+    for size in args.sizes:
+        mapping = scaled_mapping(size, vocabulary)
+
+        t0 = time.perf_counter()
+        clf = KeywordClassifier(mapping, default)
+        compile_ms = (time.perf_counter() - t0) * 1000
+
+        naive_best = compiled_best = float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            expected = [naive_classify(t, a, k, mapping, default) for t, a, k in records]
+            naive_best = min(naive_best, time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            got = [area for area, _ in clf.classify_publications(pubs)]
+            compiled_best = min(compiled_best, time.perf_counter() - t0)
+
+        if got != expected:
+            mismatches = sum(1 for a, b in zip(got, expected) if a != b)
+            raise SystemExit(f"MISMATCH at {size} keywords: {mismatches} papers differ")
+        print(f"{clf.size:>9} {compile_ms:>11.2f} {naive_best * 1000:>10.2f} "
+              f"{compiled_best * 1000:>12.2f} {naive_best / compiled_best:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
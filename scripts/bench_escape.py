@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark HTML escaping and card rendering, at 1x and 10x the content volume.
+
+Escaping: every string field of content.json and the publications hot index,
+repeated --scale times, through the previous escapers (a re.sub on every
+call, then chained replaces) and through pages_shared's (the regex only when
+a & is present). Both must give the same strings.
+
+Cards: every page's containers (build_html.page_fills) on the real content
+and on bench_build's content scaled --scale times, rendered with each set of
+escapers swapped into the generator modules.
+
+Usage: python scripts/bench_escape.py [--scale 10] [--repeat 5]
+"""
+import argparse
+import re
+import tempfile
+import time
+
+import build_html
+import layout
+import pages_awards
+import pages_mentorship
+import pages_news
+import pages_service
+import pages_shared
+import pages_software
+import pages_talks
+import pages_teaching
+from bench_build import snapshot
+from build_html import HTML_FILES, page_fills
+
+
+def regex_esc(s):
+    return re.sub(r"&(?!(?:amp|lt|gt|quot|#\d+);)", "&amp;", str(s or ""))
+
+
+def regex_esc_text(s):
+    return regex_esc(s).replace("<", "&lt;").replace(">", "&gt;")
+
+
+def regex_attr_esc(s):
+    return regex_esc(str(s or "")).replace('"', "&quot;").lower()
+
+
+def regex_url_attr(s):
+    return regex_esc(str(s or "")).replace('"', "&quot;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+ESCAPERS = {
+    "regex": {"esc": regex_esc, "esc_text": regex_esc_text, "attr_esc": regex_attr_esc, "url_attr": regex_url_attr},
+    "fast": {name: getattr(pages_shared, name) for name in ("esc", "esc_text", "attr_esc", "url_attr")},
+}
+MODULES = (build_html, layout, pages_shared, pages_awards, pages_mentorship, pages_news,
+           pages_service, pages_software, pages_talks, pages_teaching)
+
+
+def use_escapers(kind):
+    """Swap one set of escapers into every generator module."""
+    for module in MODULES:
+        for name, fn in ESCAPERS[kind].items():
+            if name in vars(module):
+                setattr(module, name, fn)
+
+
+def strings(value, out):
+    if isinstance(value, dict):
+        for v in value.values():
+            strings(v, out)
+    elif isinstance(value, list):
+        for v in value:
+            strings(v, out)
+    elif isinstance(value, str):
+        out.append(value)
+    return out
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--scale", type=int, default=10, help="content volume multiple")
+    ap.add_argument("--repeat", type=int, default=5, help="timing repeats (best is reported)")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snaps = {1: snapshot(1, tmp), args.scale: snapshot(args.scale, tmp)}
+        build_html._init_page_worker(snaps[1])
+        store, _ = build_html._publications()
+        values = strings([snaps[1]["content"], store.publications], []) * args.scale
+
+        print(f"{len(values)} strings ({sum('&' in v for v in values)} with &)")
+        print(f"{'escaper':<10} {'regex ms':>9} {'fast ms':>9} {'speedup':>8}")
+        for name in ("esc", "esc_text", "attr_esc", "url_attr"):
+            old, new = ESCAPERS["regex"][name], ESCAPERS["fast"][name]
+            if [old(v) for v in values] != [new(v) for v in values]:
+                raise SystemExit(f"MISMATCH in {name}")
+            times = [best_of(lambda: [fn(v) for v in values], args.repeat) for fn in (old, new)]
+            print(f"{name:<10} {times[0] * 1e3:>9.1f} {times[1] * 1e3:>9.1f} {times[0] / times[1]:>7.1f}x")
+
+        print(f"\n{'scale':>5} {'page':<13} {'regex ms':>9} {'fast ms':>9} {'speedup':>8}")
+        for scale, snap in snaps.items():
+            build_html._init_page_worker(snap)
+            totals = [0.0, 0.0]
+            for page in HTML_FILES:
+                times, outputs = [], []
+                for kind in ("regex", "fast"):
+                    use_escapers(kind)
+                    outputs.append(page_fills(page, snap["content"]))
+                    times.append(best_of(lambda: page_fills(page, snap["content"]), args.repeat))
+                if outputs[0] != outputs[1]:
+                    raise SystemExit(f"MISMATCH on {page} at scale {scale}")
+                totals = [t + u for t, u in zip(totals, times)]
+                print(f"{scale:>5} {page:<13} {times[0] * 1e3:>9.2f} {times[1] * 1e3:>9.2f} "
+                      f"{times[0] / times[1]:>7.1f}x")
+            print(f"{scale:>5} {'total':<13} {totals[0] * 1e3:>9.2f} {totals[1] * 1e3:>9.2f} "
+                  f"{totals[0] / totals[1]:>7.1f}x")
+        use_escapers("fast")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark JSON load/dump of every data file: stdlib json against json_codec.
+
+For each assets/data/**/*.json file, times parsing its bytes and re-serializing
+it the way the scripts write it (indent=2, ensure_ascii=False), plus the
+compact sorted form used for content hashes. Output must match json.dumps
+byte for byte; any difference is reported as a mismatch and fails the run.
+
+Usage: python scripts/bench_json.py [--repeat 20]
+"""
+import argparse
+import json
+import time
+
+import json_codec
+from config import get_project_root
+
+LAYOUTS = {
+    "pretty": dict(indent=2),
+    "hash": dict(indent=None, sort_keys=True, separators=(",", ":")),
+}
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=20, help="timing repeats (best is reported)")
+    args = ap.parse_args()
+
+    data_dir = get_project_root() / "assets" / "data"
+    paths = sorted(p for p in data_dir.rglob("*.json") if "backups" not in p.parts)
+
+    print(f"json_codec backend: {json_codec.BACKEND}")
+    print(f"{'file':<36} {'KB':>7} {'op':>12} {'json ms':>8} {'codec ms':>9} {'speedup':>8}")
+    totals = {"json": 0.0, "codec": 0.0}
+    mismatches = 0
+    for path in paths:
+        raw = path.read_bytes()
+        obj = json.loads(raw)
+        name = str(path.relative_to(data_dir))
+        ops = [("load", lambda: json.loads(raw), lambda: json_codec.loads(raw))]
+        for layout, kw in LAYOUTS.items():
+            ops.append((
+                f"dump {layout}",
+                lambda kw=kw: json.dumps(obj, ensure_ascii=False, **kw).encode("utf-8"),
+                lambda kw=kw: json_codec.dumps_bytes(obj, **kw),
+            ))
+            if json.dumps(obj, ensure_ascii=False, **kw).encode("utf-8") != json_codec.dumps_bytes(obj, **kw):
+                mismatches += 1
+                print(f"MISMATCH: {name} ({layout})")
+        for op, stdlib, codec in ops:
+            t_json, t_codec = best_of(stdlib, args.repeat), best_of(codec, args.repeat)
+            totals["json"] += t_json
+            totals["codec"] += t_codec
+            print(f"{name:<36} {len(raw) / 1024:>7.1f} {op:>12} {t_json * 1000:>8.2f} "
+                  f"{t_codec * 1000:>9.2f} {t_json / t_codec:>7.1f}x")
+    print(f"{'total':<36} {'':>7} {'':>12} {totals['json'] * 1000:>8.2f} "
+          f"{totals['codec'] * 1000:>9.2f} {totals['json'] / totals['codec']:>7.1f}x")
+    if mismatches:
+        raise SystemExit(f"{mismatches} output mismatch(es)")
+
+
+if __name__ == "__main__":
+    main()
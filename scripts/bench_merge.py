@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark DataMerger source matching: parallel multisource and legacy assignment.
+
+Builds a corpus scaled up from assets/data/publications_data.json (titles get a
+per-copy suffix so every copy is a distinct paper), with a Scholar-style paper
+list (title + year only) and ADS, OpenAlex and Scholar-detail source lists, then
+times DataMerger._match_sources -- the O(papers x records) step the process
+pool parallelizes -- at each worker count. Every worker count must produce the
+same matches as the serial path.
+
+With --legacy, times the two-source merge_publications pairing (sparse
+candidate pairs + optimal assignment) against the greedy first-best loop it
+replaced, matching ADS records to a Scholar list of title, year and citations,
+and reports matched pairs, total score and how many ADS records differ.
+
+Usage: python scripts/bench_merge.py [--scales 1 4] [--workers 1 2 4 8] [--legacy]
+"""
+import argparse
+import json
+import time
+
+from config import get_data_path
+from merge_data import (
+    LEGACY_MATCH_THRESHOLD,
+    DataMerger,
+    _candidate_pairs,
+    _max_weight_matching,
+)
+
+
+def corpus(pubs, scale):
+    papers = [
+        dict(p, title=f"{p.get('title', '')} [{k}]") for k in range(scale) for p in pubs
+    ]
+
+    def keep(p, fields, **extra):
+        out = {f: p[f] for f in fields if f in p}
+        out.update(extra)
+        return out
+
+    full = ("title", "authors", "year", "journal", "bibcode", "citations", "doi", "arxivId")
+    paper_list = [keep(p, ("title", "year"), source="google_scholar") for p in papers]
+    sources = (
+        [keep(p, ("title", "year", "citations"), source="google_scholar") for p in papers],
+        [keep(p, full, source="ads") for p in papers],
+        [keep(p, full, source="openalex") for p in papers],
+    )
+    return paper_list, sources
+
+
+def greedy_matches(merger, ads_data, scholar_data):
+    """The pre-assignment merge_publications loop: first best unused Scholar record."""
+    matches = {}
+    scholar_used = set()
+    for a, ads_pub in enumerate(ads_data):
+        best_score, best_idx = 0, -1
+        for i, scholar_pub in enumerate(scholar_data):
+            if i in scholar_used:
+                continue
+            score = merger._calculate_similarity(ads_pub, scholar_pub)
+            if score > best_score and score > LEGACY_MATCH_THRESHOLD:
+                best_score, best_idx = score, i
+        if best_idx >= 0:
+            matches[a] = (best_idx, best_score)
+            scholar_used.add(best_idx)
+    return matches
+
+
+def assigned_matches(merger, ads_data, scholar_data):
+    pairs = _candidate_pairs(
+        [merger._match_key(p) for p in ads_data],
+        [merger._match_key(p) for p in scholar_data],
+        LEGACY_MATCH_THRESHOLD,
+    )
+    return _max_weight_matching(pairs)
+
+
+def bench_legacy(merger, pubs, scales):
+    print(f"{'papers':>7} {'method':>9} {'time s':>8} {'matched':>8} {'score':>9} {'differ':>7}")
+    for scale in scales:
+        _, (scholar, ads, _) = corpus(pubs, scale)
+        greedy = None
+        for method, fn in (("greedy", greedy_matches), ("assigned", assigned_matches)):
+            t0 = time.perf_counter()
+            matches = fn(merger, ads, scholar)
+            elapsed = time.perf_counter() - t0
+            greedy = greedy or matches
+            differ = sum(greedy.get(a, (None,))[0] != matches.get(a, (None,))[0] for a in range(len(ads)))
+            total = sum(score for _, score in matches.values())
+            print(f"{len(ads):>7} {method:>9} {elapsed:>8.2f} {len(matches):>8} "
+                  f"{total:>9.2f} {differ:>7}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--scales", type=int, nargs="+", default=[1, 4])
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    ap.add_argument("--legacy", action="store_true",
+                    help="benchmark the two-source assignment against the greedy loop")
+    args = ap.parse_args()
+
+    with open(get_data_path(), encoding="utf-8") as f:
+        pubs = json.load(f).get("publications", [])
+
+    merger = DataMerger()
+    # Always take the parallel path when workers > 1, however small the corpus
+    merger.config = dict(merger.config, merge=dict(merger.config["merge"], parallel_threshold=0))
+
+    if args.legacy:
+        bench_legacy(merger, pubs, args.scales)
+        return
+
+    print(f"{'papers':>7} {'workers':>8} {'time s':>8} {'speedup':>8}")
+    for scale in args.scales:
+        paper_list, sources = corpus(pubs, scale)
+        baseline = None
+        for workers in args.workers:
+            t0 = time.perf_counter()
+            matches = merger._match_sources(paper_list, sources, workers)
+            elapsed = time.perf_counter() - t0
+            if baseline is None:
+                baseline = (matches, elapsed)
+            elif matches != baseline[0]:
+                raise SystemExit(f"MISMATCH at {len(paper_list)} papers, {workers} workers")
+            print(f"{len(paper_list):>7} {workers:>8} {elapsed:>8.2f} "
+                  f"{baseline[1] / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark title normalization over the live titles and abstracts.
+
+Times the per-method normalizer the fetchers and merger used to carry (function-
+local imports, patterns compiled on every call) against text_normalize: the
+scalar normalize_title uncached and cache-warm, and the normalize_titles batch
+API. "title x3" repeats every title once per source (Scholar, ADS, OpenAlex),
+as a pipeline run sees them. The batch result must equal the scalar one; keys
+that differ from the old normalizer (accent folding, LaTeX) are counted and the
+first few shown.
+
+Usage: python scripts/bench_normalize.py [--repeat 50] [--show 5]
+"""
+import argparse
+import time
+
+import json_codec
+from config import get_data_path
+from text_normalize import normalize_title, normalize_titles
+
+
+def legacy_normalize_title(title: str) -> str:
+    """The previous DataMerger/ADSFetcher/OpenAlexFetcher._normalize_title."""
+    import re
+    import html
+
+    prev_title = ""
+    while prev_title != title:
+        prev_title = title
+        title = html.unescape(title)
+    title = re.sub(r"<[^>]+>", "", title)
+    title = re.sub(r"[^\w\s]", "", title.lower())
+    title = re.sub(r"\s+", " ", title).strip()
+    return title
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=50, help="timing repeats (best is reported)")
+    ap.add_argument("--show", type=int, default=5, help="changed keys to print per field")
+    args = ap.parse_args()
+
+    pubs = json_codec.load(get_data_path()).get("publications", [])
+    uncached = normalize_title.__wrapped__
+
+    print(f"{'field':<10} {'n':>5} {'legacy ms':>10} {'scalar ms':>10} {'cached ms':>10} "
+          f"{'batch ms':>9} {'changed':>8}")
+    for field, copies in (("title", 1), ("title x3", 3), ("abstract", 1)):
+        texts = [str(p.get(field.split()[0]) or "") for p in pubs] * copies
+        batch = normalize_titles(texts)
+        if batch != [uncached(t) for t in texts]:
+            raise SystemExit(f"MISMATCH: normalize_titles differs from normalize_title on {field}s")
+        changed = [(t, legacy_normalize_title(t), k) for t, k in zip(texts, batch)
+                   if legacy_normalize_title(t) != k]
+
+        normalize_title.cache_clear()
+        for t in texts:
+            normalize_title(t)
+        times = [
+            best_of(lambda: [legacy_normalize_title(t) for t in texts], args.repeat),
+            best_of(lambda: [uncached(t) for t in texts], args.repeat),
+            best_of(lambda: [normalize_title(t) for t in texts], args.repeat),
+            best_of(lambda: normalize_titles(texts), args.repeat),
+        ]
+        print(f"{field:<10} {len(texts):>5} " + " ".join(f"{t * 1000:>10.2f}" for t in times[:3])
+              + f" {times[3] * 1000:>9.2f} {len(changed):>8}")
+        for _, old, new in changed[: args.show]:
+            at = next((i for i, (a, b) in enumerate(zip(old, new)) if a != b), min(len(old), len(new)))
+            print(f"    {old[max(0, at - 30):at + 30]!r}\n -> {new[max(0, at - 30):at + 30]!r}")
+
+
+if __name__ == "__main__":
+    main()
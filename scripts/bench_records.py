@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark memory and copy cost of Publication records against plain dicts.
+
+Simulates stages 1-5 of the update pipeline on a corpus scaled up from
+assets/data/publications_data.json: the Scholar paper list, ADS, OpenAlex and
+Scholar-detail source lists are all held at once (as the pipeline does), then
+merged paper by paper with DataMerger._merge_multisource. Source records are
+decoded from JSON per source, so, as with real API responses, every source has
+its own copy of each author/journal string.
+
+Peak memory is measured with tracemalloc. Both modes must produce identical JSON.
+
+Usage: python scripts/bench_records.py [--scales 1 10 50] [--repeat 3]
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from config import get_data_path
+from merge_data import DataMerger
+from publication import Publication, to_dicts
+
+
+def source_payloads(pubs, scale):
+    """JSON payloads for each source list, `scale` copies of the corpus."""
+    papers = [
+        dict(p, title=f"{p.get('title', '')} [{k}]") for k in range(scale) for p in pubs
+    ]
+
+    def keep(p, fields, **extra):
+        out = {f: p[f] for f in fields if f in p}
+        out.update(extra)
+        return out
+
+    base = ("title", "year", "scholar_id")
+    full = ("id", "title", "authors", "year", "journal", "bibcode", "citations",
+            "abstract", "keywords", "doi", "arxivId", "adsUrl")
+    return {
+        "paper_list": json.dumps([keep(p, base, source="google_scholar") for p in papers]),
+        "ads": json.dumps([keep(p, full, source="ads") for p in papers]),
+        "openalex": json.dumps([keep(p, full + ("openalexUrl",), source="openalex") for p in papers]),
+        "scholar": json.dumps([keep(p, full, source="google_scholar") for p in papers]),
+    }
+
+
+def run(payloads, use_records):
+    merger = DataMerger()
+    wrap = Publication.from_dict if use_records else (lambda d: d)
+    sources = {name: [wrap(d) for d in json.loads(raw)] for name, raw in payloads.items()}
+    merged = [
+        merger._merge_multisource(base, scholar, ads, openalex)
+        for base, scholar, ads, openalex in zip(
+            sources["paper_list"], sources["scholar"], sources["ads"], sources["openalex"]
+        )
+    ]
+    if not use_records:
+        # The merger now always builds records; the dict baseline keeps dicts
+        merged = to_dicts(merged)
+    return sources, merged
+
+
+def measure(payloads, use_records, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        t0 = time.perf_counter()
+        result = run(payloads, use_records)
+        best = min(best, time.perf_counter() - t0)
+        del result
+    gc.collect()
+    tracemalloc.start()
+    sources, merged = run(payloads, use_records)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    out = json.dumps(to_dicts(merged), sort_keys=True)
+    return best, current, peak, out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--scales", type=int, nargs="+", default=[1, 10, 50])
+    ap.add_argument("--repeat", type=int, default=3, help="timing repeats (best is reported)")
+    args = ap.parse_args()
+
+    with open(get_data_path(), encoding="utf-8") as f:
+        pubs = json.load(f).get("publications", [])
+
+    print(f"{'papers':>7} {'mode':>12} {'time ms':>9} {'live MB':>8} {'peak MB':>8}")
+    for scale in args.scales:
+        payloads = source_payloads(pubs, scale)
+        rows = {}
+        for mode, use_records in (("dict", False), ("Publication", True)):
+            rows[mode] = measure(payloads, use_records, args.repeat)
+            t, cur, peak, _ = rows[mode]
+            print(f"{len(pubs) * scale:>7} {mode:>12} {t * 1000:>9.1f} "
+                  f"{cur / 2**20:>8.2f} {peak / 2**20:>8.2f}")
+        if rows["dict"][3] != rows["Publication"][3]:
+            raise SystemExit(f"MISMATCH at scale {scale}: merged output differs")
+        print(f"{'':>7} {'saving':>12} {'':>9} "
+              f"{1 - rows['Publication'][1] / rows['dict'][1]:>8.0%} "
+              f"{1 - rows['Publication'][2] / rows['dict'][2]:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Build benchmark suite on synthetic content, recorded as JSON.
+
+Generates content.json, publications_data.json and software_data.json at each
+scale (default 1x, 10x and 100x the current size) in a temporary directory:
+every record list (papers, talks, mentees, news items, awards, courses,
+service organizations, repositories) holds `scale` copies of each record,
+the copies retitled so every card is distinct and none featured. Each copied
+paper gets an author list of a length drawn from the real papers' author
+counts (seeded, so every run sees the same data). The metrics follow the
+papers: counts and citations are multiplied by `scale` and
+citationsByPublicationYear is recomputed. The citation and RIQ charts draw one
+point per year, so their times should stay flat across scales.
+
+At each scale it times, best of --repeat:
+
+    pages       build_html.build_page for every page template
+    generators  each content generator build_page calls (page_fills)
+    charts      the publication charts (_roles_svg, _citations_svg, _riq_svg, _mix_svg)
+
+Content models are rebuilt on every run, as in a build
+(content_model.clear_models); the publication store and cube are loaded once
+per scale, as the build loads them once. The software page reads the
+synthetic repositories through pages_software.use_stats_file.
+Results go to --output (default .build_cache/bench/suite-<UTC time>.json)
+with the commit, Python version and CPU count; --baseline prints each time
+against an earlier results file.
+
+Usage: python scripts/bench_suite.py [--scales 1 10 100] [--repeat 3]
+                                     [--output FILE] [--baseline FILE]
+"""
+import argparse
+import copy
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+import build_html
+import content_model
+import json_codec
+import pages_software
+from atomic_write import write_json_if_changed
+from build_html import CONTENT_JSON, HTML_FILES
+from config import get_build_cache_dir, get_data_path, get_project_root
+from publication_cube import PublicationCube, build_cube
+from publication_store import PublicationStore
+
+SUITE_VERSION = 1
+
+# content.json record lists scaled, by kind ("*" = every element of a list)
+CONTENT_LISTS = {
+    "talks": ("sections", "talks", "categories", "*", "talks"),
+    "mentees": ("sections", "mentorship", "menteesByStage", "*"),
+    "formerMentees": ("sections", "mentorship", "menteesByStage", "completed", "*"),
+    "news": ("sections", "news", "items"),
+    "awards": ("sections", "awards", "awards"),
+    "courses": ("sections", "teaching", "courseHistory"),
+    "workshops": ("sections", "teaching", "shortCourses"),
+    "serviceOrgs": ("sections", "service", "categories", "*", "organizations"),
+}
+
+GENERATORS = {
+    "index": ("generate_home_about", "generate_home_research", "generate_home_team", "generate_home_collab"),
+    "publications": ("generate_publications_redesign",),
+    "biography": ("generate_biography",),
+    "mentorship": ("gen_mentorship",),
+    "talks": ("gen_talks",),
+    "teaching": ("gen_teaching",),
+    "awards": ("gen_awards",),
+    "service": ("gen_service",),
+    "software": ("gen_software",),
+    "news": ("gen_news",),
+}
+CHARTS = {
+    "_roles_svg": lambda cube: build_html._roles_svg(cube),
+    "_citations_svg": lambda cube: build_html._citations_svg(cube.metrics),
+    "_riq_svg": lambda cube: build_html._riq_svg(cube.metrics),
+    "_mix_svg": lambda cube: build_html._mix_svg(cube),
+}
+
+
+def _copy(record, k):
+    """Copy k of a record (k >= 1): retitled, never featured."""
+    if not isinstance(record, dict):
+        return record
+    record = copy.deepcopy(record)
+    for field in ("title", "name"):
+        if isinstance(record.get(field), str):
+            record[field] += f" [{k}]"
+            break
+    record.pop("featured", None)
+    return record
+
+
+def _scale_list(records, scale):
+    return list(records) + [_copy(r, k) for k in range(1, scale) for r in records]
+
+
+def _scale_at(value, path, scale, count):
+    """Scale the record list(s) at `path` in `value`, in place; returns how many records there are now."""
+    key, rest = path[0], path[1:]
+    if key == "*":
+        children = list(value.items()) if isinstance(value, dict) else list(enumerate(value))
+    else:
+        children = [(key, value[key])] if isinstance(value, dict) and key in value else []
+    for k, child in children:
+        if rest:
+            count = _scale_at(child, rest, scale, count)
+        elif isinstance(child, list):
+            value[k] = _scale_list(child, scale)
+            count += len(value[k])
+    return count
+
+
+def synthetic_content(scale):
+    content = json_codec.load(CONTENT_JSON)
+    sizes = {kind: _scale_at(content, path, scale, 0) for kind, path in CONTENT_LISTS.items()}
+    return content, sizes
+
+
+def _citations_by_year(pubs):
+    """Citations per publication year, as the pipeline computes them."""
+    by_year = Counter()
+    for pub in pubs:
+        year = pub.get("year")
+        if year and year >= 2000:
+            by_year[str(year)] += pub.get("citations", 0)
+    return dict(by_year)
+
+
+def synthetic_metrics(metrics, scale, pubs):
+    """`metrics` for `scale` times the papers: counts and citations scaled, RIQ kept."""
+    metrics = copy.deepcopy(metrics)
+    metrics["totalPapers"] = len(pubs)
+    metrics["totalCitations"] = metrics.get("totalCitations", 0) * scale
+    metrics["citationsPerYear"] = {y: n * scale for y, n in (metrics.get("citationsPerYear") or {}).items()}
+    metrics["citationsByPublicationYear"] = _citations_by_year(pubs)
+    for series in (metrics.get("riqByCategory") or {}).values():
+        if isinstance(series, dict) and "papers" in series:
+            series["papers"] *= scale
+    return metrics
+
+
+def synthetic_publications(scale, rng):
+    data = json_codec.load(get_data_path())
+    pubs = data["publications"]
+    counts = [len(p.get("authors") or []) for p in pubs if p.get("authors")]
+    pool = sorted({a for p in pubs for a in p.get("authors") or []})
+    owner = Counter(a for p in pubs for a in p.get("authors") or []).most_common(1)[0][0]
+    copies = []
+    for k in range(1, scale):
+        for pub in pubs:
+            pub = _copy(pub, k)
+            authors = rng.sample(pool, min(rng.choice(counts), len(pool)))
+            if owner not in authors:
+                old = pub.get("authors") or []
+                at = old.index(owner) if owner in old else len(authors)
+                authors.insert(min(at, len(authors)), owner)
+            pub["authors"] = authors
+            copies.append(pub)
+    data["publications"] = pubs + copies
+    data["metrics"] = synthetic_metrics(data.get("metrics", {}), scale, data["publications"])
+    data["citationsByPublicationYear"] = data["metrics"]["citationsByPublicationYear"]
+    return data
+
+
+def synthetic_repos(scale):
+    data = json_codec.load(get_data_path("software_data.json"))
+    repos = data.get("repos", {})
+    data["repos"] = dict(repos)
+    data["repos"].update(
+        (f"{name}-{k}", dict(repo, stars=repo.get("stars", 0) // (k + 1)))
+        for k in range(1, scale) for name, repo in repos.items()
+    )
+    return data
+
+
+def snapshot(scale, tmp):
+    """build_html snapshot for synthetic data at `scale` (files written under `tmp`)."""
+    rng = random.Random(scale)
+    content, sizes = synthetic_content(scale)
+    source = Path(tmp) / f"publications_x{scale}.json"
+    source.write_bytes(json_codec.dumps_bytes(synthetic_publications(scale, rng)))
+    repos = Path(tmp) / f"software_x{scale}.json"
+    repos.write_bytes(json_codec.dumps_bytes(synthetic_repos(scale)))
+    store = PublicationStore(source, Path(tmp) / f"store_x{scale}")
+    cube = PublicationCube(build_cube(store.publications, store.metrics, store.source_digest()))
+    sizes.update(papers=len(store.publications), repos=len(json_codec.load(repos)["repos"]))
+    return {"content": content, "store": store, "cube": cube}, sizes, repos
+
+
+def best_ms(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        content_model.clear_models()  # parsed once per build
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return round(best * 1e3, 3)
+
+
+def run_scale(scale, tmp, repeat):
+    snap, sizes, repos = snapshot(scale, tmp)
+    build_html._init_page_worker(snap)
+    build_html._layout()
+    data = snap["content"]
+    templates = {page: path.read_text(encoding="utf-8") for page, path in HTML_FILES.items() if path.exists()}
+    result = {"sizes": sizes, "pages": {}, "generators": {}, "charts": {}}
+    pages_software.use_stats_file(repos)
+    try:
+        for page, html in templates.items():
+            result["pages"][page] = best_ms(lambda: build_html.build_page(page, html, data), repeat)
+            for name in GENERATORS.get(page, ()):
+                fn = getattr(build_html, name)
+                label = name if fn.__module__ == "build_html" else f"{fn.__module__}.{fn.__name__}"
+                result["generators"][label] = best_ms(lambda: fn(data), repeat)
+        for name, chart in CHARTS.items():
+            result["charts"][name] = best_ms(lambda: chart(snap["cube"]), repeat)
+    finally:
+        pages_software.use_stats_file(None)
+        content_model.clear_models()
+    return result
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=get_project_root(),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def report(results, baseline=None):
+    base = (baseline or {}).get("scales", {})
+    for scale, result in results["scales"].items():
+        sizes = ", ".join(f"{kind} {n}" for kind, n in result["sizes"].items())
+        print(f"\n{scale}x: {sizes}")
+        for group in ("pages", "generators", "charts"):
+            for name, ms in result[group].items():
+                line = f"  {group:<11} {name:<36} {ms:>10.3f} ms"
+                old = base.get(scale, {}).get(group, {}).get(name)
+                if old:
+                    line += f"  {ms / old:>6.2f}x baseline"
+                print(line)
+        total = sum(result["pages"].values())
+        print(f"  {'pages':<11} {'total':<36} {total:>10.3f} ms")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    ap.add_argument("--repeat", type=int, default=3, help="timing repeats (best is reported)")
+    ap.add_argument("--output", type=Path, help="results file (default .build_cache/bench/suite-<time>.json)")
+    ap.add_argument("--baseline", type=Path, help="earlier results file to compare against")
+    args = ap.parse_args()
+
+    now = datetime.now(timezone.utc)
+    results = {
+        "version": SUITE_VERSION,
+        "timestamp": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "cpus": os.cpu_count(),
+        "repeat": args.repeat,
+        "scales": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in args.scales:
+            results["scales"][str(scale)] = run_scale(scale, tmp, args.repeat)
+
+    baseline = json_codec.load(args.baseline) if args.baseline else None
+    report(results, baseline)
+    output = args.output or get_build_cache_dir() / "bench" / f"suite-{now.strftime('%Y%m%dT%H%M%SZ')}.json"
+    write_json_if_changed(output, results)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Benchmark filling the page templates: slot map + splice vs regex replacement.
+
+Generates every page's container contents once (build_html.page_fills), then
+times, per page, filling the template with one replace_container_content call
+per container (the previous build), with a fresh slot_map scan + splice, and
+with the slot map from the template cache + splice. Every method must give
+the same bytes.
+
+Usage: python scripts/bench_templates.py [--repeat 200]
+"""
+import argparse
+import time
+
+import json_codec
+from build_html import CONTENT_JSON, HTML_FILES, page_fills
+from html_slots import fill_containers, replace_container_content, slot_map, splice, template_slots
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def regex_fill(html, fills):
+    for selector, content in fills:
+        html = replace_container_content(html, "id", selector, content)
+    return html
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=200, help="timing repeats (best is reported)")
+    args = ap.parse_args()
+
+    data = json_codec.load(CONTENT_JSON)
+    print(f"{'page':<14} {'KB':>6} {'slots':>5} {'regex us':>9} {'scan us':>9} {'cached us':>9} {'speedup':>8}")
+    totals = [0.0, 0.0, 0.0]
+    for page, path in HTML_FILES.items():
+        if not path.exists():
+            continue
+        html = path.read_text(encoding="utf-8")
+        fills = page_fills(page, data)
+        ids = [selector for selector, _ in fills]
+        expected = regex_fill(html, fills)
+        if fill_containers(page, html, fills) != expected:
+            raise SystemExit(f"MISMATCH on {page}")
+        times = [
+            best_of(lambda: regex_fill(html, fills), args.repeat),
+            best_of(lambda: splice(html, slot_map(html, ids), fills), args.repeat),
+            best_of(lambda: splice(html, template_slots(page, html, ids), fills), args.repeat),
+        ]
+        totals = [t + u for t, u in zip(totals, times)]
+        print(f"{page:<14} {len(html) / 1024:>6.0f} {len(fills):>5} "
+              + " ".join(f"{t * 1e6:>9.0f}" for t in times) + f" {times[0] / times[2]:>7.1f}x")
+    print(f"{'total':<26} " + " ".join(f"{t * 1e6:>9.0f}" for t in totals)
+          + f" {totals[0] / totals[2]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
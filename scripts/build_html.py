@@ -6,19 +6,26 @@ Reads content.json and pre-renders all page content into static HTML for SEO and
 performance. JS only adds interactivity (theme toggle, hero canvas, listview); it
 does not populate content. Idempotent.
 
-Usage: python scripts/build_html.py
+Pages whose inputs are unchanged since the last build are skipped (see
+build_manifest); --force rebuilds every page. With --workers N (default from
+CONFIG["build"]["workers"]) the pages are rendered on a process pool; they are
+still written one by one, in HTML_FILES order.
+
+Usage: python scripts/build_html.py [--force] [--workers N]
 """
 
-import json
+import argparse
 import math
+import multiprocessing
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Project root is one level up from scripts/
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 CONTENT_JSON = PROJECT_ROOT / "assets" / "data" / "content.json"
-PUBLICATIONS_JSON = PROJECT_ROOT / "assets" / "data" / "publications_data.json"
 
 # Redesign per-page content generators (scripts/ on path so they import cleanly)
 sys.path.insert(0, str(Path(__file__).resolve().parent))
@@ -29,6 +36,25 @@ from pages_awards import generate_content as gen_awards
 from pages_service import generate_content as gen_service
 from pages_software import generate_content as gen_software
 from pages_news import generate_content as gen_news
+import json_codec
+from atomic_write import write_if_changed
+from build_manifest import (
+    BuildManifest,
+    ContentRecorder,
+    code_digest,
+    current_digest,
+    sha256,
+    track_content,
+    track_file,
+    tracking,
+)
+from authors import author_strings
+from config import CONFIG
+from html_slots import fill_containers
+from layout import MAIN_ID, Layout
+from pages_shared import HtmlWriter, esc, esc_text, url_attr
+from publication_cube import load_cube
+from publication_store import PublicationStore
 
 # HTML files to process
 HTML_FILES = {
@@ -43,98 +69,8 @@ HTML_FILES = {
     "news": PROJECT_ROOT / "news.html",
     "biography": PROJECT_ROOT / "biography.html",
 }
-
-# GitHub SVG icon used in quick links
-def _find_closing_tag(html, tag_name, start_after):
-    """Find the matching closing tag for an element, handling nesting.
-
-    start_after: index in html right after the opening tag's '>'
-    Returns the index of the start of the matching </tag> or -1.
-    """
-    depth = 1
-    pos = start_after
-    open_pattern = re.compile(r"<" + re.escape(tag_name) + r"[\s>/]", re.IGNORECASE)
-    close_pattern = re.compile(r"</" + re.escape(tag_name) + r"\s*>", re.IGNORECASE)
-
-    while depth > 0 and pos < len(html):
-        # Find the next opening or closing tag of same type
-        open_match = open_pattern.search(html, pos)
-        close_match = close_pattern.search(html, pos)
-
-        if close_match is None:
-            return -1  # Malformed HTML
-
-        if open_match is not None and open_match.start() < close_match.start():
-            # Check it's not a self-closing tag like <br/> or void element
-            # Find the end of this opening tag
-            tag_end = html.find(">", open_match.start())
-            if tag_end != -1 and html[tag_end - 1] == "/":
-                # Self-closing, skip it
-                pos = tag_end + 1
-            else:
-                depth += 1
-                pos = tag_end + 1 if tag_end != -1 else open_match.end()
-        else:
-            depth -= 1
-            if depth == 0:
-                return close_match.start()
-            pos = close_match.end()
-
-    return -1
-
-
-def replace_container_content(html, selector_type, selector, new_content):
-    """Replace content inside a container element.
-
-    selector_type: 'id' or 'class'
-    selector: the id value or class name to match
-    new_content: HTML string to place inside the container
-
-    Returns the modified HTML string.
-    """
-    if selector_type == "id":
-        pattern = re.compile(
-            r"<(\w+)\b[^>]*\bid\s*=\s*[\"']" + re.escape(selector) + r"[\"'][^>]*>",
-            re.DOTALL,
-        )
-    elif selector_type == "class":
-        pattern = re.compile(
-            r"<(\w+)\b[^>]*\bclass\s*=\s*[\"'][^\"']*\b"
-            + re.escape(selector)
-            + r"\b[^\"']*[\"'][^>]*>",
-            re.DOTALL,
-        )
-    else:
-        return html
-
-    match = pattern.search(html)
-    if not match:
-        return html
-
-    tag_name = match.group(1)
-    content_start = match.end()  # Right after the opening tag's '>'
-    closing_start = _find_closing_tag(html, tag_name, content_start)
-
-    if closing_start == -1:
-        return html
-
-    replacement = "\n" + new_content + "\n"
-    return html[:content_start] + replacement + html[closing_start:]
-
-
-def _esc(s):
-    """Escape bare & in plain-text fields without double-encoding existing entities."""
-    return re.sub(r"&(?!(?:amp|lt|gt|quot|#\d+);)", "&amp;", str(s or ""))
-
-
-def _esc_text(s):
-    """Full plain-text escape (&, <, >) for fields that must never carry markup."""
-    return _esc(s).replace("<", "&lt;").replace(">", "&gt;")
-
-
-def _url_attr(s):
-    """Escape a URL for a double-quoted href/src attribute (&, ", <, >; no lowercasing)."""
-    return _esc(s).replace('"', "&quot;").replace("<", "&lt;").replace(">", "&gt;")
+# Hand-written; only its footer is built (see layout.Layout.refooter)
+NOT_FOUND_HTML = PROJECT_ROOT / "404.html"
 
 
 def generate_page_header(page):
@@ -142,8 +78,8 @@ def generate_page_header(page):
     kicker + title are plain text (escaped); tagline is emitted as-is so it may carry
     inline markup (e.g. <strong>)."""
     return (
-        f'<p class="section-kicker">{_esc_text(page.get("kicker", ""))}</p>\n'
-        f'        <h1 class="pub-h1">{_esc_text(page.get("title", ""))}</h1>\n'
+        f'<p class="section-kicker">{esc_text(page.get("kicker", ""))}</p>\n'
+        f'        <h1 class="pub-h1">{esc_text(page.get("title", ""))}</h1>\n'
         f'        <p class="pub-sub">{page.get("tagline", "")}</p>'
     )
 
@@ -163,24 +99,24 @@ def _webp(src):
 
 def _dog_photos(bio):
     """Render the personal dog photos (used in the About section)."""
-    photos = ""
+    photos = HtmlWriter()
     for ph in bio.get("dogPhotos", []):
         if not ph.get("src"):
             continue
         if ph.get("creditLink"):
-            credit = f' <a href="{ph["creditLink"]}" target="_blank" rel="noopener">{_esc(ph.get("creditName", ""))}</a>'
+            credit = f' <a href="{ph["creditLink"]}" target="_blank" rel="noopener">{esc(ph.get("creditName", ""))}</a>'
         elif ph.get("creditName"):
-            credit = f' {_esc(ph["creditName"])}'
+            credit = f' {esc(ph["creditName"])}'
         else:
             credit = ""
-        photos += (
+        photos.write(
             '<figure class="dog-photo"><picture>'
             f'<source srcset="{_webp(ph["src"])}" type="image/webp">'
-            f'<img src="{ph["src"]}" alt="{_esc(ph.get("alt", ""))}" loading="lazy" width="800" height="533">'
+            f'<img src="{ph["src"]}" alt="{esc(ph.get("alt", ""))}" loading="lazy" width="800" height="533">'
             '</picture>'
-            f'<figcaption>{_esc(ph.get("caption", ""))}{credit}</figcaption></figure>'
+            f'<figcaption>{esc(ph.get("caption", ""))}{credit}</figcaption></figure>'
         )
-    return f'<div class="dog-photos">{photos}</div>' if photos else ""
+    return f'<div class="dog-photos">{photos.getvalue()}</div>' if photos else ""
 
 
 def generate_home_about(data):
@@ -196,7 +132,7 @@ def generate_home_about(data):
             '<figure class="profile-figure">'
             '<picture>'
             f'<source srcset="{_webp(pi["src"])}" type="image/webp">'
-            f'<img class="profile-image" src="{pi["src"]}" alt="{_esc(pi.get("alt", ""))}" '
+            f'<img class="profile-image" src="{pi["src"]}" alt="{esc(pi.get("alt", ""))}" '
             'width="384" height="513" loading="lazy">'
             '</picture></figure>'
         )
@@ -204,24 +140,24 @@ def generate_home_about(data):
     if hb.get("content"):
         highlight = (
             '<aside class="callout">'
-            f'<h3>{_esc(hb.get("title", ""))}</h3>'
+            f'<h3>{esc(hb.get("title", ""))}</h3>'
             f'<p>{hb.get("content", "")}</p></aside>'
         )
     contact = ""
     if ci.get("email"):
         contact = (
             '<div class="contact-info">'
-            f'<h3>{_esc(ci.get("title", "Contact"))}</h3>'
+            f'<h3>{esc(ci.get("title", "Contact"))}</h3>'
             f'<p><strong>Email:</strong> <a href="mailto:{ci["email"]}">{ci["email"]}</a></p>'
-            f'<p><strong>Office:</strong> {_esc(ci.get("office", ""))}</p></div>'
+            f'<p><strong>Office:</strong> {esc(ci.get("office", ""))}</p></div>'
         )
     note = bio.get("personalNote", "")
-    personal = f'<p class="about-personal">{_esc(note)}</p>' if note else ""
+    personal = f'<p class="about-personal">{esc(note)}</p>' if note else ""
     dogs = _dog_photos(bio)
     return (
         '<div class="container">\n'
         '<p class="section-kicker">Who I am</p>\n'
-        f'<h2 class="section-title">{_esc(about.get("title", "About"))}</h2>\n'
+        f'<h2 class="section-title">{esc(about.get("title", "About"))}</h2>\n'
         '<div class="intro-grid">\n'
         '<div class="intro-body">'
         f'<p class="about">{about.get("content", "")}</p>'
@@ -238,7 +174,7 @@ def generate_home_about(data):
 def _pub_metrics():
     """Pipeline-computed publication metrics (totalPapers/totalCitations/hIndex/i10Index)."""
     try:
-        return json.loads(PUBLICATIONS_JSON.read_text(encoding="utf-8")).get("metrics", {}) or {}
+        return _publications()[1].metrics
     except (OSError, ValueError):
         return {}
 
@@ -251,15 +187,15 @@ def generate_home_research(data):
         icon, cls = _HOME_ICONS[i] if i < len(_HOME_ICONS) else _HOME_ICONS[-1]
         cards.append(
             f'<article class="research-card {cls}">{icon}'
-            f'<h3>{_esc(area.get("title", ""))}</h3>'
-            f'<p>{_esc(area.get("description", ""))}</p></article>'
+            f'<h3>{esc(area.get("title", ""))}</h3>'
+            f'<p>{esc(area.get("description", ""))}</p></article>'
         )
     intro = ("I develop statistical &amp; machine-learning methods and apply them to the largest "
              "astronomical surveys — from billions of stars and galaxies down to individual objects.")
     additional = research.get("additionalContent", "")
     pubs = research.get("publications", {})
     publinks = " · ".join(
-        f'<a href="{l.get("url", "#")}" target="_blank" rel="noopener">{_esc(l.get("name", ""))}</a>'
+        f'<a href="{l.get("url", "#")}" target="_blank" rel="noopener">{esc(l.get("name", ""))}</a>'
         for l in pubs.get("links", [])
     )
     # Auto-computed metric cards (from the pipeline-maintained publication metrics)
@@ -268,7 +204,7 @@ def generate_home_research(data):
                    (m.get("totalCitations"), "Citations"),
                    (m.get("hIndex"), "h-index")]
     metrics_html = "".join(
-        f'<div class="pub-metric"><span class="n">{v:,}</span><span class="l">{_esc(l)}</span></div>'
+        f'<div class="pub-metric"><span class="n">{v:,}</span><span class="l">{esc(l)}</span></div>'
         for v, l in metric_defs if v
     )
     metrics_box = f'<div class="pub-metrics">{metrics_html}</div>' if metrics_html else ""
@@ -277,13 +213,13 @@ def generate_home_research(data):
     if publinks:
         pubbox = (
             '<aside class="callout pub-callout">'
-            f'<h3>{_esc(pubs.get("title", "Publications"))}</h3>'
+            f'<h3>{esc(pubs.get("title", "Publications"))}</h3>'
             f'{metrics_box}'
-            f'<p>{_esc(pubs.get("intro", ""))} {publinks}</p>'
+            f'<p>{esc(pubs.get("intro", ""))} {publinks}</p>'
             '<p class="callout-cta"><a href="publications.html">Browse all publications, metrics &amp; figures →</a></p>'
             '</aside>'
         )
-    context = f'<p class="research-context">{_esc(additional)}</p>' if additional else ""
+    context = f'<p class="research-context">{esc(additional)}</p>' if additional else ""
     return (
         '<div class="container">\n'
         '<p class="section-kicker">What I do</p>\n'
@@ -301,6 +237,7 @@ def _inline_logo(logo):
     src = (logo or {}).get("src", "")
     if not src.endswith(".svg"):
         return ""
+    track_file(PROJECT_ROOT / src)
     try:
         svg = (PROJECT_ROOT / src).read_text(encoding="utf-8")
     except OSError:
@@ -314,11 +251,11 @@ def _inline_logo(logo):
 def generate_home_team(data):
     team = data["sections"]["team"]
     logo = _inline_logo(team.get("logo"))
-    logo_html = f'<figure class="art-logo" aria-label="{_esc(team.get("logo", {}).get("alt", ""))}">{logo}</figure>' if logo else ""
+    logo_html = f'<figure class="art-logo" aria-label="{esc(team.get("logo", {}).get("alt", ""))}">{logo}</figure>' if logo else ""
     hls = "".join(
         '<div class="art-highlight">'
         f'<span class="art-hl-icon" aria-hidden="true">{h.get("icon", "")}</span>'
-        f'<div><h3>{_esc(h.get("title", ""))}</h3><p>{_esc(h.get("content", ""))}</p></div></div>'
+        f'<div><h3>{esc(h.get("title", ""))}</h3><p>{esc(h.get("content", ""))}</p></div></div>'
         for h in team.get("highlights", [])
     )
     btns = []
@@ -328,7 +265,7 @@ def generate_home_team(data):
         ext = url.startswith("http")
         attrs = ' target="_blank" rel="noopener"' if ext else ""
         arrow = ' <span aria-hidden="true">↗</span>' if ext else ""
-        btns.append(f'<a class="btn {cls}" href="{url}"{attrs}>{_esc(c.get("text", ""))}{arrow}</a>')
+        btns.append(f'<a class="btn {cls}" href="{url}"{attrs}>{esc(c.get("text", ""))}{arrow}</a>')
     return (
         '<div class="container">\n'
         '<div class="art-panel">\n'
@@ -336,8 +273,8 @@ def generate_home_team(data):
         '<div class="art-body">\n'
         '<p class="art-eyebrow"><span class="art-badge">✦ Research Group</span>'
         '<a class="art-ext" href="https://astrostatuoft.com/" target="_blank" rel="noopener">astrostatuoft.com <span aria-hidden="true">↗</span></a></p>\n'
-        f'<h2 class="section-title">{_esc(team.get("title", ""))}</h2>\n'
-        f'<p class="team-tagline">{_esc(team.get("tagline", ""))}</p>\n'
+        f'<h2 class="section-title">{esc(team.get("title", ""))}</h2>\n'
+        f'<p class="team-tagline">{esc(team.get("tagline", ""))}</p>\n'
         f'<p class="lead">{team.get("content", "")}</p>\n'
         f'<div class="art-highlights">{hls}</div>\n'
         f'<div class="cta">{"".join(btns)}</div>\n'
@@ -348,57 +285,57 @@ def generate_home_team(data):
 
 
 def _opp_link(l):
-    name = _esc(l.get("name", ""))
+    name = esc(l.get("name", ""))
     out = f'<a href="{l["url"]}" target="_blank" rel="noopener">{name}</a>' if l.get("url") else name
     if l.get("abbr"):
-        out += f' ({_esc(l["abbr"])})'
+        out += f' ({esc(l["abbr"])})'
     elif l.get("note"):
-        out += f' <span class="opp-note">({_esc(l["note"])})</span>'
+        out += f' <span class="opp-note">({esc(l["note"])})</span>'
     return out
 
 
 def _opp_links_html(card):
     """Render whatever link groups a card has: fellowships, programs, or opportunities."""
-    out = ""
+    out = HtmlWriter()
     for key, default in (("fellowships", "Fellowships:"), ("programs", "Programs:")):
         grp = card.get(key)
         if grp and grp.get("links"):
             links = ", ".join(_opp_link(l) for l in grp["links"])
-            out += f'<p class="opp-links"><strong>{_esc(grp.get("intro", default))}</strong> {links}</p>'
+            out.write(f'<p class="opp-links"><strong>{esc(grp.get("intro", default))}</strong> {links}</p>')
     opps = card.get("opportunities")
     if isinstance(opps, list) and opps:
         links = ", ".join(_opp_link(o) for o in opps)
-        out += f'<p class="opp-links"><strong>Programs:</strong> {links}</p>'
-    return out
+        out.write(f'<p class="opp-links"><strong>Programs:</strong> {links}</p>')
+    return out.getvalue()
 
 
 def generate_home_collab(data):
     collab = data["sections"]["collaboration"]
     vals = collab.get("values", {})
     val_items = "".join(
-        f'<div class="value-item"><h4>{_esc(v.get("title", ""))}</h4>'
-        f'<p>{_esc(v.get("content", ""))}</p></div>'
+        f'<div class="value-item"><h4>{esc(v.get("title", ""))}</h4>'
+        f'<p>{esc(v.get("content", ""))}</p></div>'
         for v in vals.get("items", [])
     )
     values_html = ""
     if val_items:
         values_html = (
             '<aside class="callout values-callout">'
-            f'<h3>{_esc(vals.get("title", "Our Values"))}</h3>'
+            f'<h3>{esc(vals.get("title", "Our Values"))}</h3>'
             f'<div class="values-grid">{val_items}</div></aside>'
         )
     opp = collab.get("opportunities", {})
     cards = "".join(
-        f'<div class="card opp-card"><h3>{_esc(c.get("title", ""))}</h3>'
-        f'<p>{_esc(c.get("content", ""))}</p>{_opp_links_html(c)}</div>'
+        f'<div class="card opp-card"><h3>{esc(c.get("title", ""))}</h3>'
+        f'<p>{esc(c.get("content", ""))}</p>{_opp_links_html(c)}</div>'
         for c in opp.get("cards", [])
     )
-    opp_heading = f'<h3 class="opp-heading">{_esc(opp.get("title", "Opportunities"))}</h3>' if cards else ""
+    opp_heading = f'<h3 class="opp-heading">{esc(opp.get("title", "Opportunities"))}</h3>' if cards else ""
     return (
         '<div class="container">\n'
         '<p class="section-kicker">Join us</p>\n'
-        f'<h2 class="section-title">{_esc(collab.get("title", ""))}</h2>\n'
-        f'<p class="section-intro">{_esc(collab.get("intro", ""))}</p>\n'
+        f'<h2 class="section-title">{esc(collab.get("title", ""))}</h2>\n'
+        f'<p class="section-intro">{esc(collab.get("intro", ""))}</p>\n'
         f'{values_html}\n'
         f'{opp_heading}\n'
         f'<div class="grid-3 opp-grid">{cards}</div>\n'
@@ -415,11 +352,11 @@ def generate_biography(data):
     bio = data["sections"]["biography"]
     items = "".join(
         f'<div class="tl-item{" current" if t.get("current") else ""}">'
-        f'<div class="tl-date">{_esc(t.get("date", ""))}</div>'
-        f'<div class="tl-title">{_esc(t.get("title", ""))}'
+        f'<div class="tl-date">{esc(t.get("date", ""))}</div>'
+        f'<div class="tl-title">{esc(t.get("title", ""))}'
         + ('<span class="tl-now">Now</span>' if t.get("current") else "")
         + '</div>'
-        f'<div class="tl-loc">{_esc(t.get("location", ""))}</div>'
+        f'<div class="tl-loc">{esc(t.get("location", ""))}</div>'
         f'<div class="tl-content">{t.get("content", "")}</div>'
         "</div>"
         for t in bio.get("timeline", [])
@@ -456,55 +393,12 @@ def _attr_esc(s):
     return s
 
 
-def _format_author(author):
-    """Convert an author string to 'F. Last' initials form.
-
-    Handles 'Last, First M.' and 'First M. Last' formats. Returns (display, is_speagle).
-    """
-    is_speagle = "speagle" in author.lower()
-    if "," in author:
-        last, _, first = author.partition(",")
-        last = last.strip()
-        first = first.strip()
-    else:
-        parts = author.strip().split()
-        if len(parts) >= 2:
-            last = parts[-1]
-            first = " ".join(parts[:-1])
-        else:
-            last = author.strip()
-            first = ""
-    initial = ""
-    fp = first.strip()
-    if fp:
-        # Use the first alphabetic character of the first name as the initial
-        for ch in fp:
-            if ch.isalpha():
-                initial = ch.upper() + ". "
-                break
-    display = _esc(f"{initial}{last}".strip())
-    if is_speagle:
-        display = f"<strong>{display}</strong>"
-    return display
-
-
-def _format_authors_html(authors):
-    """Show first 3 authors as 'F. Last', append ' et al.' if more than 3."""
-    if not authors:
-        return ""
-    shown = [_format_author(a) for a in authors[:3]]
-    html = ", ".join(shown)
-    if len(authors) > 3:
-        html += " et al."
-    return html
-
-
 def _truncate(s, n=320):
     """Escape + truncate prose at a word boundary for the featured-card abstract."""
     s = " ".join(str(s or "").split())
     if len(s) <= n:
-        return _esc(s)
-    return _esc(s[:n].rsplit(" ", 1)[0]) + "…"
+        return esc(s)
+    return esc(s[:n].rsplit(" ", 1)[0]) + "…"
 
 
 def _generate_paper_card(pub, board=False):
@@ -512,7 +406,7 @@ def _generate_paper_card(pub, board=False):
     title = pub.get("title", "")
     year = pub.get("year", "")
     journal = pub.get("journal", "")
-    authors = pub.get("authors", []) or []
+    authors_html, authors_text = author_strings(pub)
     cites_int = int(pub.get("citations", 0) or 0)
     cites_comma = f"{cites_int:,}"
 
@@ -525,34 +419,13 @@ def _generate_paper_card(pub, board=False):
     is_featured = bool(pub.get("featured"))
 
     # Class list and authorship accent
-    cls = f"paper {catkey}"
+    cls = ["paper", catkey]
     if board:
-        cls += " feat-card"
-    if is_student:
-        cls += " student"
-    elif is_postdoc:
-        cls += " postdoc"
-
-    tags = ""
-    if is_featured:
-        tags += '<span class="tag feat">★ Featured</span>'
+        cls.append("feat-card")
     if is_student:
-        tags += '<span class="tag stu">Student-led</span>'
+        cls.append("student")
     elif is_postdoc:
-        tags += '<span class="tag pd">Postdoc-led</span>'
-
-    # Category badges for any category >= 0.20
-    probs = pub.get("categoryProbabilities", {}) or {}
-    badges = ""
-    for cat in _PUB_CAT_ORDER:
-        prob = probs.get(cat, 0)
-        try:
-            prob = float(prob)
-        except (TypeError, ValueError):
-            prob = 0
-        if prob >= 0.20:
-            key, label = _PUB_CAT_MAP[cat]
-            badges += f'<span class="badge b-{key}">{label}</span>'
+        cls.append("postdoc")
 
     # Resource links: ADS · arXiv · DOI (whichever exist)
     ads = pub.get("adsUrl")
@@ -560,43 +433,59 @@ def _generate_paper_card(pub, board=False):
     doi = pub.get("doi")
     arxiv_url = f"https://arxiv.org/abs/{arxiv}" if arxiv else ""
     doi_url = f"https://doi.org/{doi}" if doi else ""
-    links = ""
-    if ads:
-        links += f'<a class="reslink" href="{ads}" target="_blank" rel="noopener">ADS</a>'
-    if arxiv_url:
-        links += f'<a class="reslink" href="{arxiv_url}" target="_blank" rel="noopener">arXiv</a>'
-    if doi_url:
-        links += f'<a class="reslink" href="{doi_url}" target="_blank" rel="noopener">DOI</a>'
 
     # Title links to the best available target (arXiv -> ADS -> DOI)
     title_href = arxiv_url or ads or doi_url
-    title_inner = _esc(title)
+    title_inner = esc(title)
     title_html = (
         f'<a href="{title_href}" target="_blank" rel="noopener">{title_inner}</a>'
         if title_href else title_inner
     )
 
-    authors_html = _format_authors_html(authors)
     cite_str = f"{cites_comma} citation{'s' if cites_int != 1 else ''}" if cites_int else ""
     meta = " · ".join(
-        part for part in [authors_html, _esc(journal), str(year), cite_str] if part
+        part for part in [authors_html, esc(journal), str(year), cite_str] if part
     )
 
-    abstract_html = ""
-    if board and pub.get("abstract"):
-        abstract_html = f'<p class="paper-abstract">{_truncate(pub["abstract"], 340)}</p>'
-
-    return (
-        f'<article class="{cls}" data-cat="{catkey}" data-year="{year}" '
+    out = HtmlWriter().write(
+        f'<article class="{" ".join(cls)}" data-cat="{catkey}" data-year="{year}" '
         f'data-cites="{cites_int}" data-title="{_attr_esc(title)}" '
-        f'data-authors="{_attr_esc(" ".join(authors))}">'
+        f'data-authors="{_attr_esc(authors_text)}">'
         f'<h3 class="paper-title">{title_html}</h3>'
         f'<div class="paper-meta">{meta}</div>'
-        f'<div class="paper-badges">{tags}{badges}'
-        f'<span class="paper-links">{links}</span></div>'
-        f'{abstract_html}'
-        f'</article>'
+        '<div class="paper-badges">'
     )
+    if is_featured:
+        out.write('<span class="tag feat">★ Featured</span>')
+    if is_student:
+        out.write('<span class="tag stu">Student-led</span>')
+    elif is_postdoc:
+        out.write('<span class="tag pd">Postdoc-led</span>')
+
+    # Category badges for any category >= 0.20
+    probs = pub.get("categoryProbabilities", {}) or {}
+    for cat in _PUB_CAT_ORDER:
+        prob = probs.get(cat, 0)
+        try:
+            prob = float(prob)
+        except (TypeError, ValueError):
+            prob = 0
+        if prob >= 0.20:
+            key, label = _PUB_CAT_MAP[cat]
+            out.write(f'<span class="badge b-{key}">{label}</span>')
+
+    out.write('<span class="paper-links">')
+    if ads:
+        out.write(f'<a class="reslink" href="{ads}" target="_blank" rel="noopener">ADS</a>')
+    if arxiv_url:
+        out.write(f'<a class="reslink" href="{arxiv_url}" target="_blank" rel="noopener">arXiv</a>')
+    if doi_url:
+        out.write(f'<a class="reslink" href="{doi_url}" target="_blank" rel="noopener">DOI</a>')
+    out.write("</span></div>")
+
+    if board and pub.get("abstract"):
+        out.write(f'<p class="paper-abstract">{_truncate(pub["abstract"], 340)}</p>')
+    return out.write("</article>").getvalue()
 
 
 _ROLE_META = [
@@ -616,7 +505,7 @@ def _nice_ticks(maxv, target=4):
     return list(range(0, int(maxv) + step, step))
 
 
-def _roles_svg(pubs):
+def _roles_svg(cube):
     """Hand-rolled, theme-aware, accessible inline SVG: publications/year by role.
 
     Each segment carries data-tip (styled JS tooltip on hover); each year has a
@@ -625,10 +514,8 @@ def _roles_svg(pubs):
     """
     from collections import defaultdict, Counter
     by_year = defaultdict(Counter)
-    for p in pubs:
-        y = p.get("year")
-        if y:
-            by_year[int(y)][p.get("authorshipCategory") or "other"] += 1
+    for (y, role), n in cube.marginal("papers", "year", "role", dated=True).items():
+        by_year[y][role] = n
     if not by_year:
         return ""
     years = list(range(min(by_year), max(by_year) + 1))
@@ -636,7 +523,7 @@ def _roles_svg(pubs):
     ticks = _nice_ticks(maxstack)
     scale = max(maxstack, ticks[-1])
 
-    esc_attr = lambda x: _esc(x).replace('"', "&quot;")
+    esc_attr = lambda x: esc(x).replace('"', "&quot;")
     W, H, ml, mr, mt, mb = 820, 300, 46, 14, 40, 30
     pw, ph, n = W - ml - mr, H - mt - mb, len(years)
     bw = pw / n * 0.64
@@ -691,7 +578,7 @@ def _citations_svg(metrics):
     pw, ph, n = W - ml - mr, H - mt - mb, len(years)
     xc = lambda i: ml + (i * pw / (n - 1) if n > 1 else pw / 2)
     yv = lambda v: mt + ph - (math.sqrt(max(v, 0)) / smax) * ph
-    esc_attr = lambda x: _esc(x).replace('"', "&quot;")
+    esc_attr = lambda x: esc(x).replace('"', "&quot;")
     s = [f'<svg class="pf-svg" viewBox="0 0 {W} {H}" role="group" aria-label="Citations received per year" preserveAspectRatio="xMinYMin meet">']
     for t in ticks:
         s.append(f'<line class="pf-grid" x1="{ml}" y1="{yv(t):.1f}" x2="{W - mr}" y2="{yv(t):.1f}"/>')
@@ -742,7 +629,7 @@ def _riq_svg(metrics):
     y0, y1 = years[0], years[-1]
     xc = lambda yr: ml + ((yr - y0) / (y1 - y0) * pw if y1 > y0 else pw / 2)
     yv = lambda v: mt + ph - (v / smax) * ph
-    esc_attr = lambda x: _esc(x).replace('"', "&quot;")
+    esc_attr = lambda x: esc(x).replace('"', "&quot;")
     s = [f'<svg class="pf-svg" viewBox="0 0 {W} {H}" role="group" aria-label="Research Impact Quotient over time by authorship role" preserveAspectRatio="xMinYMin meet">']
     s.append(f'<rect class="pf-band-typ" x="{ml}" y="{yv(150):.1f}" width="{pw:.1f}" height="{yv(60) - yv(150):.1f}"/>')
     s.append(f'<line class="pf-mean" x1="{ml}" y1="{yv(100):.1f}" x2="{W - mr}" y2="{yv(100):.1f}"/>')
@@ -781,27 +668,19 @@ def _riq_svg(metrics):
     return "".join(s)
 
 
-def _mix_svg(pubs):
+def _mix_svg(cube):
     """Inline SVG: a full-width 100% horizontal bar of research mix (by area)."""
-    from collections import defaultdict
     # (full name, key, short legend label)
     areas = [("Statistical Learning & AI", "sla", "Statistical Learning"),
              ("Interpretability & Insight", "ii", "Interpretability"),
              ("Inference & Computation", "ic", "Inference"),
              ("Discovery & Understanding", "du", "Discovery")]
-    agg = defaultdict(float)
-    for p in pubs:
-        cp = p.get("categoryProbabilities") or {}
-        tot = sum(float(cp.get(name, 0)) for name, _, _ in areas)
-        if tot <= 0:
-            continue
-        for name, _, _ in areas:
-            agg[name] += float(cp.get(name, 0)) / tot
+    agg = cube.area_mass(dated=True)
     grand = sum(agg.values())
     if grand <= 0:
         return ""
     fr = sorted(((key, name, short, agg[name] / grand) for name, key, short in areas), key=lambda r: -r[3])
-    esc_attr = lambda x: _esc(x).replace('"', "&quot;")
+    esc_attr = lambda x: esc(x).replace('"', "&quot;")
     W, H, bx0, bx1, by, bh = 820, 62, 2, 818, 6, 30
     bw = bx1 - bx0
     s = [f'<svg class="pf-svg pf-mix" viewBox="0 0 {W} {H}" role="group" aria-label="Research mix: share of work by area" preserveAspectRatio="xMinYMin meet">']
@@ -816,7 +695,7 @@ def _mix_svg(pubs):
     for key, name, short, frac in fr:
         label = f"{short} {round(frac * 100)}%"
         s.append(f'<circle class="mix-dot mix-{key}" cx="{lx + 4:.0f}" cy="{ly - 4:.0f}" r="4"/>')
-        s.append(f'<text class="pf-legend" x="{lx + 13:.0f}" y="{ly:.0f}">{_esc(label)}</text>')
+        s.append(f'<text class="pf-legend" x="{lx + 13:.0f}" y="{ly:.0f}">{esc(label)}</text>')
         lx += 13 + len(label) * 6.3 + 20
     s.append("</svg>")
     return "".join(s)
@@ -825,40 +704,30 @@ def _mix_svg(pubs):
 def generate_publications_redesign(data):
     """Generate the inner HTML for #publications-content (redesign).
 
-    Reads publications_data.json directly and emits the dashboard, controls,
-    filter chips, and all paper cards pre-sorted newest-first then most-cited.
+    Counts, charts and the card order come from the publication cube; the cards
+    themselves from the hot index (abstracts are fetched from the cold shards for
+    featured cards only). Cards are pre-sorted newest-first then most-cited.
     """
-    pub_data = json.loads(PUBLICATIONS_JSON.read_text(encoding="utf-8"))
-    metrics = pub_data.get("metrics", {})
-    pubs = pub_data.get("publications", [])
+    store, cube = _publications()
+    metrics = cube.metrics
 
-    total_papers = metrics.get("totalPapers", len(pubs))
+    total_papers = metrics.get("totalPapers", cube.total("papers"))
     total_citations = metrics.get("totalCitations", 0)
     h_index = metrics.get("hIndex", 0)
     i10_index = metrics.get("i10Index", 0)
 
     # Per-category counts (by argmax researchArea)
     cat_counts = {"sla": 0, "ii": 0, "ic": 0, "du": 0}
-    papers_with_year = []
-    for p in pubs:
-        if not p.get("year"):
-            continue
-        papers_with_year.append(p)
-        key = _PUB_CAT_MAP.get(p.get("researchArea", ""), ("du", ""))[0]
-        cat_counts[key] += 1
-
-    all_count = len(papers_with_year)
+    for area, n in cube.marginal("papers", "category", dated=True).items():
+        cat_counts[_PUB_CAT_MAP.get(area, ("du", ""))[0]] += n
 
-    # Pre-sort: newest year first, then most cited
-    papers_with_year.sort(
-        key=lambda p: (-int(p.get("year", 0) or 0), -int(p.get("citations", 0) or 0))
-    )
+    all_count = cube.total("papers", dated=True)
 
-    cards = "".join(_generate_paper_card(p) for p in papers_with_year)
+    by_key = {p["key"]: p for p in store.publications}
+    cards = "".join(_generate_paper_card(by_key[k]) for k in cube.order)
 
     # Top summary: authorship-role buttons linking to the curated ADS libraries
-    from collections import Counter
-    role_counts = Counter(p.get("authorshipCategory") for p in pubs)
+    role_counts = cube.marginal("papers", "role")
     _ADS_LIB = "https://ui.adsabs.harvard.edu/user/libraries/"
     role_buttons = [
         ("Total papers",   total_papers,                     "YiaebBefTHKZdblrny2Vsw"),
@@ -880,7 +749,7 @@ def generate_publications_redesign(data):
     prof_defs = [("ADS", plinks.get("ads")), ("Google Scholar", plinks.get("scholar")),
                  ("ORCID", plinks.get("orcid"))]
     prof_links = "".join(
-        f'<a class="reslink" href="{_url_attr(u)}" target="_blank" rel="noopener">{lbl} ↗</a>'
+        f'<a class="reslink" href="{url_attr(u)}" target="_blank" rel="noopener">{lbl} ↗</a>'
         for lbl, u in prof_defs if u
     )
     profiles = (
@@ -906,9 +775,9 @@ def generate_publications_redesign(data):
 
     figures = (
         '<div class="pub-figures">'
-        + _fig("Research mix", "share of work by area", _mix_svg(papers_with_year), wide=True)
+        + _fig("Research mix", "share of work by area", _mix_svg(cube), wide=True)
         + _fig("Citations received per year", peak_txt, _citations_svg(metrics), wide=True)
-        + _fig("Publications by year &amp; role", "hover or tab through the bars", _roles_svg(papers_with_year))
+        + _fig("Publications by year &amp; role", "hover or tab through the bars", _roles_svg(cube))
         + _fig("Research impact by role", "RIQ vs. the typical astronomer range", _riq_svg(metrics))
         + '</div>'
         '<p class="pub-fig-note"><strong>Why these figures?</strong> I find it easier to see what I work on '
@@ -925,7 +794,7 @@ def generate_publications_redesign(data):
     )
 
     # Featured spotlight (papers flagged featured=true), shown with abstracts
-    featured = [p for p in papers_with_year if p.get("featured")]
+    featured = [store.expand(by_key[k], ("abstract",)) for k in cube.featured]
     feat_html = ""
     if featured:
         fcards = "".join(_generate_paper_card(p, board=True) for p in featured)
@@ -985,85 +854,210 @@ def generate_publications_redesign(data):
     )
 
 
-def build_page(page_name, html, data):
-    """Fill each page's content container(s) from content.json. Redesign pages are
-    static shells (head/nav/hero/footer); only the content area is generated — the
-    `#<page>-content` container for the nine secondary pages, and the per-section
+# Parsed inputs shared by the pages of one build: "content" (content.json) and,
+# once loaded, the publication "store" and "cube". Pool workers inherit it when
+# forked, or receive it once through _init_page_worker.
+_snapshot = {}
+
+
+def _init_page_worker(snapshot):
+    global _snapshot
+    _snapshot = snapshot
+
+
+def _publications():
+    """The build's PublicationStore (hot index parsed) and cube, loaded once."""
+    if "store" not in _snapshot:
+        store = PublicationStore()
+        cube = load_cube(store)
+        store.publications  # parse the hot index now, so forked workers share it
+        _snapshot.update(store=store, cube=cube)
+    store = _snapshot["store"]
+    track_file(store.source, store.source_digest())
+    return store, _snapshot["cube"]
+
+
+def _layout():
+    """The shared chrome (layout.Layout), rendered once per build; every page depends on all of site."""
+    if "layout" not in _snapshot:
+        _snapshot["layout"] = Layout(_snapshot["content"].get("site", {}))
+    layout = _snapshot["layout"]
+    track_content("site", layout.digest)
+    return layout
+
+
+def _render_page(task):
+    """Build one (page_name, html) task from the snapshot; returns (html, inputs read)."""
+    page_name, html = task
+    with tracking() as inputs:
+        updated = build_page(page_name, html, ContentRecorder(_snapshot["content"]))
+    return updated, inputs
+
+
+def render_pages(tasks, snapshot, workers=1):
+    """Render (page_name, html) tasks, serially or on `workers` processes.
+
+    `snapshot` holds the parsed shared inputs (at least "content"). Before a
+    pool starts the layout and publications are loaded into it, so every
+    worker starts with them: inherited on fork, pickled once per worker
+    otherwise. Results come back in task order.
+    """
+    _init_page_worker(snapshot)
+    if workers <= 1 or len(tasks) < 2:
+        return [_render_page(task) for task in tasks]
+    _layout()
+    try:
+        _publications()
+    except (OSError, ValueError):
+        pass  # each worker retries, and reports the error for its page
+    if "fork" in multiprocessing.get_all_start_methods():
+        pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"))
+    else:
+        pool = ProcessPoolExecutor(workers, initializer=_init_page_worker, initargs=(snapshot,))
+    with pool:
+        return list(pool.map(_render_page, tasks))
+
+
+def page_fills(page_name, data):
+    """(container id, inner HTML) pairs for a page, generated from content.json. Redesign
+    pages are static shells (head/nav/hero/footer); only the content area is generated —
+    the `#<page>-content` container for the nine secondary pages, and the per-section
     ids #about/#research/#team/#join for Home (404.html is not handled here)."""
 
     if page_name == "index":
         # Redesign Home: regenerate content sections from content.json.
-        html = replace_container_content(html, "id", "about", generate_home_about(data))
-        html = replace_container_content(html, "id", "research", generate_home_research(data))
-        html = replace_container_content(html, "id", "team", generate_home_team(data))
-        html = replace_container_content(html, "id", "join", generate_home_collab(data))
+        fills = [
+            ("about", generate_home_about(data)),
+            ("research", generate_home_research(data)),
+            ("team", generate_home_team(data)),
+            ("join", generate_home_collab(data)),
+        ]
 
     elif page_name == "biography":
-        html = replace_container_content(html, "id", "biography-content", generate_biography(data))
+        fills = [("biography-content", generate_biography(data))]
 
     elif page_name == "awards":
-        html = replace_container_content(html, "id", "awards-content", gen_awards(data))
+        fills = [("awards-content", gen_awards(data))]
 
     elif page_name == "service":
-        html = replace_container_content(html, "id", "service-content", gen_service(data))
+        fills = [("service-content", gen_service(data))]
 
     elif page_name == "talks":
-        html = replace_container_content(html, "id", "talks-content", gen_talks(data))
+        fills = [("talks-content", gen_talks(data))]
 
     elif page_name == "teaching":
-        html = replace_container_content(html, "id", "teaching-content", gen_teaching(data))
+        fills = [("teaching-content", gen_teaching(data))]
 
     elif page_name == "mentorship":
-        html = replace_container_content(html, "id", "mentorship-content", gen_mentorship(data))
+        fills = [("mentorship-content", gen_mentorship(data))]
 
     elif page_name == "software":
-        html = replace_container_content(html, "id", "software-content", gen_software(data))
+        fills = [("software-content", gen_software(data))]
 
     elif page_name == "news":
-        html = replace_container_content(html, "id", "news-content", gen_news(data))
+        fills = [("news-content", gen_news(data))]
 
     elif page_name == "publications":
-        html = replace_container_content(
-            html, "id", "publications-content", generate_publications_redesign(data)
-        )
+        fills = [("publications-content", generate_publications_redesign(data))]
+
+    else:
+        fills = []
 
     # Header band (kicker/title/tagline) from pages.* — single source of truth for the
     # nine secondary pages (Home's hero is bespoke and not handled here).
     pages_meta = data.get("pages", {})
     if page_name in pages_meta:
-        html = replace_container_content(
-            html, "id", f"{page_name}-header", generate_page_header(pages_meta[page_name])
-        )
+        fills.append((f"{page_name}-header", generate_page_header(pages_meta[page_name])))
 
-    return html
+    return fills
+
+
+def build_page(page_name, html, data):
+    """Fill each page's content container(s) from content.json (see page_fills) and frame
+    its <main> with the shared chrome (see layout); the containers are located in one
+    cached scan of the shell and everything is joined in one splice."""
+    frame = (MAIN_ID,) + _layout().frame(page_name)
+    return fill_containers(page_name, html, page_fills(page_name, data), frame)
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Inject static content into the page templates")
+    parser.add_argument("--force", action="store_true", help="rebuild every page, even if unchanged")
+    parser.add_argument("--workers", type=int, default=CONFIG["build"]["workers"],
+                        help="processes rendering pages (0 = one per CPU, 1 = serial)")
+    args = parser.parse_args()
+    workers = args.workers or os.cpu_count() or 1
+
     # Load content data
     print(f"Loading content from {CONTENT_JSON}...")
     if not CONTENT_JSON.exists():
         print(f"ERROR: {CONTENT_JSON} not found", file=sys.stderr)
         sys.exit(1)
 
-    data = json.loads(CONTENT_JSON.read_text(encoding="utf-8"))
+    content_raw = CONTENT_JSON.read_bytes()
+    content_sha = sha256(content_raw)
+    data = None
+
+    def content():
+        nonlocal data
+        if data is None:
+            data = json_codec.loads(content_raw)
+        return data
 
-    # Process each HTML file
+    manifest = BuildManifest()
+    code = code_digest()
+    pending, skipped = [], []
+
+    # Find the pages whose inputs changed
     for page_name, html_path in HTML_FILES.items():
         if not html_path.exists():
             print(f"  WARNING: {html_path} not found, skipping")
             continue
 
-        print(f"  Processing {html_path.name}...")
         original_html = html_path.read_text(encoding="utf-8")
-        updated_html = build_page(page_name, original_html, data)
+        template = sha256(original_html.encode("utf-8"))
+        if not args.force and manifest.is_fresh(
+            page_name, lambda name: current_digest(name, content, code, template), content_sha
+        ):
+            skipped.append(html_path.name)
+            continue
+        pending.append((page_name, html_path, original_html))
 
-        if updated_html != original_html:
-            html_path.write_text(updated_html, encoding="utf-8")
+    if pending and workers > 1:
+        print(f"  Rendering {len(pending)} page(s) on {workers} processes...")
+    tasks = [(page_name, html) for page_name, _, html in pending]
+    results = render_pages(tasks, {"content": content()}, workers) if tasks else []
+
+    # Write in page order, whatever order the renders finished in
+    for (page_name, html_path, original_html), (updated_html, inputs) in zip(pending, results):
+        print(f"  Processing {html_path.name}...")
+        if updated_html != original_html and write_if_changed(html_path, updated_html):
             print(f"    -> Updated {html_path.name}")
         else:
             print(f"    -> No changes needed for {html_path.name}")
-
+        inputs.update(code=code, template=sha256(updated_html.encode("utf-8")))
+        manifest.record(page_name, inputs)
+
+    if NOT_FOUND_HTML.exists():
+        original_html = NOT_FOUND_HTML.read_text(encoding="utf-8")
+        template = sha256(original_html.encode("utf-8"))
+        if args.force or not manifest.is_fresh(
+            "404", lambda name: current_digest(name, content, code, template), content_sha
+        ):
+            layout = Layout(content().get("site", {}))
+            updated_html = layout.refooter(original_html)
+            if write_if_changed(NOT_FOUND_HTML, updated_html):
+                print(f"  Updated {NOT_FOUND_HTML.name} footer")
+            manifest.record("404", {
+                "content:site": layout.digest,
+                "code": code,
+                "template": sha256(updated_html.encode("utf-8")),
+            })
+
+    manifest.save(content_sha)
+    print(f"Rebuilt {len(pending)} page(s); skipped {len(skipped)} unchanged"
+          + (f": {', '.join(skipped)}" if skipped else ""))
     print("Done! Static HTML content has been injected into page templates.")
 
 
@@ -0,0 +1,248 @@
+"""
+Per-page dependency manifest for the incremental site build.
+
+While build_html renders a page it records every input the page read:
+
+    content:<path>   a content.json subtree, recorded at section depth
+                     (content:sections.research, content:pages.talks), by
+                     wrapping the parsed content in a `ContentRecorder`
+    file:<path>      a data or asset file (publications data, software stats,
+                     an inlined SVG), via `track_file`
+    template         the page's HTML shell, as the build left it
+    code             every Python source under scripts/
+
+each with a SHA-256 digest. The manifest (.build_cache/build_manifest.json)
+keeps those digests per page; on the next run a page whose inputs all still
+hash the same is skipped. When content.json is byte-identical to the last run
+its subtrees are not rehashed (or even parsed).
+"""
+
+import hashlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+import json_codec
+from atomic_write import write_json_if_changed
+from config import get_build_cache_dir, get_project_root
+from digest_cache import file_sha256
+
+MANIFEST_VERSION = 1
+# Content paths are recorded this many keys deep
+CONTENT_DEPTH = 2
+_MISSING = "missing"
+
+_current: Optional[Dict[str, str]] = None
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    return file_sha256(path) or _MISSING
+
+
+def content_digest(value: Any) -> str:
+    return sha256(json_codec.dumps_bytes(value, indent=None, sort_keys=True, separators=(",", ":")))
+
+
+def code_digest() -> str:
+    """Digest of every Python source under scripts/, imported by this build or not
+    (a module imported lazily, or only in a worker, still counts)."""
+    h = hashlib.sha256()
+    for path in sorted(Path(__file__).resolve().parent.glob("*.py")):
+        h.update(path.name.encode("utf-8") + b"\0" + path.read_bytes())
+    return h.hexdigest()
+
+
+def _relative(path: Union[str, Path]) -> str:
+    path = Path(path).resolve()
+    try:
+        return path.relative_to(get_project_root()).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def track_file(path: Union[str, Path], digest: Optional[str] = None):
+    """Record that the page being built read `path` (no-op outside `tracking`)."""
+    if _current is not None:
+        _current[f"file:{_relative(path)}"] = digest or file_digest(path)
+
+
+def track_content(path: str, digest: str):
+    """Record that the page being built read content.json `path` (dotted), with `digest`.
+
+    For inputs read outside the page's ContentRecorder, e.g. rendered once per build.
+    """
+    if _current is not None:
+        _current[f"content:{path}"] = digest
+
+
+@contextmanager
+def tracking() -> Iterator[Dict[str, str]]:
+    """Collect the inputs read inside the block into the yielded dict."""
+    global _current
+    outer, _current = _current, {}
+    try:
+        yield _current
+    finally:
+        _current = outer
+
+
+def _lookup(data: Any, path: Tuple[str, ...]) -> Any:
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return _MISSING
+        data = data[key]
+    return data
+
+
+class ContentRecorder(dict):
+    """A content.json dict that records which subtrees are read.
+
+    Reads CONTENT_DEPTH keys deep are recorded as `content:<a>.<b>` with the
+    digest of the value (missing keys included, so adding one is noticed);
+    shallower dicts come back wrapped so their reads are recorded in turn.
+    Iterating, sizing, comparing or copying a wrapped dict records it whole.
+    Content is read-only while a page renders: any mutation raises TypeError.
+    """
+
+    def __init__(self, data: Dict, path: Tuple[str, ...] = ()):
+        super().__init__(data)
+        self._path = path
+
+    def _record(self, path: Tuple[str, ...], value: Any):
+        if _current is not None:
+            _current["content:" + ".".join(path)] = content_digest(value)
+
+    def _child(self, key: str, value: Any) -> Any:
+        path = self._path + (key,)
+        if isinstance(value, dict) and len(path) < CONTENT_DEPTH:
+            return ContentRecorder(value, path)
+        self._record(path, value)
+        return value
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        return self._child(key, value)
+
+    def get(self, key, default=None):
+        if super().__contains__(key):
+            return self._child(key, super().__getitem__(key))
+        self._record(self._path + (key,), _MISSING)
+        return default
+
+    def __contains__(self, key):
+        present = super().__contains__(key)
+        self._record(self._path + (key,), super().__getitem__(key) if present else _MISSING)
+        return present
+
+    def _whole(self):
+        self._record(self._path, dict(super().items()))
+
+    def __iter__(self):
+        self._whole()
+        return super().__iter__()
+
+    def keys(self):
+        self._whole()
+        return super().keys()
+
+    def values(self):
+        self._whole()
+        return super().values()
+
+    def items(self):
+        self._whole()
+        return super().items()
+
+    def __len__(self):
+        self._whole()
+        return super().__len__()
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __reversed__(self):
+        self._whole()
+        return super().__reversed__()
+
+    def __eq__(self, other):
+        self._whole()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        self._whole()
+        return super().__ne__(other)
+
+    def copy(self):
+        self._whole()
+        return dict(super().items())
+
+    def __or__(self, other):
+        return self.copy() | other
+
+    def __ror__(self, other):
+        return other | self.copy()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(
+            f"content.json is read-only while a page renders (at {'.'.join(self._path) or 'top level'})"
+        )
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    setdefault = pop = popitem = update = clear = _read_only
+
+
+class BuildManifest:
+    """Recorded input digests per page, from the previous build."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or get_build_cache_dir() / "build_manifest.json"
+        self.content_sha256: Optional[str] = None
+        self.pages: Dict[str, Dict[str, str]] = {}
+        try:
+            saved = json_codec.load(self.path)
+        except (OSError, ValueError):
+            saved = {}
+        if saved.get("version") == MANIFEST_VERSION:
+            self.content_sha256 = saved.get("contentSha256")
+            self.pages = saved.get("pages", {})
+
+    def is_fresh(self, page: str, current: Callable[[str], str], content_sha256: str) -> bool:
+        """True if every input recorded for `page` still has its recorded digest.
+
+        `current(name)` returns an input's digest now; content inputs are not
+        rechecked when content.json itself is unchanged.
+        """
+        inputs = self.pages.get(page)
+        same_content = content_sha256 == self.content_sha256
+        return bool(inputs) and all(
+            (same_content and name.startswith("content:")) or current(name) == digest
+            for name, digest in inputs.items()
+        )
+
+    def record(self, page: str, inputs: Dict[str, str]):
+        self.pages[page] = dict(sorted(inputs.items()))
+
+    def save(self, content_sha256: str):
+        self.content_sha256 = content_sha256
+        write_json_if_changed(
+            self.path,
+            {"version": MANIFEST_VERSION, "contentSha256": content_sha256, "pages": self.pages},
+        )
+
+
+def current_digest(name: str, content: Callable[[], Dict], code: str, template: str) -> str:
+    """Digest of input `name` now; `content()` supplies the parsed content.json."""
+    if name == "code":
+        return code
+    if name == "template":
+        return template
+    if name.startswith("file:"):
+        return file_digest(get_project_root() / name[len("file:"):])
+    if name.startswith("content:"):
+        path = name[len("content:"):]
+        return content_digest(_lookup(content(), tuple(path.split(".")) if path else ()))
+    return _MISSING
@@ -2,14 +2,17 @@
 Emits :root (dark defaults + base tokens) and [data-theme="light"] overrides.
 Re-runnable; idempotent. Run: python scripts/build_tokens.py
 """
-import os, json
+import os
+
+import json_codec
+from atomic_write import write_if_changed
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SRC = os.path.join(ROOT, "assets", "data", "tokens.json")
 OUT = os.path.join(ROOT, "assets", "css", "tokens.css")
 
 def main():
-    data = json.load(open(SRC, encoding="utf-8"))
+    data = json_codec.load(SRC)
     tv = data["themeVarying"]
     base = data["base"]
 
@@ -31,9 +34,8 @@ def main():
     out.append("}")
     out.append("")
 
-    with open(OUT, "w", encoding="utf-8") as f:
-        f.write("\n".join(out))
-    print(f"Wrote {OUT} ({len(tv)} themed + {len([k for k in base if not k.startswith('_')])} base tokens)")
+    verb = "Wrote" if write_if_changed(OUT, "\n".join(out)) else "Unchanged"
+    print(f"{verb} {OUT} ({len(tv)} themed + {len([k for k in base if not k.startswith('_')])} base tokens)")
 
 if __name__ == "__main__":
     main()
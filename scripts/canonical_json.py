@@ -0,0 +1,134 @@
+"""
+Canonical serialization of publications_data.json.
+
+Identical pipeline runs must produce identical bytes, so that a content hash can
+drive caching and CI diffs stay empty. The canonical writer therefore:
+
+  - sorts list fields that are really sets (keywords, sources)
+  - emits keys in a fixed order (top level, metrics, and each publication in
+    publication.FIELDS order, unknown keys after in sorted order)
+  - keeps the previous `lastUpdated` timestamps unless the content they describe
+    actually changed
+  - stores a `contentHash` of everything except those timestamps
+
+Downstream steps can compare `contentHash` to skip work when nothing changed.
+"""
+
+import hashlib
+from typing import Dict, Optional
+
+import json_codec
+from publication import FIELDS
+
+TOP_LEVEL_ORDER = ("lastUpdated", "contentHash", "metrics", "publications", "citationsByPublicationYear")
+SET_LIKE_FIELDS = ("keywords", "sources")
+
+# metrics sub-keys whose freshness is tracked by metrics["adsMetricsLastUpdated"]
+ADS_METRICS_KEYS = (
+    "adsMetricsTimeSeries",
+    "adsMetricsCurrent",
+    "adsMetricsCurrentRefereed",
+    "riqByCategory",
+)
+
+_FIELD_RANK = {field: i for i, field in enumerate(FIELDS)}
+
+
+def _ordered(d: Dict, order) -> Dict:
+    """`d` with keys from `order` first (in that order), then the rest sorted."""
+    head = [k for k in order if k in d]
+    seen = set(head)
+    tail = sorted(k for k in d if k not in seen)
+    return {k: d[k] for k in head + tail}
+
+
+def canonical_publication(pub: Dict) -> Dict:
+    out = {}
+    for key in sorted(pub, key=lambda k: (_FIELD_RANK.get(k, len(FIELDS)), k)):
+        value = pub[key]
+        if key in SET_LIKE_FIELDS and isinstance(value, list):
+            value = sorted(set(value), key=str)
+        out[key] = value
+    return out
+
+
+def canonicalize(data: Dict) -> Dict:
+    """Return a canonically ordered copy of the top-level structure."""
+    out = _ordered(data, TOP_LEVEL_ORDER)
+    if isinstance(out.get("metrics"), dict):
+        metrics = dict(out["metrics"])
+        if isinstance(metrics.get("sources"), list):
+            metrics["sources"] = sorted(set(metrics["sources"]))
+        out["metrics"] = metrics
+    if isinstance(out.get("publications"), list):
+        out["publications"] = [canonical_publication(p) for p in out["publications"]]
+    return out
+
+
+def _digest(obj) -> str:
+    payload = json_codec.dumps_bytes(obj, indent=None, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _without_timestamps(data: Dict) -> Dict:
+    stripped = {k: v for k, v in data.items() if k not in ("lastUpdated", "contentHash")}
+    if isinstance(stripped.get("metrics"), dict):
+        stripped["metrics"] = {
+            k: v
+            for k, v in stripped["metrics"].items()
+            if k not in ("lastUpdated", "adsMetricsLastUpdated")
+        }
+    return stripped
+
+
+def content_hash(data: Dict) -> str:
+    """Hash of the data's content, ignoring timestamps and the stored hash itself."""
+    return _digest(_without_timestamps(canonicalize(data)))
+
+
+def _ads_digest(data: Dict) -> str:
+    metrics = data.get("metrics") or {}
+    return _digest({k: metrics.get(k) for k in ADS_METRICS_KEYS})
+
+
+def baseline(previous: Optional[Dict]) -> Optional[Dict]:
+    """Capture what `prepare` needs from the on-disk data, before stages mutate it."""
+    if not previous:
+        return None
+    metrics = previous.get("metrics") or {}
+    return {
+        "contentHash": previous.get("contentHash") or content_hash(previous),
+        "adsDigest": _ads_digest(previous),
+        "lastUpdated": previous.get("lastUpdated"),
+        "metricsLastUpdated": metrics.get("lastUpdated"),
+        "adsMetricsLastUpdated": metrics.get("adsMetricsLastUpdated"),
+    }
+
+
+def prepare(data: Dict, base: Optional[Dict] = None) -> Dict:
+    """Canonicalize `data` for writing, carrying timestamps over from `base`
+    (see baseline()) wherever the content they date is unchanged."""
+    out = canonicalize(data)
+    digest = content_hash(out)
+    metrics = out.get("metrics")
+    if base:
+        if base["contentHash"] == digest:
+            if base["lastUpdated"] is not None and "lastUpdated" in out:
+                out["lastUpdated"] = base["lastUpdated"]
+            if base["metricsLastUpdated"] is not None and isinstance(metrics, dict):
+                if "lastUpdated" in metrics:
+                    metrics["lastUpdated"] = base["metricsLastUpdated"]
+        if (
+            base["adsMetricsLastUpdated"] is not None
+            and isinstance(metrics, dict)
+            and "adsMetricsLastUpdated" in metrics
+            and base["adsDigest"] == _ads_digest(out)
+        ):
+            metrics["adsMetricsLastUpdated"] = base["adsMetricsLastUpdated"]
+    out["contentHash"] = digest
+    return _ordered(out, TOP_LEVEL_ORDER)
+
+
+def dumps(data: Dict, base: Optional[Dict] = None) -> str:
+    """Canonical pretty-printed JSON text for `data`."""
+    return json_codec.dumps(prepare(data, base))
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Cached LLM categorization queue.
+
+Categorizing a paper per llm_categorization_rubric.md is expensive (one agent per
+paper reading the full text), so results are cached under a content fingerprint
+of the paper's identifiers and normalized title (see paper_index.py). A title
+tweak or a lost llm_categorization field then costs a cache lookup rather than a
+fresh categorization.
+
+The queue:
+  1. seeds the cache from papers that already carry an llm_categorization
+  2. applies cached results to papers that lost theirs
+  3. sends only the still-uncategorized papers to a backend, in batches, with
+     at most `max_concurrency` requests in flight
+
+Backends are pluggable: `CommandBackend` pipes each paper request (JSON) to an
+external command that returns the rubric's output object on stdout; `StubBackend`
+answers locally from the keyword classifier, for testing the queue offline. Stub
+results are never cached or saved to the data file, and a paper carrying one
+still counts as uncategorized.
+
+Usage:
+  python scripts/categorization_queue.py --dry-run
+  python scripts/categorization_queue.py --backend stub --limit 5
+  python scripts/categorization_queue.py --backend command --command "./categorize.sh" --max-concurrency 4
+"""
+
+import argparse
+import logging
+import shlex
+import subprocess
+import sys
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import json_codec
+from atomic_write import write_json_if_changed
+from config import get_data_path
+from data_store import DataStore
+from keyword_classifier import get_classifier
+from paper_index import fingerprint, paper_keys
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+RUBRIC_PATH = Path(__file__).parent / "llm_categorization_rubric.md"
+# `model` of StubBackend results: keyword guesses, not a categorization
+STUB_MODEL = "keyword-stub"
+
+
+def is_llm_result(result: Optional[Dict]) -> bool:
+    """True for a real rubric result (not missing, not a keyword-stub guess)."""
+    return bool(result) and result.get("model") != STUB_MODEL
+
+
+def get_cache_path() -> Path:
+    return get_data_path("llm_categorization_cache.json")
+
+
+class CategorizationCache:
+    """LLM categorization results keyed by paper fingerprint.
+
+    Each entry also records the paper's identity keys, so a paper whose title
+    changed (new fingerprint) is still found through its bibcode/DOI/arXiv ID.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else get_cache_path()
+        self.entries: Dict[str, Dict] = {}
+        self._by_key: Dict[str, str] = {}
+        self._dirty = False
+
+    def load(self) -> "CategorizationCache":
+        if self.path.exists():
+            data = json_codec.load(self.path)
+            if data.get("version") == CACHE_VERSION:
+                for fp, entry in data.get("entries", {}).items():
+                    self._index(fp, entry)
+        logger.info(f"Categorization cache: {len(self.entries)} entries")
+        return self
+
+    def save(self):
+        if not self._dirty:
+            return
+        write_json_if_changed(self.path, {"version": CACHE_VERSION, "entries": self.entries})
+        self._dirty = False
+
+    def _index(self, fp: str, entry: Dict):
+        self.entries[fp] = entry
+        for key in entry.get("keys", []):
+            self._by_key.setdefault(key, fp)
+
+    def get(self, pub: Dict) -> Optional[Dict]:
+        """Return the cached result for `pub` (by fingerprint, then by identity key)."""
+        entry = self.entries.get(fingerprint(pub))
+        if entry is None:
+            for key in paper_keys(pub):
+                fp = self._by_key.get(key)
+                if fp is not None:
+                    entry = self.entries[fp]
+                    break
+        return entry["result"] if entry and is_llm_result(entry["result"]) else None
+
+    def put(self, pub: Dict, result: Dict, overwrite: bool = True):
+        fp = fingerprint(pub)
+        if not overwrite and fp in self.entries:
+            return
+        self._index(fp, {"keys": paper_keys(pub), "result": result})
+        self._dirty = True
+
+    def seed(self, publications: List[Dict]) -> int:
+        """Cache every existing llm_categorization not cached yet; return count added."""
+        added = 0
+        for pub in publications:
+            result = pub.get("llm_categorization")
+            if is_llm_result(result) and fingerprint(pub) not in self.entries:
+                self.put(pub, result)
+                added += 1
+        return added
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+
+class CategorizationBackend(ABC):
+    """Produces one rubric output object per paper request.
+
+    `max_concurrency` is the most requests the backend accepts at once; the
+    queue never exceeds it. Results are cached only if `cache_results` is set.
+    """
+
+    name = "base"
+    max_concurrency = 1
+    cache_results = True
+
+    @abstractmethod
+    def categorize(self, request: Dict) -> Dict:
+        """Return the rubric output object for one paper request."""
+
+
+class StubBackend(CategorizationBackend):
+    """Local keyword-classifier backend for tests and dry runs (no network, no LLM)."""
+
+    name = "stub"
+    # Keyword guesses must never be served later in place of a real categorization
+    cache_results = False
+
+    def __init__(self, max_concurrency: int = 4):
+        self.max_concurrency = max_concurrency
+        self.classifier = get_classifier()
+
+    def categorize(self, request: Dict) -> Dict:
+        probs = self.classifier.probabilities(
+            request.get("title", ""),
+            request.get("abstract", ""),
+            request.get("keywords", []),
+        )
+        return {
+            "categorization": probs,
+            "reasoning": "Keyword-map stub categorization of title, abstract and keywords.",
+            "full_paper_analyzed": False,
+            "source": "abstract_only",
+            "arxiv_id": request.get("arxivId", ""),
+            "model": STUB_MODEL,
+            "timestamp": _utc_timestamp(),
+            "fallback_reason": "Stub backend does not read the full paper",
+        }
+
+
+class CommandBackend(CategorizationBackend):
+    """Runs an external command per paper: request JSON on stdin, result JSON on stdout."""
+
+    name = "command"
+
+    def __init__(self, command: str, max_concurrency: int = 2, timeout: int = 900):
+        self.argv = shlex.split(command)
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+
+    def categorize(self, request: Dict) -> Dict:
+        proc = subprocess.run(
+            self.argv,
+            input=json_codec.dumps(request, indent=None),
+            capture_output=True,
+            text=True,
+            timeout=self.timeout,
+            check=True,
+        )
+        return json_codec.loads(proc.stdout)
+
+
+BACKENDS = {"stub": StubBackend, "command": CommandBackend}
+
+
+def _utc_timestamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _validate_result(result: Dict):
+    probs = result.get("categorization")
+    if not isinstance(probs, dict) or not probs:
+        raise ValueError("result has no 'categorization' object")
+    total = sum(probs.values())
+    if abs(total - 1.0) > 0.02:
+        raise ValueError(f"categorization probabilities sum to {total:.3f}, not 1")
+
+
+# ---------------------------------------------------------------------------
+# Queue
+# ---------------------------------------------------------------------------
+
+
+class CategorizationQueue:
+    """Fills llm_categorization for uncategorized papers, cache first."""
+
+    def __init__(
+        self,
+        backend: CategorizationBackend,
+        cache: Optional[CategorizationCache] = None,
+        max_concurrency: Optional[int] = None,
+        batch_size: int = 8,
+    ):
+        self.backend = backend
+        self.cache = cache if cache is not None else CategorizationCache().load()
+        limit = backend.max_concurrency
+        if max_concurrency is not None:
+            limit = min(limit, max_concurrency)
+        self.max_concurrency = max(1, limit)
+        self.batch_size = max(1, batch_size)
+
+    @staticmethod
+    def needs_categorization(pub: Dict) -> bool:
+        return not is_llm_result(pub.get("llm_categorization"))
+
+    @staticmethod
+    def apply_result(pub: Dict, result: Dict):
+        """Write a rubric result onto a paper (rubric step 4.2)."""
+        probs = result["categorization"]
+        pub["categoryProbabilities"] = dict(probs)
+        pub["researchArea"] = max(probs, key=probs.get)
+        pub["llm_categorization"] = result
+
+    @staticmethod
+    def build_request(pub: Dict) -> Dict:
+        return {
+            "title": pub.get("title", ""),
+            "abstract": pub.get("abstract", ""),
+            "keywords": pub.get("keywords", []) or [],
+            "bibcode": pub.get("bibcode", ""),
+            "arxivId": pub.get("arxivId", ""),
+            "doi": pub.get("doi", ""),
+            "year": pub.get("year"),
+            "rubric": str(RUBRIC_PATH),
+        }
+
+    @classmethod
+    def restore_from_cache(cls, cache: CategorizationCache, publications: List[Dict]) -> int:
+        """Restore cached results onto uncategorized papers; return count restored."""
+        restored = 0
+        for pub in publications:
+            if not cls.needs_categorization(pub):
+                continue
+            result = cache.get(pub)
+            if result:
+                cls.apply_result(pub, result)
+                restored += 1
+        return restored
+
+    def apply_cached(self, publications: List[Dict]) -> int:
+        return self.restore_from_cache(self.cache, publications)
+
+    def pending(self, publications: List[Dict]) -> List[Dict]:
+        return [p for p in publications if self.needs_categorization(p)]
+
+    def _categorize_one(self, pub: Dict) -> Optional[Dict]:
+        try:
+            result = self.backend.categorize(self.build_request(pub))
+            _validate_result(result)
+            return result
+        except Exception as e:
+            logger.warning(f"Categorization failed for {pub.get('title', '')[:60]}: {e}")
+            return None
+
+    def run(
+        self,
+        publications: List[Dict],
+        limit: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, int]:
+        """Categorize what the cache cannot answer. Returns per-outcome counts."""
+        seeded = self.cache.seed(publications)
+        restored = self.apply_cached(publications)
+        todo = self.pending(publications)
+        if limit is not None:
+            todo = todo[:limit]
+
+        summary = {
+            "seeded": seeded,
+            "cached": restored,
+            "queued": len(todo),
+            "categorized": 0,
+            "failed": 0,
+        }
+        logger.info(
+            f"Categorization: {seeded} seeded, {restored} restored from cache, "
+            f"{len(todo)} queued for '{self.backend.name}' "
+            f"(concurrency {self.max_concurrency})"
+        )
+        if dry_run or not todo:
+            return summary
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            for start in range(0, len(todo), self.batch_size):
+                batch = todo[start : start + self.batch_size]
+                for pub, result in zip(batch, pool.map(self._categorize_one, batch)):
+                    if result is None:
+                        summary["failed"] += 1
+                        continue
+                    self.apply_result(pub, result)
+                    if self.backend.cache_results:
+                        self.cache.put(pub, result)
+                    summary["categorized"] += 1
+                # Persist after every batch so an interrupted run keeps its results
+                self.cache.save()
+                logger.info(
+                    f"  batch {start // self.batch_size + 1}: "
+                    f"{summary['categorized']} categorized, {summary['failed']} failed"
+                )
+        return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Categorize uncategorized publications through a cached job queue"
+    )
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="stub")
+    parser.add_argument(
+        "--command", help="Command for the 'command' backend (reads JSON on stdin)"
+    )
+    parser.add_argument("--max-concurrency", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--limit", type=int, default=None, help="Categorize at most N papers")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report cache hits and queued papers without calling the backend or writing files",
+    )
+    args = parser.parse_args()
+
+    if args.backend == "command":
+        if not args.command:
+            parser.error("--backend command requires --command")
+        backend = CommandBackend(args.command, max_concurrency=args.max_concurrency or 2)
+    else:
+        backend = StubBackend(max_concurrency=args.max_concurrency or 4)
+
+    store = DataStore()
+    data_path = store.path
+    data = store.load()
+    if data is None:
+        logger.error(f"No publications data at {data_path}")
+        sys.exit(1)
+    publications = data.get("publications", [])
+
+    queue = CategorizationQueue(
+        backend, max_concurrency=args.max_concurrency, batch_size=args.batch_size
+    )
+    summary = queue.run(publications, limit=args.limit, dry_run=args.dry_run)
+    logger.info(f"Summary: {summary}")
+
+    if args.dry_run:
+        return
+    queue.cache.save()
+    if not backend.cache_results:
+        # Keyword guesses would stand in for real categorizations if saved
+        logger.info(f"'{backend.name}' results are not saved to {data_path}")
+        return
+    if summary["cached"] or summary["categorized"]:
+        store.set(data)
+        if store.save():
+            logger.info(f"Saved {data_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Append-only citation history for every paper, plus author-level metrics snapshots.
+
+Each pipeline run overwrites `citations` on every paper, so the history would
+otherwise only live inside full backups. This store keeps it as a columnar,
+change-only log under assets/data/citation_history/:
+
+    paper.u32, day.u32, citations.u32   parallel little-endian uint32 columns;
+                                        row i says paper[i] had citations[i]
+                                        citations as of day[i] (days since
+                                        1970-01-01). A row is appended only
+                                        when a paper's count changes.
+    papers.json                         paper id -> identity keys and title
+                                        (ids are positions; see paper_index)
+    metrics.jsonl                       one line per change of the author-level
+                                        metrics (papers, citations, h, i10)
+
+Loading reads three flat uint32 columns, so queries take milliseconds.
+
+Usage:
+  python scripts/citation_history.py record            # snapshot the live data file
+  python scripts/citation_history.py import-backups    # backfill from the backup store
+  python scripts/citation_history.py show [--top 10] [--days 365]
+"""
+
+import argparse
+import logging
+import sys
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import json_codec
+from atomic_write import write_json_if_changed
+from config import get_data_path
+from paper_index import paper_keys
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("paper", "day", "citations")
+METRIC_KEYS = ("totalPapers", "totalCitations", "hIndex", "i10Index")
+_EPOCH = date(1970, 1, 1)
+
+
+def get_history_dir() -> Path:
+    return get_data_path("citation_history")
+
+
+def to_day(when: date) -> int:
+    return (when - _EPOCH).days
+
+
+def from_day(day: int) -> date:
+    return date.fromordinal(_EPOCH.toordinal() + day)
+
+
+def data_date(data: Dict) -> Optional[date]:
+    """The date a data snapshot was taken, from its lastUpdated timestamp."""
+    stamp = data.get("lastUpdated")
+    if not stamp:
+        return None
+    return datetime.fromisoformat(stamp.replace("Z", "+00:00")).date()
+
+
+class CitationHistory:
+    """Columnar (paper, day, citations) change log and metrics snapshots."""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else get_history_dir()
+        self.columns: Dict[str, array] = {name: array("I") for name in COLUMNS}
+        self.papers: List[Dict] = []
+        self.metrics: List[Dict] = []
+        self._by_key: Dict[str, List[int]] = {}
+        self._rows_by_paper: Optional[Dict[int, List[int]]] = None
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _column_path(self, name: str) -> Path:
+        return self.root / f"{name}.u32"
+
+    def _load(self):
+        papers_path = self.root / "papers.json"
+        if papers_path.exists():
+            self.papers = json_codec.load(papers_path)
+        for paper_id, paper in enumerate(self.papers):
+            self._add_keys(paper_id, paper["keys"])
+        for name, column in self.columns.items():
+            path = self._column_path(name)
+            if path.exists():
+                with open(path, "rb") as f:
+                    column.frombytes(f.read())
+                if sys.byteorder == "big":
+                    column.byteswap()
+        # An interrupted append can leave the columns uneven; drop the partial row
+        rows = min(len(c) for c in self.columns.values())
+        for column in self.columns.values():
+            del column[rows:]
+        metrics_path = self.root / "metrics.jsonl"
+        if metrics_path.exists():
+            with open(metrics_path, "r", encoding="utf-8") as f:
+                self.metrics = [json_codec.loads(line) for line in f if line.strip()]
+
+    def _append_rows(self, rows: List[Tuple[int, int, int]]):
+        self.root.mkdir(parents=True, exist_ok=True)
+        for i, name in enumerate(COLUMNS):
+            new = array("I", (row[i] for row in rows))
+            self.columns[name].extend(new)
+            if sys.byteorder == "big":
+                new.byteswap()
+            with open(self._column_path(name), "ab") as f:
+                new.tofile(f)
+        self._rows_by_paper = None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _add_keys(self, paper_id: int, keys: List[str]):
+        for key in keys:
+            ids = self._by_key.setdefault(key, [])
+            if paper_id not in ids:
+                ids.append(paper_id)
+
+    def find(self, pub: Dict, exclude=()) -> Optional[int]:
+        """Id of `pub` by its strongest matching identity key, skipping `exclude`."""
+        for key in paper_keys(pub):
+            for paper_id in self._by_key.get(key, ()):
+                if paper_id not in exclude:
+                    return paper_id
+        return None
+
+    def paper_id(self, pub: Dict, exclude=()) -> int:
+        """Id of `pub`, registering it (or any identity keys it gained) as needed.
+
+        `exclude` holds ids already taken in this snapshot, so duplicate records
+        sharing identifiers keep separate histories.
+        """
+        keys = paper_keys(pub)
+        paper_id = self.find(pub, exclude)
+        if paper_id is None:
+            paper_id = len(self.papers)
+            self.papers.append({"keys": keys, "title": pub.get("title", "")})
+        paper = self.papers[paper_id]
+        new_keys = [k for k in keys if k not in paper["keys"]]
+        if new_keys:
+            paper["keys"] = paper["keys"] + new_keys
+        self._add_keys(paper_id, keys)
+        return paper_id
+
+    def latest(self) -> Dict[int, Tuple[int, int]]:
+        """paper id -> (day, citations) of its most recent row."""
+        out = {}
+        paper, day, cites = self.columns["paper"], self.columns["day"], self.columns["citations"]
+        for i in range(len(paper)):
+            out[paper[i]] = (day[i], cites[i])
+        return out
+
+    def record(self, data: Dict, when: Optional[date] = None) -> int:
+        """Append rows for every paper whose citation count changed. Returns rows appended."""
+        when = when or datetime.now(timezone.utc).date()
+        day = to_day(when)
+        latest = self.latest()
+        rows = []
+        seen = set()
+        for pub in data.get("publications", []):
+            paper_id = self.paper_id(pub, seen)
+            seen.add(paper_id)
+            citations = max(0, int(pub.get("citations", 0) or 0))
+            last = latest.get(paper_id)
+            if last is None or (last[1] != citations and last[0] <= day):
+                rows.append((paper_id, day, citations))
+                latest[paper_id] = (day, citations)
+        if rows:
+            self._append_rows(rows)
+        write_json_if_changed(self.root / "papers.json", self.papers)
+
+        metrics = data.get("metrics") or {}
+        snapshot = {k: metrics[k] for k in METRIC_KEYS if k in metrics}
+        last_metrics = self.metrics[-1] if self.metrics else {}
+        if snapshot and {k: last_metrics.get(k) for k in snapshot} != snapshot and (
+            last_metrics.get("date", "") <= when.isoformat()
+        ):
+            entry = {"date": when.isoformat(), **snapshot}
+            self.metrics.append(entry)
+            with open(self.root / "metrics.jsonl", "a", encoding="utf-8") as f:
+                f.write(json_codec.dumps(entry, indent=None, separators=(",", ":")) + "\n")
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _rows(self, paper_id: int) -> List[int]:
+        if self._rows_by_paper is None:
+            self._rows_by_paper = {}
+            for i, p in enumerate(self.columns["paper"]):
+                self._rows_by_paper.setdefault(p, []).append(i)
+        return self._rows_by_paper.get(paper_id, [])
+
+    def series(self, paper_id: int) -> List[Tuple[date, int]]:
+        """(date, citations) at each change, oldest first."""
+        day, cites = self.columns["day"], self.columns["citations"]
+        return [(from_day(day[i]), cites[i]) for i in self._rows(paper_id)]
+
+    def citations_at(self, paper_id: int, when: date) -> int:
+        """Citation count as of `when` (0 before the first record)."""
+        rows = self._rows(paper_id)
+        days = [self.columns["day"][i] for i in rows]
+        pos = bisect_right(days, to_day(when))
+        return self.columns["citations"][rows[pos - 1]] if pos else 0
+
+    def velocity(self, paper_id: int, days: int = 365, as_of: Optional[date] = None) -> float:
+        """Citations gained per year over the `days` before `as_of` (default: last record)."""
+        rows = self._rows(paper_id)
+        if not rows:
+            return 0.0
+        end = to_day(as_of) if as_of else self.columns["day"][rows[-1]]
+        start = from_day(end - days)
+        first_day = self.columns["day"][rows[0]]
+        if first_day > end - days:
+            # History starts inside the window: measure from the first record
+            if first_day == end:
+                return 0.0
+            start = from_day(first_day)
+            days = end - first_day
+        gained = self.citations_at(paper_id, from_day(end)) - self.citations_at(paper_id, start)
+        return gained * 365.0 / days
+
+    def trending(self, n: int = 10, days: int = 365) -> List[Tuple[str, float]]:
+        """The `n` papers with the highest citation velocity: (title, citations/year)."""
+        ranked = sorted(
+            ((self.papers[p]["title"], self.velocity(p, days)) for p in range(len(self.papers))),
+            key=lambda t: -t[1],
+        )
+        return ranked[:n]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-paper citation history")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("record", help="Record the live data file")
+    sub.add_parser("import-backups", help="Backfill from backup store snapshots (oldest first)")
+    p = sub.add_parser("show", help="Show history size and the fastest-growing papers")
+    p.add_argument("--top", type=int, default=10)
+    p.add_argument("--days", type=int, default=365)
+    args = parser.parse_args()
+
+    history = CitationHistory()
+    if args.command == "record":
+        data = json_codec.load(get_data_path())
+        rows = history.record(data, data_date(data))
+        logger.info(f"Recorded {rows} citation change(s)")
+    elif args.command == "import-backups":
+        from backup_store import BackupStore
+
+        store = BackupStore()
+        rows = 0
+        for snap in store.snapshots:
+            data = store.load(snap["hash"])
+            when = data_date(data) or datetime.fromisoformat(snap["created"]).date()
+            rows += history.record(data, when)
+        logger.info(f"Imported {len(store.snapshots)} snapshot(s): {rows} citation change(s)")
+    elif args.command == "show":
+        rows = len(history.columns["paper"])
+        print(f"{len(history.papers)} papers, {rows} rows, {len(history.metrics)} metrics snapshots")
+        for title, per_year in history.trending(args.top, args.days):
+            print(f"{per_year:>8.1f}/yr  {title[:90]}")
+
+
+if __name__ == "__main__":
+    main()
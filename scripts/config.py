@@ -20,6 +20,11 @@ def get_backup_dir():
     return get_project_root() / "assets" / "data" / "backups"
 
 
+def get_build_cache_dir():
+    """Return path to the (untracked) build cache directory."""
+    return get_project_root() / ".build_cache"
+
+
 CONFIG = {
     "google_scholar": {
         "author_id": "Z6dqXGoAAAAJ",
@@ -59,6 +64,21 @@ CONFIG = {
         "full_data": "assets/data/publications_data.json",
         "backup_dir": "assets/data/backups",
     },
+    "backups": {
+        "keep_recent": 10,  # Always keep the N most recent snapshots
+        "keep_daily": 7,  # Plus the newest snapshot of each of the last N days
+        "keep_weekly": 8,  # Plus the newest snapshot of each of the last N ISO weeks
+        "compression_level": 6,  # gzip level for stored snapshots
+    },
+    "merge": {
+        "workers": 0,  # Processes for matching papers to sources (0 = one per CPU)
+        "parallel_threshold": 2000,  # Match in parallel from this many base papers up
+        "block_size": 256,  # Base papers per work unit
+        "near_duplicate_threshold": 0.8,  # Title shingle Jaccard for duplicate groups
+    },
+    "build": {
+        "workers": 1,  # Processes rendering pages in build_html (0 = one per CPU, 1 = serial)
+    },
     "categories": {
         "keywords_mapping": {
             # Statistical Learning & AI
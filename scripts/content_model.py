@@ -0,0 +1,453 @@
+"""
+Typed content model shared by the page generators (pages_*.py).
+
+The generators used to walk raw content.json dicts and derive their keys
+inline, item by item, some of them more than once (a course's department
+slugs for its chip, its data-cat and each badge; a mentee's stripped name for
+search and for the title key). `section_model` parses one content.json
+section into slotted records, once, with every derived value precomputed:
+
+    search      data-search value: the item's plain text (tags stripped),
+                lowercased and attribute-escaped (pages_shared.attr_esc)
+    sort_title  data-title value, likewise
+    year, sort_num, end_key
+                sort keys (latest year, YYYYMM, end-of-period ordering)
+    slug(s)     chip / accent keys
+
+Models are cached per section object, so however many generators or pages
+read a section it is parsed once per build. Reading the section through
+`section_model(data, name)` still goes through `data`, so a page's build
+manifest records its dependency on the section.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pages_shared import attr_esc
+from text_normalize import strip_tags
+
+_YEAR = re.compile(r"(?:19|20)\d{2}")
+_YEAR_WORD = re.compile(r"\b((?:19|20)\d{2})\b")
+_DASH = re.compile(r"\s*[-–]\s*")
+_NON_SLUG = re.compile(r"[^a-z0-9]+")
+
+_MONTHS = {m: i for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)}
+
+
+def slug(s: Any, default: str) -> str:
+    """Lowercase, hyphenated, attribute-safe slug for data-cat / chip keys."""
+    return _NON_SLUG.sub("-", strip_tags(s).lower()).strip("-") or default
+
+
+def latest_year(texts: List[Any]) -> int:
+    """The latest 19xx/20xx year mentioned across `texts` (ranges, annotations), else 0."""
+    years = [int(y) for t in texts for y in _YEAR.findall(str(t))]
+    return max(years) if years else 0
+
+
+# ---------------------------------------------------------------------------
+# Talks
+# ---------------------------------------------------------------------------
+
+def _month(date: Any) -> int:
+    """Month number (1-12) parsed from a 'Mon YYYY' date string, else 0."""
+    parts = str(date or "").split()
+    if parts and parts[0][:3].lower() in _MONTHS:
+        return _MONTHS[parts[0][:3].lower()]
+    return 0
+
+
+def _iso_date(date: Any, year: Any) -> str:
+    """Best-effort ISO date for <time datetime>: 'Mon YYYY' -> 'YYYY-MM', else the year."""
+    m = _month(date)
+    parts = str(date or "").split()
+    if m and len(parts) >= 2 and parts[1].isdigit():
+        return f"{parts[1]}-{m:02d}"
+    return str(year) if year else ""
+
+
+def _talk_sort_num(date: Any, year: Any) -> int:
+    """YYYYMM so same-year talks order by month (undated/TBD sort to the end of their year)."""
+    try:
+        y = int(year)
+    except (TypeError, ValueError):
+        return 0
+    return y * 100 + _month(date)
+
+
+class Talk:
+    """One talk (title, event, location, date, year, type are plain text)."""
+
+    __slots__ = ("title", "event", "location", "date", "year", "type", "featured",
+                 "when", "iso_date", "sort_num", "search", "sort_title")
+
+    def __init__(self, rec: Dict, cat_name: str):
+        self.title = rec.get("title", "")
+        self.event = rec.get("event", "")
+        self.location = rec.get("location", "")
+        self.date = rec.get("date", "")
+        self.year = rec.get("year", "")
+        self.type = rec.get("type", "")
+        self.featured = bool(rec.get("featured"))
+        # The human date string, falling back to the year
+        self.when = self.date or (str(self.year) if self.year else "")
+        self.iso_date = _iso_date(self.date, self.year)
+        self.sort_num = _talk_sort_num(self.date, self.year)
+        self.search = attr_esc(" ".join(
+            str(x) for x in (self.title, self.event, self.location, self.date, self.type, cat_name) if x
+        ))
+        self.sort_title = attr_esc(self.title)
+
+
+class TalkCategory:
+    __slots__ = ("id", "name", "talks")
+
+    def __init__(self, rec: Dict):
+        self.id = rec.get("id", "")
+        self.name = rec.get("name", "")
+        self.talks = [Talk(t, self.name) for t in rec.get("talks", [])]
+
+
+def load_talks(section: Dict) -> List[TalkCategory]:
+    return [TalkCategory(c) for c in section.get("categories", [])]
+
+
+# ---------------------------------------------------------------------------
+# Teaching
+# ---------------------------------------------------------------------------
+
+_SEASON_MONTHS = {"winter": 1, "spring": 4, "summer": 6, "fall": 9, "autumn": 9}
+
+
+def _term_month(term: Any) -> int:
+    """Representative month (1-12) for a term/date string; month names win over
+    season words (winter/spring/summer/fall). 0 if nothing is recognized."""
+    t = str(term or "").lower()
+    for name, num in _MONTHS.items():
+        if name in t:
+            return num
+    for season, num in _SEASON_MONTHS.items():
+        if season in t:
+            return num
+    return 0
+
+
+def _terms_sort_num(terms: List[Any], year: int) -> int:
+    """YYYYMM-style key: the latest year, with the month/season of the term(s)
+    carrying that year. 0 if no year present."""
+    if not year:
+        return 0
+    month = max((_term_month(t) for t in terms if str(year) in str(t)), default=0)
+    return year * 100 + month
+
+
+class Course:
+    """A formal course (sections.teaching.courseHistory[])."""
+
+    __slots__ = ("code", "title", "level", "description", "terms", "departments",
+                 "dept_slugs", "title_display", "year", "sort_num", "search", "sort_title")
+
+    def __init__(self, rec: Dict):
+        self.code = rec.get("code", "")
+        self.title = rec.get("title", "")
+        self.level = rec.get("level", "")
+        self.description = rec.get("description", "")
+        self.terms = rec.get("terms", []) or []
+        # Either 'departments' (list) or 'department' (string)
+        if rec.get("departments"):
+            self.departments = [d for d in rec["departments"] if d]
+        else:
+            self.departments = [rec["department"]] if rec.get("department") else []
+        self.dept_slugs = [slug(d, "other") for d in self.departments]
+        self.title_display = " · ".join(p for p in [self.code, self.title] if p)
+        self.year = latest_year(self.terms)
+        self.sort_num = _terms_sort_num(self.terms, self.year)
+        self.search = attr_esc(" ".join([
+            strip_tags(self.code), strip_tags(self.title), strip_tags(self.level),
+            strip_tags(" / ".join(self.departments)), strip_tags(self.description),
+            strip_tags(" ".join(self.terms)),
+        ]))
+        self.sort_title = attr_esc(strip_tags(self.title_display))
+
+
+class ShortCourse:
+    """A workshop or short course (sections.teaching.shortCourses[])."""
+
+    __slots__ = ("title", "program", "location", "terms", "year", "sort_num", "search", "sort_title")
+
+    def __init__(self, rec: Dict):
+        self.title = rec.get("title", "")
+        self.program = rec.get("program", "")
+        self.location = rec.get("location", "")
+        self.terms = rec.get("terms", []) or []
+        self.year = latest_year(self.terms)
+        self.sort_num = _terms_sort_num(self.terms, self.year)
+        self.search = attr_esc(" ".join([
+            strip_tags(self.title), strip_tags(self.program), strip_tags(self.location),
+            strip_tags(" ".join(self.terms)), "workshop short course",
+        ]))
+        self.sort_title = attr_esc(strip_tags(self.title))
+
+
+class Teaching:
+    __slots__ = ("courses", "short_courses", "philosophy", "years")
+
+    def __init__(self, section: Dict):
+        self.courses = [Course(c) for c in section.get("courseHistory", []) or []]
+        self.short_courses = [ShortCourse(c) for c in section.get("shortCourses", []) or []]
+        self.philosophy = section.get("philosophy") or {}
+        # Every year a course was taught, ascending
+        self.years = sorted({int(y) for c in self.courses for t in c.terms for y in _YEAR.findall(str(t))})
+
+
+# ---------------------------------------------------------------------------
+# Service
+# ---------------------------------------------------------------------------
+
+def _period_text(pos: Any) -> str:
+    """Joined period string for a position dict ('' if none)."""
+    if not isinstance(pos, dict):
+        return ""
+    if isinstance(pos.get("periods"), list):
+        return ", ".join(str(p).strip() for p in pos["periods"] if str(p).strip())
+    return str(pos.get("term") or pos.get("period") or "").strip()
+
+
+def _end_year(period: str) -> int:
+    """End year for sorting (newest first): ongoing roles ('…-Present') sort top,
+    else the latest year mentioned, else 0."""
+    if "present" in period.lower():
+        return 9999
+    return latest_year([period])
+
+
+class ServiceRole:
+    """One card: a role/position (title), its parent org (byline), period and note."""
+
+    __slots__ = ("title", "byline", "period", "note", "year", "search", "sort_title")
+
+    def __init__(self, title: str, byline: str, period: str, note: str, category: str):
+        self.title = title
+        self.byline = byline
+        self.period = period
+        self.note = note
+        self.year = _end_year(period)
+        self.search = attr_esc(" ".join(strip_tags(x) for x in (title, byline, period, note, category)).strip())
+        self.sort_title = attr_esc(strip_tags(title))
+
+
+class ServiceCategory:
+    __slots__ = ("title", "slug", "roles")
+
+    def __init__(self, rec: Dict):
+        self.title = rec.get("title", "") or ""
+        self.slug = slug(self.title, "cat")
+        orgs = rec.get("organizations")
+        orgs = [o for o in (orgs if isinstance(orgs, list) else []) if not (isinstance(o, dict) and o.get("hidden"))]
+        items = [it for it in (rec.get("items") or []) if not (isinstance(it, dict) and it.get("hidden"))]
+
+        # title = the role (or an explicit `title`, in which case the role drops
+        # into the byline); byline = parent org
+        cards = []
+        for org in orgs:
+            org_name = (org.get("name", "") or "").strip()
+            for pos in (org.get("positions") or []):
+                if isinstance(pos, str):
+                    cards.append((pos.strip(), org_name, "", ""))
+                    continue
+                role = (pos.get("role") or "").strip()
+                if pos.get("title"):
+                    title = pos["title"].strip()
+                    byline = " · ".join(x for x in (role, org_name) if x)
+                else:
+                    title, byline = role, org_name
+                cards.append((title, byline, _period_text(pos), (pos.get("note") or "").strip()))
+        for it in items:  # {role, organization, period} shape
+            cards.append(((it.get("organization", "") or "").strip(),
+                          (it.get("role") or "").strip(),
+                          (it.get("period") or it.get("term") or "").strip(), ""))
+        self.roles = [ServiceRole(*card, self.title) for card in cards]
+
+
+def load_service(section: Dict) -> List[ServiceCategory]:
+    """Visible categories with at least one card, in content order."""
+    categories = [ServiceCategory(c) for c in section.get("categories", []) or [] if not c.get("hidden")]
+    return [c for c in categories if c.roles]
+
+
+# ---------------------------------------------------------------------------
+# Mentorship
+# ---------------------------------------------------------------------------
+
+_SEASON_ORDER = {"winter": 1, "spring": 2, "summer": 3, "fall": 4, "autumn": 4}
+
+
+def _end_key(period: str) -> Tuple[int, int]:
+    """Sort key for ordering by END date, newest first (use reverse=True).
+
+    Takes the text after the last dash as the end ('Present' sorts above all),
+    then (year, season) so e.g. Fall 2024 > Summer 2024 > 2023.
+    """
+    end = _DASH.split(period.strip())[-1].strip().lower()
+    if "present" in end:
+        return (9999, 9)
+    years = _YEAR.findall(end)
+    year = int(years[-1]) if years else 0
+    season = next((o for s, o in _SEASON_ORDER.items() if s in end), 0)
+    return (year, season)
+
+
+class Mentee:
+    """One mentee record (name is HTML and may contain a link)."""
+
+    __slots__ = ("name_html", "period", "supervision", "project", "cosupervisors",
+                 "current_status", "career", "institution", "programs", "courses",
+                 "awards", "year", "end_key", "search", "sort_title")
+
+    def __init__(self, rec: Dict):
+        self.name_html = rec.get("name") or ""
+        name_plain = strip_tags(self.name_html).strip()
+        self.period = rec.get("timelinePeriod") or ""
+        self.current_status = rec.get("currentStatus") or ""
+        self.career = rec.get("myCareerStage") or ""
+        self.institution = rec.get("institution") or ""
+        self.programs = list(rec.get("programs") or [])
+        self.courses = list(rec.get("courses") or [])
+        self.awards = list(rec.get("awards") or [])
+
+        # Single-project records, or bachelors-style records with a projects[] array
+        projects = rec.get("projects") if isinstance(rec.get("projects"), list) else []
+        sup = rec.get("supervisionType") or ""
+        proj = rec.get("project") or ""
+        if not proj and projects:
+            proj = "; ".join(p.get("title", "") for p in projects if p.get("title"))
+            if not sup:
+                sup = next((p["supervisionType"] for p in projects if p.get("supervisionType")), "")
+        self.supervision, self.project = sup, proj
+
+        # Record-level co-supervisors, then those inside projects[], deduplicated
+        cs = list(rec.get("coSupervisors") or [])
+        for p in (rec.get("projects") or []):
+            cs += list(p.get("coSupervisors") or [])
+        self.cosupervisors = list(dict.fromkeys(c for c in cs if c))
+
+        years = _YEAR_WORD.findall(str(self.period))
+        self.year = max(int(y) for y in years) if years else 0
+        self.end_key = _end_key(str(self.period))
+        tags = self.programs + self.awards + self.courses + [self.institution]
+        self.search = attr_esc(" ".join(strip_tags(x) for x in (
+            name_plain, sup, proj, self.current_status, " ".join(self.cosupervisors), " ".join(tags)
+        )))
+        self.sort_title = attr_esc(name_plain)
+
+
+def _by_stage(groups: Dict) -> Dict[str, List[Mentee]]:
+    """Stage key -> mentees, newest end date first (the 'completed' key is not a stage)."""
+    return {
+        stage: sorted((Mentee(r) for r in recs or []), key=lambda m: m.end_key, reverse=True)
+        for stage, recs in groups.items()
+        if stage != "completed" and isinstance(recs, list)
+    }
+
+
+class Mentorship:
+    __slots__ = ("current", "former", "introduction")
+
+    def __init__(self, section: Dict):
+        mbs = section.get("menteesByStage") or {}
+        self.current = _by_stage(mbs)
+        self.former = _by_stage(mbs.get("completed") or {})
+        self.introduction = (section.get("introduction") or {}).get("content") or ""
+
+
+# ---------------------------------------------------------------------------
+# Awards and news
+# ---------------------------------------------------------------------------
+
+class Award:
+    __slots__ = ("title", "organization", "description", "year", "year_num", "search", "sort_title")
+
+    def __init__(self, rec: Dict):
+        self.title = rec.get("title", "")
+        self.organization = rec.get("organization", "")
+        self.description = rec.get("description", "")
+        self.year = rec.get("year", "")
+        try:
+            self.year_num = int(self.year)
+        except (TypeError, ValueError):
+            self.year_num = 0
+        self.search = attr_esc(f"{self.title} {self.organization}")
+        self.sort_title = attr_esc(self.title)
+
+
+def load_awards(section: Dict) -> List[Award]:
+    return [Award(a) for a in section.get("awards", [])]
+
+
+class NewsItem:
+    """One update; `search` covers title, blurb and outlet (the generator adds the type label)."""
+
+    __slots__ = ("type", "title", "blurb", "date", "year", "link", "outlet", "search", "sort_title")
+
+    def __init__(self, rec: Dict):
+        self.type = rec.get("type", "note")
+        self.title = rec.get("title", "")
+        self.blurb = rec.get("blurb", "")
+        self.date = rec.get("date", "")
+        self.year = rec.get("year", 0)
+        self.link = rec.get("link", "")
+        self.outlet = rec.get("outlet", "")
+        self.search = attr_esc(f"{self.title} {self.blurb} {self.outlet}")
+        self.sort_title = attr_esc(self.title)
+
+
+def load_news(section: Dict) -> List[NewsItem]:
+    return [NewsItem(n) for n in section.get("items", [])]
+
+
+# ---------------------------------------------------------------------------
+# Software
+# ---------------------------------------------------------------------------
+
+class Software:
+    """Curation for the software page; the repository stats come from software_data.json."""
+
+    __slots__ = ("group_order", "group_label", "group_accent", "curation", "featured", "showcase")
+
+    def __init__(self, section: Dict):
+        groups = section.get("groups", [])
+        self.group_order = [g["id"] for g in groups]
+        self.group_label = {g["id"]: g["label"] for g in groups}
+        self.group_accent = {g["id"]: g.get("accent", "violet") for g in groups}
+        self.curation = section.get("curation", {})
+        self.featured = section.get("featured", [])
+        self.showcase = section.get("showcase")
+
+
+LOADERS: Dict[str, Callable[[Dict], Any]] = {
+    "talks": load_talks,
+    "teaching": Teaching,
+    "service": load_service,
+    "mentorship": Mentorship,
+    "awards": load_awards,
+    "news": load_news,
+    "software": Software,
+}
+
+# Section name -> (the section object it was built from, model)
+_models: Dict[str, Tuple[Optional[Dict], Any]] = {}
+
+
+def section_model(data: Dict, name: str) -> Any:
+    """The model of content.json `sections.<name>`, parsed once per section object."""
+    section = data.get("sections", {}).get(name)
+    cached = _models.get(name)
+    if cached is None or cached[0] is not section:
+        cached = _models[name] = (section, LOADERS[name](section or {}))
+    return cached[1]
+
+
+def clear_models():
+    """Forget every parsed model, so the next section_model call parses afresh."""
+    _models.clear()
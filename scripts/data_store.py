@@ -0,0 +1,136 @@
+"""
+Run-scoped store for publications_data.json.
+
+A pipeline run parses the data file once, hands every stage a reference to the
+same in-memory dict, and writes it once at the end. All reads and writes made
+through the store are counted so a run can report its I/O.
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+import canonical_json
+import json_codec
+import publication_store
+from atomic_write import write_if_changed
+from config import get_data_path
+
+logger = logging.getLogger(__name__)
+
+
+def _fmt_bytes(n: int) -> str:
+    if n >= 1024 * 1024:
+        return f"{n / (1024 * 1024):.1f} MB"
+    if n >= 1024:
+        return f"{n / 1024:.1f} KB"
+    return f"{n} B"
+
+
+class DataStore:
+    """Load-once / write-once snapshot of the publications data file.
+
+    `original` is the data as it was on disk when first loaded; `data` is the
+    current working copy, which stages may replace (`set`) or mutate in place
+    (`mark_dirty`). Nothing is written until `save()`.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else get_data_path()
+        self.original: Optional[Dict] = None
+        self.data: Optional[Dict] = None
+        self._raw: Optional[bytes] = None
+        self._baseline: Optional[Dict] = None
+        self._loaded = False
+        self._dirty = False
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.bytes_avoided = 0
+        self.reads = 0
+        self.writes = 0
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def load(self) -> Optional[Dict]:
+        """Return the working data, parsing the file on first call (None if absent)."""
+        if not self._loaded:
+            self._loaded = True
+            if self.path.exists():
+                self._raw = self.path.read_bytes()
+                self.bytes_read += len(self._raw)
+                self.reads += 1
+                self.original = json_codec.loads(self._raw)
+                self.data = self.original
+                self._baseline = canonical_json.baseline(self.original)
+        return self.data
+
+    @property
+    def original_bytes(self) -> Optional[bytes]:
+        """The file's exact bytes as first loaded (None if it did not exist)."""
+        self.load()
+        return self._raw
+
+    @property
+    def original_count(self) -> int:
+        """Number of publications in the file as loaded."""
+        self.load()
+        return len((self.original or {}).get("publications", []))
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def set(self, data: Dict):
+        """Replace the working data; it is written on the next save()."""
+        self.load()
+        self.data = data
+        self._dirty = True
+
+    def mark_dirty(self):
+        """Record that the working data was mutated in place."""
+        self._dirty = True
+
+    def save(self) -> bool:
+        """Write the working data to the canonical path if it changed. Returns True if written.
+
+        The write is atomic and skipped when the serialized bytes equal the file's.
+        The hot index and cold shards (see publication_store) are refreshed with it.
+        """
+        if not self._dirty or self.data is None:
+            return False
+        payload = self.serialize(self.data)
+        self._dirty = False
+        written = write_if_changed(self.path, payload)
+        if written:
+            self._count_write(len(payload))
+        else:
+            self.bytes_avoided += len(payload)
+        # The freshly written file is now the on-disk baseline
+        self._raw = payload
+        written_data = json_codec.loads(payload)
+        self._baseline = canonical_json.baseline(written_data)
+        if self.path == get_data_path():
+            publication_store.write(written_data, payload)
+        return written
+
+    def serialize(self, data: Dict) -> bytes:
+        """Canonical bytes for `data`, keeping timestamps from the loaded file
+        when the content is unchanged (see canonical_json)."""
+        return canonical_json.dumps(data, self._baseline).encode("utf-8")
+
+    def _count_write(self, n: int):
+        self.bytes_written += n
+        self.writes += 1
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def report(self) -> str:
+        return (
+            f"{self.path.name}: read {self.reads}x ({_fmt_bytes(self.bytes_read)}), "
+            f"wrote {self.writes}x ({_fmt_bytes(self.bytes_written)}), "
+            f"unchanged {_fmt_bytes(self.bytes_avoided)}"
+        )
@@ -0,0 +1,66 @@
+"""
+SHA-256 of input files, memoized on their size and mtime.
+
+The build keys its caches (hot index, publication cube, page manifest) on the
+SHA-256 of files like publications_data.json, and hashing those in full on
+every run costs more than a build that skips every page. `file_sha256` keeps
+each digest in .build_cache/file_digests.json with the file's size and mtime
+and rehashes only when either changed, as git's index does. The memo is
+untracked, so a fresh checkout hashes each file once.
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import json_codec
+from atomic_write import write_json_if_changed
+from config import get_build_cache_dir
+
+MEMO_VERSION = 1
+
+_memo: Optional[Dict[str, Dict]] = None
+
+
+def _memo_path() -> Path:
+    return get_build_cache_dir() / "file_digests.json"
+
+
+def _entries() -> Dict[str, Dict]:
+    global _memo
+    if _memo is None:
+        try:
+            saved = json_codec.load(_memo_path())
+        except (OSError, ValueError):
+            saved = {}
+        _memo = saved.get("files", {}) if saved.get("version") == MEMO_VERSION else {}
+    return _memo
+
+
+def _save():
+    files = {name: entry for name, entry in _entries().items() if Path(name).exists()}
+    write_json_if_changed(_memo_path(), {"version": MEMO_VERSION, "files": files}, sort_keys=True)
+
+
+def file_sha256(path: Union[str, Path], data: Optional[bytes] = None) -> Optional[str]:
+    """SHA-256 of the file at `path` (None if it does not exist).
+
+    `data`, if given, is the file's content already in memory (hashed instead
+    of rereading it when the memo is stale).
+    """
+    path = Path(path).resolve()
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    stamp = [st.st_size, st.st_mtime_ns]
+    entry = _entries().get(str(path))
+    if entry and entry["stamp"] == stamp:
+        return entry["sha256"]
+    try:
+        digest = hashlib.sha256(data if data is not None else path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+    _entries()[str(path)] = {"stamp": stamp, "sha256": digest}
+    _save()
+    return digest
@@ -8,6 +8,9 @@ import logging
 from typing import Dict, List, Optional
 import ads
 from config import CONFIG, AUTHOR_VARIATIONS, JOURNAL_MAPPINGS
+from keyword_classifier import get_classifier
+from publication import Publication
+from text_normalize import normalize_title
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -205,31 +208,11 @@ class ADSFetcher:
         from difflib import SequenceMatcher
 
         # Normalize titles
-        title1 = self._normalize_title(title1)
-        title2 = self._normalize_title(title2)
+        title1 = normalize_title(title1)
+        title2 = normalize_title(title2)
 
         return SequenceMatcher(None, title1, title2).ratio()
 
-    def _normalize_title(self, title: str) -> str:
-        """Normalize title for comparison."""
-        import re
-        import html
-
-        # Step 1: Handle double-encoded HTML entities (&amp;lt; → &lt; → <)
-        # Decode multiple times to handle nested encoding
-        prev_title = ""
-        while prev_title != title:
-            prev_title = title
-            title = html.unescape(title)
-
-        # Step 2: Strip HTML tags (<i>z</i> → z)
-        title = re.sub(r"<[^>]+>", "", title)
-
-        # Step 3: Standard normalization - remove punctuation and convert to lowercase
-        title = re.sub(r"[^\w\s]", "", title.lower())
-        title = re.sub(r"\s+", " ", title).strip()
-        return title
-
     def fetch_publications(self) -> List[Dict]:
         """Fetch publication list from ADS."""
         publications = []
@@ -403,7 +386,7 @@ class ADSFetcher:
             # Extract citations
             citations = getattr(paper, "citation_count", 0) or 0
 
-            publication = {
+            publication = Publication({
                 "id": bibcode or f"ads_{hash(title)}",
                 "title": title.strip(),
                 "authors": authors,
@@ -414,7 +397,7 @@ class ADSFetcher:
                 "abstract": abstract.strip(),
                 "keywords": keywords,
                 "source": "ads",
-            }
+            })
 
             # Add identifiers if available
             if doi:
@@ -467,21 +450,7 @@ class ADSFetcher:
         self, title: str, abstract: str, keywords: List[str]
     ) -> str:
         """Classify publication into research area based on title, abstract, and keywords."""
-        text = f"{title} {abstract} {' '.join(keywords)}".lower()
-
-        keyword_mapping = CONFIG["categories"]["keywords_mapping"]
-
-        # Score each category
-        category_scores = {}
-        for keyword, category in keyword_mapping.items():
-            if keyword in text:
-                category_scores[category] = category_scores.get(category, 0) + 1
-
-        # Return category with highest score, or default
-        if category_scores:
-            return max(category_scores, key=category_scores.get)
-        else:
-            return CONFIG["categories"]["default_category"]
+        return get_classifier().classify(title, abstract, keywords)
 
     def fetch_coauthor_network(self) -> Dict:
         """Fetch co-author network data for visualizations."""
@@ -4,9 +4,13 @@ Google Scholar data fetcher for publication metrics.
 
 import time
 import logging
+import re
 from typing import Dict, List, Optional
 from scholarly import scholarly, ProxyGenerator
 from config import CONFIG
+from keyword_classifier import get_classifier
+from publication import Publication
+from text_normalize import normalize_title
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -65,12 +69,14 @@ class GoogleScholarFetcher:
 
                         if title:
                             paper_list.append(
-                                {
-                                    "title": title,
-                                    "year": year,
-                                    "scholar_id": pub.get("author_pub_id", ""),
-                                    "source": "google_scholar",
-                                }
+                                Publication(
+                                    {
+                                        "title": title,
+                                        "year": year,
+                                        "scholar_id": pub.get("author_pub_id", ""),
+                                        "source": "google_scholar",
+                                    }
+                                )
                             )
 
                             # Log if paper has empty authors (common in quick fetch)
@@ -116,13 +122,13 @@ class GoogleScholarFetcher:
                 bib = pub.get("bib", {})
                 title = bib.get("title", "").strip()
                 if title:
-                    pub_lookup[self._normalize_title(title)] = pub
+                    pub_lookup[normalize_title(title)] = pub
 
             # Process each paper in the input list
             for i, paper_info in enumerate(paper_list):
                 try:
                     title = paper_info.get("title", "").strip()
-                    normalized_title = self._normalize_title(title)
+                    normalized_title = normalize_title(title)
 
                     if normalized_title in pub_lookup:
                         pub = pub_lookup[normalized_title]
@@ -249,7 +255,7 @@ class GoogleScholarFetcher:
             # Extract basic information
             bib = pub.get("bib", {})
 
-            publication = {
+            publication = Publication({
                 "id": f"scholar_{hash(title)}",  # Generate unique ID
                 "title": title,
                 "authors": self._parse_authors(bib.get("author", "")),
@@ -259,7 +265,7 @@ class GoogleScholarFetcher:
                 "url": pub.get("pub_url", ""),
                 "abstract": bib.get("abstract", ""),
                 "source": "google_scholar",
-            }
+            })
 
             # Try to extract DOI or arXiv ID from URL or other fields
             self._extract_identifiers(publication, pub)
@@ -301,8 +307,6 @@ class GoogleScholarFetcher:
                 return year_value
             elif isinstance(year_value, str):
                 # Extract first 4-digit number that looks like a year
-                import re
-
                 match = re.search(r"\b(19|20)\d{2}\b", year_value)
                 if match:
                     return int(match.group())
@@ -316,8 +320,6 @@ class GoogleScholarFetcher:
         url = pub.get("pub_url", "")
 
         # Extract DOI
-        import re
-
         doi_match = re.search(r"doi\.org/(.+)", url)
         if doi_match:
             publication["doi"] = doi_match.group(1)
@@ -331,32 +333,9 @@ class GoogleScholarFetcher:
         if url:
             publication["scholarUrl"] = url
 
-    def _normalize_title(self, title: str) -> str:
-        """Normalize title for comparison."""
-        import re
-
-        # Remove common formatting and convert to lowercase
-        title = re.sub(r"[^\w\s]", "", title.lower())
-        title = re.sub(r"\s+", " ", title).strip()
-        return title
-
     def _classify_research_area(self, title: str, abstract: str) -> str:
         """Classify publication into research area based on keywords."""
-        text = f"{title} {abstract}".lower()
-
-        keyword_mapping = CONFIG["categories"]["keywords_mapping"]
-
-        # Score each category
-        category_scores = {}
-        for keyword, category in keyword_mapping.items():
-            if keyword in text:
-                category_scores[category] = category_scores.get(category, 0) + 1
-
-        # Return category with highest score, or default
-        if category_scores:
-            return max(category_scores, key=category_scores.get)
-        else:
-            return CONFIG["categories"]["default_category"]
+        return get_classifier().classify(title, abstract)
 
 
 def main():
@@ -3,10 +3,14 @@ OpenAlex data fetcher for publication data.
 """
 
 import logging
+import re
 import time
 from typing import Dict, List, Optional
 import pyalex
 from config import CONFIG, AUTHOR_VARIATIONS, JOURNAL_MAPPINGS
+from keyword_classifier import get_classifier
+from publication import Publication
+from text_normalize import normalize_title
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -189,12 +193,7 @@ class OpenAlexFetcher:
     def _create_normalized_search_query(self, title: str) -> str:
         """Create a search query using same normalization as similarity calculation."""
         # Use the same normalization as similarity calculation to ensure consistency
-        normalized = self._normalize_title(title)
-        # Re-add spaces where needed and clean up
-        import re
-
-        normalized = re.sub(r"\s+", " ", normalized).strip()
-        return normalized
+        return normalize_title(title)
 
     def _create_meaningful_words_query(self, title: str) -> str:
         """Create search query using meaningful words (original approach)."""
@@ -255,8 +254,6 @@ class OpenAlexFetcher:
         }
 
         # Normalize punctuation that might cause search issues
-        import re
-
         key_words = []
         for word in words:
             # Clean word and normalize punctuation
@@ -278,31 +275,11 @@ class OpenAlexFetcher:
         from difflib import SequenceMatcher
 
         # Normalize titles
-        title1 = self._normalize_title(title1)
-        title2 = self._normalize_title(title2)
+        title1 = normalize_title(title1)
+        title2 = normalize_title(title2)
 
         return SequenceMatcher(None, title1, title2).ratio()
 
-    def _normalize_title(self, title: str) -> str:
-        """Normalize title for comparison."""
-        import re
-        import html
-
-        # Step 1: Handle double-encoded HTML entities (&amp;lt; → &lt; → <)
-        # Decode multiple times to handle nested encoding
-        prev_title = ""
-        while prev_title != title:
-            prev_title = title
-            title = html.unescape(title)
-
-        # Step 2: Strip HTML tags (<i>z</i> → z)
-        title = re.sub(r"<[^>]+>", "", title)
-
-        # Step 3: Standard normalization - remove punctuation and convert to lowercase
-        title = re.sub(r"[^\w\s]", "", title.lower())
-        title = re.sub(r"\s+", " ", title).strip()
-        return title
-
     def _extract_publication_info(self, work: Dict) -> Optional[Dict]:
         """Extract and normalize publication information from OpenAlex work."""
         try:
@@ -346,8 +323,6 @@ class OpenAlexFetcher:
             if "arxiv" in ids:
                 arxiv_url = ids["arxiv"]
                 if arxiv_url:
-                    import re
-
                     match = re.search(r"arxiv\.org/abs/(.+)", arxiv_url)
                     if match:
                         arxiv_id = match.group(1)
@@ -372,7 +347,7 @@ class OpenAlexFetcher:
                 ):  # High confidence concepts
                     keywords.append(display_name)
 
-            publication = {
+            publication = Publication({
                 "id": f"openalex_{work.get('id', '').split('/')[-1]}",
                 "title": title,
                 "authors": authors,
@@ -382,7 +357,7 @@ class OpenAlexFetcher:
                 "abstract": abstract.strip(),
                 "keywords": keywords,
                 "source": "openalex",
-            }
+            })
 
             # Add identifiers if available
             if doi:
@@ -433,21 +408,7 @@ class OpenAlexFetcher:
         self, title: str, abstract: str, keywords: List[str]
     ) -> str:
         """Classify publication into research area based on keywords."""
-        text = f"{title} {abstract} {' '.join(keywords)}".lower()
-
-        keyword_mapping = CONFIG["categories"]["keywords_mapping"]
-
-        # Score each category
-        category_scores = {}
-        for keyword, category in keyword_mapping.items():
-            if keyword in text:
-                category_scores[category] = category_scores.get(category, 0) + 1
-
-        # Return category with highest score, or default
-        if category_scores:
-            return max(category_scores, key=category_scores.get)
-        else:
-            return CONFIG["categories"]["default_category"]
+        return get_classifier().classify(title, abstract, keywords)
 
     def fetch_author_metrics(self) -> Dict:
         """Fetch author-level metrics from OpenAlex."""
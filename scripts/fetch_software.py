@@ -23,13 +23,14 @@ Pass --allow-unclassified to write the cache anyway (the page will bucket them i
 Stdlib only (no third-party deps), matching the other front-end build scripts.
 """
 import argparse
-import json
 import os
 import sys
 import time
 import urllib.request
 import urllib.error
 
+import json_codec
+from atomic_write import write_json_if_changed
 from config import get_data_path
 
 GITHUB_API = "https://api.github.com"
@@ -46,7 +47,7 @@ def _get_json(url, headers=None, retries=4):
         try:
             req = urllib.request.Request(url, headers=headers)
             with urllib.request.urlopen(req, timeout=30) as r:
-                return json.load(r), None
+                return json_codec.loads(r.read()), None
         except urllib.error.HTTPError as e:
             if e.code in (429, 500, 502, 503) and attempt < retries - 1:
                 time.sleep(delay)
@@ -102,8 +103,7 @@ def main():
     args = ap.parse_args()
 
     content_path = get_data_path("content.json")
-    with open(content_path, encoding="utf-8") as f:
-        sw = json.load(f)["sections"]["software"]
+    sw = json_codec.load(content_path)["sections"]["software"]
     curation = sw.get("curation", {})
     user = args.user or sw.get("githubUser", "joshspeagle")
 
@@ -144,10 +144,10 @@ def main():
 
     out = {"lastUpdated": time.strftime("%Y-%m-%d"), "githubUser": user, "repos": repos}
     out_path = get_data_path("software_data.json")
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(out, f, indent=2, ensure_ascii=False)
-        f.write("\n")
-    print(f"\nWrote {out_path} ({len(repos)} repos).")
+    if write_json_if_changed(out_path, out, trailing_newline=True):
+        print(f"\nWrote {out_path} ({len(repos)} repos).")
+    else:
+        print(f"\n{out_path} unchanged ({len(repos)} repos).")
 
 
 if __name__ == "__main__":
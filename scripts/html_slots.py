@@ -0,0 +1,241 @@
+"""
+Container slots in the page templates, located once and filled in one splice.
+
+A page template is a static shell whose content areas are elements with an
+id (#about, #publications-content, #talks-header). `replace_container_content`
+replaces one container's inner HTML by searching the whole template for its
+opening tag and walking nested tags to the matching close; filling k
+containers that way rescans the template k times.
+
+`slot_map` locates the containers once, with the same matching rules:
+for each id the start of the opening tag, the start of its content and the
+start of the matching closing tag (None when the id is absent). The map is
+stored in .build_cache/templates/<page>.json under the template's SHA-256 and
+this module's own, so an unchanged template is not scanned again (and a change
+to the scanner invalidates every map). `fill_containers` then builds the
+page in one pass over the template (`splice`).
+
+The splice gives exactly what filling the containers one after another with
+`replace_container_content` gives, provided the containers are disjoint and
+no new content contains one of the ids still to be filled; when that cannot
+be guaranteed it falls back to the sequential replacements. The same splice
+can also swap everything around one kept element (the page chrome around
+<main>, see layout).
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import json_codec
+from atomic_write import write_json_if_changed
+from build_manifest import sha256
+from config import get_build_cache_dir
+from digest_cache import file_sha256
+
+SLOTS_VERSION = 1
+
+# (opening tag start, content start, closing tag start)
+Slot = Tuple[int, int, int]
+
+
+@lru_cache(maxsize=None)
+def _tag_patterns(tag_name: str) -> Tuple["re.Pattern", "re.Pattern"]:
+    return (
+        re.compile(r"<" + re.escape(tag_name) + r"[\s>/]", re.IGNORECASE),
+        re.compile(r"</" + re.escape(tag_name) + r"\s*>", re.IGNORECASE),
+    )
+
+
+def _find_closing_tag(html, tag_name, start_after):
+    """Find the matching closing tag for an element, handling nesting.
+
+    start_after: index in html right after the opening tag's '>'
+    Returns the index of the start of the matching </tag> or -1.
+    """
+    depth = 1
+    pos = start_after
+    open_pattern, close_pattern = _tag_patterns(tag_name.lower())
+
+    while depth > 0 and pos < len(html):
+        # Find the next opening or closing tag of same type
+        open_match = open_pattern.search(html, pos)
+        close_match = close_pattern.search(html, pos)
+
+        if close_match is None:
+            return -1  # Malformed HTML
+
+        if open_match is not None and open_match.start() < close_match.start():
+            # Check it's not a self-closing tag like <br/> or void element
+            # Find the end of this opening tag
+            tag_end = html.find(">", open_match.start())
+            if tag_end != -1 and html[tag_end - 1] == "/":
+                # Self-closing, skip it
+                pos = tag_end + 1
+            else:
+                depth += 1
+                pos = tag_end + 1 if tag_end != -1 else open_match.end()
+        else:
+            depth -= 1
+            if depth == 0:
+                return close_match.start()
+            pos = close_match.end()
+
+    return -1
+
+
+@lru_cache(maxsize=None)
+def _container_pattern(selector_type: str, selector: str) -> Optional["re.Pattern"]:
+    if selector_type == "id":
+        return re.compile(
+            r"<(\w+)\b[^>]*\bid\s*=\s*[\"']" + re.escape(selector) + r"[\"'][^>]*>",
+            re.DOTALL,
+        )
+    if selector_type == "class":
+        return re.compile(
+            r"<(\w+)\b[^>]*\bclass\s*=\s*[\"'][^\"']*\b"
+            + re.escape(selector)
+            + r"\b[^\"']*[\"'][^>]*>",
+            re.DOTALL,
+        )
+    return None
+
+
+def replace_container_content(html, selector_type, selector, new_content):
+    """Replace content inside a container element.
+
+    selector_type: 'id' or 'class'
+    selector: the id value or class name to match
+    new_content: HTML string to place inside the container
+
+    Returns the modified HTML string.
+    """
+    pattern = _container_pattern(selector_type, selector)
+    if pattern is None:
+        return html
+
+    match = pattern.search(html)
+    if not match:
+        return html
+
+    tag_name = match.group(1)
+    content_start = match.end()  # Right after the opening tag's '>'
+    closing_start = _find_closing_tag(html, tag_name, content_start)
+
+    if closing_start == -1:
+        return html
+
+    replacement = "\n" + new_content + "\n"
+    return html[:content_start] + replacement + html[closing_start:]
+
+
+def _find_slot(html: str, selector: str) -> Optional[Slot]:
+    match = _container_pattern("id", selector).search(html)
+    if not match:
+        return None
+    return match.start(), match.end(), _find_closing_tag(html, match.group(1), match.end())
+
+
+def slot_map(html: str, ids: Iterable[str]) -> Dict[str, Optional[Slot]]:
+    """Where each `#id` container sits in `html` (None if absent; closing start -1 if unclosed)."""
+    return {selector: _find_slot(html, selector) for selector in ids}
+
+
+def template_slots(page: str, html: str, ids: Iterable[str]) -> Dict[str, Optional[Slot]]:
+    """slot_map for a page template, from the build cache when the template is unchanged."""
+    ids = list(ids)
+    digest = sha256(html.encode("utf-8"))
+    code = file_sha256(__file__)
+    cache_path = get_build_cache_dir() / "templates" / f"{page}.json"
+    try:
+        cached = json_codec.load(cache_path)
+    except (OSError, ValueError):
+        cached = {}
+    if (
+        cached.get("version") == SLOTS_VERSION
+        and cached.get("sha256") == digest
+        and cached.get("code") == code
+        and all(selector in cached["slots"] for selector in ids)
+    ):
+        return {s: tuple(cached["slots"][s]) if cached["slots"][s] else None for s in ids}
+    slots = slot_map(html, ids)
+    write_json_if_changed(
+        cache_path, {"version": SLOTS_VERSION, "sha256": digest, "code": code, "slots": slots}, indent=None
+    )
+    return slots
+
+
+def _outer(html: str, slot: Optional[Slot]) -> Optional[Tuple[int, int]]:
+    """(start, end) of a whole element, opening tag through closing tag, or None."""
+    if not slot or slot[2] == -1:
+        return None
+    return slot[0], html.index(">", slot[2]) + 1
+
+
+def _spliceable(
+    slots: Dict[str, Optional[Slot]], fills: List[Tuple[str, str]], frame: Optional[Slot] = None
+) -> bool:
+    """True if one splice equals filling `fills` one after another (see module docstring)."""
+    found = sorted(slots[selector] for selector, _ in fills if slots[selector])
+    if any(closing == -1 for _, _, closing in found):
+        return False
+    if any(a[2] >= b[0] for a, b in zip(found, found[1:])):
+        return False  # nested or overlapping containers
+    if frame and any(start < frame[1] or closing > frame[2] for start, _, closing in found):
+        return False  # a container outside the kept element
+    for i, (_, content) in enumerate(fills):
+        for selector, _ in fills[i + 1 :]:
+            if f'"{selector}"' in content or f"'{selector}'" in content:
+                return False
+    return True
+
+
+def fill_containers(
+    page: str,
+    html: str,
+    fills: List[Tuple[str, str]],
+    frame: Optional[Tuple[str, str, str]] = None,
+) -> str:
+    """Replace the inner HTML of each `#id` container in `fills` ((id, content) pairs, in order).
+
+    Equivalent to replace_container_content for each pair in turn, but the
+    template is scanned at most once (see template_slots) and built in one pass.
+    With `frame` = (id, before, after), everything before the `#id` element is
+    then replaced by `before` and everything after it by `after` (the page is
+    left unframed if the element is missing).
+    """
+    ids = [selector for selector, _ in fills] + ([frame[0]] if frame else [])
+    slots = template_slots(page, html, ids)
+    kept = slots[frame[0]] if frame else None
+    if not _spliceable(slots, fills, kept):
+        for selector, content in fills:
+            html = replace_container_content(html, "id", selector, content)
+        if frame:
+            outer = _outer(html, _find_slot(html, frame[0]))
+            if outer:
+                html = frame[1] + html[outer[0] : outer[1]] + frame[2]
+        return html
+    outer = _outer(html, kept) if frame else None
+    return splice(html, slots, fills, (outer, frame[1], frame[2]) if outer else None)
+
+
+def splice(
+    html: str,
+    slots: Dict[str, Optional[Slot]],
+    fills: List[Tuple[str, str]],
+    frame: Optional[Tuple[Tuple[int, int], str, str]] = None,
+) -> str:
+    """`html` with the containers at `slots` filled from `fills`, in one pass.
+
+    `frame` = ((start, end), before, after) keeps only html[start:end] around
+    the containers, between `before` and `after`.
+    """
+    # The last fill of an id wins, as in the sequential replacements
+    contents = dict(fills)
+    (pos, end), before, after = frame or ((0, len(html)), "", "")
+    parts = [before]
+    for (_, start, closing), selector in sorted((slots[s], s) for s in contents if slots[s]):
+        parts += [html[pos:start], "\n", contents[selector], "\n"]
+        pos = closing
+    parts += [html[pos:end], after]
+    return "".join(parts)
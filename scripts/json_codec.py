@@ -0,0 +1,137 @@
+"""
+JSON encode/decode shared by the pipeline, post-processor and build.
+
+Uses orjson when it is installed and the stdlib json module otherwise; set
+JSON_CODEC=json to force the stdlib. Either way `dumps` returns exactly the
+text json.dumps would, so files written on a machine with orjson are
+byte-identical to those written without it. Calls orjson cannot reproduce
+exactly fall back to the stdlib:
+
+  - layouts other than indent=2 or compact separators, and ensure_ascii=True
+  - non-string dict keys and integers outside 64 bits (orjson raises)
+  - floats json writes in exponent form, i.e. below 1e-4 or from 1e16 up
+    (orjson writes 0.00001 and 1e16 where json writes 1e-05 and 1e+16)
+
+NaN and Infinity are not valid JSON and never appear in the data files; orjson
+would write them as null.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+if os.environ.get("JSON_CODEC", "").lower() == "json":
+    orjson = None
+
+BACKEND = "orjson" if orjson else "json"
+
+# Floats orjson writes differently from json: exponent form, or a magnitude
+# below 1e-4. Candidates are found with bytes.find (fast; also hits DOIs,
+# hashes, ...) and each is then checked to be a number token, not text.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789E", b"000000000e")
+_DRIFTING_FLOAT = re.compile(rb"-?(?:0\.0000|\d+(?:\.\d+)?[eE])")
+_NUMBER_CHARS = b"0123456789.-"
+_BEFORE_VALUE = b"[:,"
+
+
+def _is_drifting_float(out: bytes, pos: int) -> bool:
+    start = pos
+    while start > 0 and out[start - 1] in _NUMBER_CHARS:
+        start -= 1
+    if not _DRIFTING_FLOAT.match(out, start):
+        return False
+    before = start - 1
+    while before >= 0 and out[before] in b" \n":
+        before -= 1
+    return before < 0 or out[before] in _BEFORE_VALUE
+
+
+def _has_drifting_float(out: bytes) -> bool:
+    for haystack, needle in ((out.translate(_DIGITS_TO_ZERO), b"0e"), (out, b"0.0000")):
+        pos = haystack.find(needle)
+        while pos != -1:
+            if _is_drifting_float(out, pos):
+                return True
+            pos = haystack.find(needle, pos + 1)
+    return False
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            pass  # let json report the error, or parse what orjson won't
+    return json.loads(data)
+
+
+def load(path: Union[str, Path]) -> Any:
+    """Parse the JSON file at `path`."""
+    return loads(Path(path).read_bytes())
+
+
+def _orjson_dumps(obj: Any, indent, sort_keys, separators, default) -> Optional[bytes]:
+    """orjson output if it matches json.dumps for these arguments, else None."""
+    if indent == 2 and separators in (None, (",", ": ")):
+        option = orjson.OPT_INDENT_2
+    elif indent is None and separators == (",", ":"):
+        option = 0
+    else:
+        return None
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        out = orjson.dumps(obj, default=default, option=option)
+    except TypeError:
+        return None
+    if _has_drifting_float(out):
+        return None
+    return out
+
+
+def _encode(obj, indent, sort_keys, ensure_ascii, separators, default) -> Union[str, bytes]:
+    if orjson and not ensure_ascii:
+        out = _orjson_dumps(obj, indent, sort_keys, separators, default)
+        if out is not None:
+            return out
+    return json.dumps(
+        obj,
+        indent=indent,
+        sort_keys=sort_keys,
+        ensure_ascii=ensure_ascii,
+        separators=separators,
+        default=default,
+    )
+
+
+def dumps(
+    obj: Any,
+    indent: Optional[int] = 2,
+    sort_keys: bool = False,
+    ensure_ascii: bool = False,
+    separators: Optional[tuple] = None,
+    default: Optional[Callable] = None,
+) -> str:
+    """json.dumps(obj, ...) with this module's defaults (indent=2, ensure_ascii=False)."""
+    out = _encode(obj, indent, sort_keys, ensure_ascii, separators, default)
+    return out.decode("utf-8") if isinstance(out, bytes) else out
+
+
+def dumps_bytes(
+    obj: Any,
+    indent: Optional[int] = 2,
+    sort_keys: bool = False,
+    ensure_ascii: bool = False,
+    separators: Optional[tuple] = None,
+    default: Optional[Callable] = None,
+) -> bytes:
+    """`dumps` encoded as UTF-8, without a decode/encode round trip on orjson."""
+    out = _encode(obj, indent, sort_keys, ensure_ascii, separators, default)
+    return out if isinstance(out, bytes) else out.encode("utf-8")
@@ -0,0 +1,164 @@
+"""
+Shared keyword-based research-area classifier.
+
+The keyword map in CONFIG["categories"]["keywords_mapping"] is compiled once into
+a single trie-shaped regex (a compact automaton over the keyword alphabet), so a
+publication's text is scanned in one pass instead of one `keyword in text` scan
+per keyword. Results match the original per-keyword substring semantics exactly:
+each keyword counts at most once, overlapping keywords are all found, and ties
+between categories resolve in keyword-map order.
+
+Used by the ADS, OpenAlex and Google Scholar fetchers (researchArea), and by
+post-processing to fill keyword-based categoryProbabilities for papers that have
+no LLM categorization yet.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config import CONFIG
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """Build a regex alternation shaped like a trie over `words`.
+
+    Shared prefixes are factored out ("monte carlo" / "mcmc" -> "m(?:cmc|onte carlo)"),
+    and longer continuations are tried before the end-of-word branch so the regex
+    reports the longest keyword starting at each position.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def emit(node: Dict) -> str:
+        branches = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if "" in node:
+            if not branches:
+                return ""
+            return "(?:" + "|".join(branches) + ")?"
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return emit(trie)
+
+
+class KeywordClassifier:
+    """Compiled keyword-map classifier producing researchArea + categoryProbabilities."""
+
+    def __init__(
+        self,
+        keywords_mapping: Optional[Dict[str, str]] = None,
+        default_category: Optional[str] = None,
+    ):
+        categories_config = CONFIG["categories"]
+        if keywords_mapping is None:
+            keywords_mapping = categories_config["keywords_mapping"]
+        if default_category is None:
+            default_category = categories_config["default_category"]
+
+        self.default_category = default_category
+
+        # Keywords are matched against lowercased text, so compile lowercased keys;
+        # keep the first mapping (and its position) if two keys collide.
+        self._keyword_category: Dict[str, str] = {}
+        self._keyword_rank: Dict[str, int] = {}
+        for keyword, category in keywords_mapping.items():
+            key = keyword.lower()
+            if key and key not in self._keyword_category:
+                self._keyword_rank[key] = len(self._keyword_rank)
+                self._keyword_category[key] = category
+
+        # Category order for probability dicts: keyword-map order, then the default
+        self.categories: List[str] = list(dict.fromkeys(self._keyword_category.values()))
+        if default_category not in self.categories:
+            self.categories.append(default_category)
+
+        # Every keyword that also matches wherever a longer keyword matches at the
+        # same position is a prefix of it; precompute those so one regex hit per
+        # position recovers all keywords starting there.
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            key: tuple(k for k in self._keyword_category if key.startswith(k))
+            for key in self._keyword_category
+        }
+
+        pattern = _trie_pattern(list(self._keyword_category))
+        self._regex = re.compile(pattern) if pattern else None
+
+    @property
+    def size(self) -> int:
+        """Number of distinct keywords compiled into the automaton."""
+        return len(self._keyword_category)
+
+    def match(self, text: str) -> List[str]:
+        """Return the distinct keywords found in (already lowercased) `text`, in map order."""
+        if self._regex is None or not text:
+            return []
+        found = set()
+        search = self._regex.search
+        m = search(text)
+        while m:
+            found.update(self._prefixes[m.group()])
+            # Resume one character later (not at m.end()) so overlapping keywords match
+            m = search(text, m.start() + 1)
+        return sorted(found, key=self._keyword_rank.__getitem__)
+
+    def scores(
+        self, title: str, abstract: str = "", keywords: Iterable[str] = ()
+    ) -> Dict[str, int]:
+        """Count matching keywords per category (insertion order = keyword-map order)."""
+        text = f"{title} {abstract} {' '.join(keywords)}".lower()
+        category_scores: Dict[str, int] = {}
+        for keyword in self.match(text):
+            category = self._keyword_category[keyword]
+            category_scores[category] = category_scores.get(category, 0) + 1
+        return category_scores
+
+    def classify(self, title: str, abstract: str = "", keywords: Iterable[str] = ()) -> str:
+        """Return the research area with the highest keyword score, or the default."""
+        category_scores = self.scores(title, abstract, keywords)
+        if category_scores:
+            return max(category_scores, key=category_scores.get)
+        return self.default_category
+
+    def probabilities(
+        self, title: str, abstract: str = "", keywords: Iterable[str] = ()
+    ) -> Dict[str, float]:
+        """Return a categoryProbabilities-shaped dict (every category, summing to 1)."""
+        return self._to_probabilities(self.scores(title, abstract, keywords))
+
+    def classify_publications(
+        self, publications: Iterable[Dict]
+    ) -> Iterator[Tuple[str, Dict[str, float]]]:
+        """Stream (researchArea, categoryProbabilities) for each publication dict."""
+        for pub in publications:
+            category_scores = self.scores(
+                pub.get("title", "") or "",
+                pub.get("abstract", "") or "",
+                pub.get("keywords", []) or [],
+            )
+            if category_scores:
+                area = max(category_scores, key=category_scores.get)
+            else:
+                area = self.default_category
+            yield area, self._to_probabilities(category_scores)
+
+    def _to_probabilities(self, category_scores: Dict[str, int]) -> Dict[str, float]:
+        total = sum(category_scores.values())
+        if not total:
+            return {c: (1.0 if c == self.default_category else 0.0) for c in self.categories}
+        return {c: round(category_scores.get(c, 0) / total, 4) for c in self.categories}
+
+
+_default_classifier: Optional[KeywordClassifier] = None
+
+
+def get_classifier() -> KeywordClassifier:
+    """Return the process-wide classifier compiled from CONFIG (built on first use)."""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = KeywordClassifier()
+    return _default_classifier
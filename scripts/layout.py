@@ -0,0 +1,209 @@
+"""
+Shared chrome for the redesign pages: <head>, nav, footer and scripts.
+
+The page shells used to carry ten copies of the same head, nav markup, inline
+theme and hamburger-menu scripts and footer. The chrome is now defined once
+here. build_html keeps each shell's <main id="main-content"> element (the
+page's own markup, its content containers filled) and replaces everything
+around it with `Layout.frame(page)`.
+
+Per-page head metadata (title, description, og:description) and the footer
+line come from content.json `site`; the scripts and preloads a page needs
+from PAGE_SCRIPTS and PAGE_PRELOADS. The theme toggle and mobile menu live in
+assets/js/redesign/nav.js, one cacheable file shared by every page. Only the
+one-line theme bootstrap stays inline in <head>, since it must run before
+first paint. 404.html is hand-written (absolute paths, reduced nav); only its
+footer is built, by `Layout.refooter`.
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from build_manifest import content_digest
+from pages_shared import esc, url_attr
+
+MAIN_ID = "main-content"
+
+# Top-level nav: a page link, or a menu of (label, page or external URL)
+NAV: Sequence[Tuple[str, object]] = (
+    ("Home", "index"),
+    ("Research", (("Publications", "publications"), ("Software", "software"), ("Talks", "talks"))),
+    (
+        "Teaching & Mentoring",
+        (("Teaching", "teaching"), ("Mentorship", "mentorship"), ("Group / ART", "https://astrostatuoft.com/")),
+    ),
+    ("About", (("Biography", "biography"), ("News", "news"), ("Awards", "awards"), ("Service", "service"))),
+)
+
+PAGE_SCRIPTS: Dict[str, List[str]] = {
+    "index": ["hero.js"],
+    "publications": ["publications.js", "pubchart.js"],
+    "mentorship": ["mentorgroups.js"],
+    "talks": ["listview.js"],
+    "teaching": ["listview.js"],
+    "awards": ["listview.js"],
+    "service": ["listview.js"],
+    "software": ["listview.js"],
+    "news": ["listview.js"],
+}
+PAGE_PRELOADS: Dict[str, List[str]] = {
+    "index": ["assets/images/hero-posterior-dark.webp"],
+}
+
+THEME_COLOR = "#06080f"
+_THEME_BOOTSTRAP = (
+    "<script>(function () { var t = localStorage.getItem('preferred-theme') || 'dark'; "
+    "document.documentElement.setAttribute('data-theme', t); })();</script>"
+)
+_JS = "assets/js/redesign/"
+_FOOTER = re.compile(r'^  <footer class="site-footer">.*?</footer>\n', re.S | re.M)
+
+
+def page_url(page: str) -> str:
+    return "index.html" if page == "index" else f"{page}.html"
+
+
+class Layout:
+    """The chrome rendered once per build from content.json `site`.
+
+    The head tail, nav and footers are rendered here; `frame(page)` only
+    joins them with the page's metadata. `digest` is the digest of `site`,
+    the content every page's chrome depends on.
+    """
+
+    def __init__(self, site: Dict):
+        self.site = site
+        self.digest = content_digest(site)
+        self._head_tail = self._render_head_tail()
+        self._nav = self._render_nav()
+        self._footers: Dict[str, str] = {}
+
+    def _render_head_tail(self) -> str:
+        return (
+            '  <link rel="icon" href="favicon.svg" type="image/svg+xml">\n'
+            '  <link rel="icon" href="favicon-32x32.png" sizes="32x32" type="image/png">\n'
+            '  <link rel="icon" href="favicon-16x16.png" sizes="16x16" type="image/png">\n'
+            '  <link rel="apple-touch-icon" href="apple-touch-icon.png">\n'
+            '  <link rel="manifest" href="site.webmanifest">\n'
+            f'  <meta name="theme-color" content="{THEME_COLOR}">\n\n'
+            f"  {_THEME_BOOTSTRAP}\n\n"
+            '  <link rel="stylesheet" href="assets/css/fonts.css">\n'
+            '  <link rel="stylesheet" href="assets/css/tokens.css">\n'
+            '  <link rel="stylesheet" href="assets/css/redesign.css">\n'
+        )
+
+    def _render_nav(self) -> List[Tuple[Optional[str], str]]:
+        """The nav as (page, link) segments; a page's link gains aria-current on that page."""
+        name, cv = esc(self.site.get("name", "")), url_attr(self.site.get("cv", ""))
+        parts: List[Tuple[Optional[str], str]] = [(None, (
+            '  <nav class="nav" aria-label="Primary">\n'
+            f'    <a class="brand" href="index.html"><span class="star" aria-hidden="true">✦</span>{name}</a>\n'
+            '    <div class="nav-links">\n'
+        ))]
+        for label, target in NAV:
+            if isinstance(target, str):
+                parts += [(None, '      <a class="nav-item" '), (target, f'href="{page_url(target)}"'),
+                          (None, f">{esc(label)}</a>\n")]
+                continue
+            parts.append((None, (
+                '      <div class="nav-group"><button class="nav-trigger" aria-haspopup="true" '
+                f'aria-expanded="false">{esc(label)} <span aria-hidden="true">▾</span></button>\n'
+                '        <div class="menu">'
+            )))
+            for item, page in target:
+                if page.startswith("https://"):
+                    parts.append((None, (
+                        f'<a href="{url_attr(page)}" target="_blank" rel="noopener">{esc(item)} '
+                        '<span aria-hidden="true">↗</span></a>'
+                    )))
+                else:
+                    parts += [(None, "<a "), (page, f'href="{page_url(page)}"'), (None, f">{esc(item)}</a>")]
+            parts.append((None, "</div></div>\n"))
+        parts.append((None, (
+            f'      <a class="nav-item cv-mobile" href="{cv}">Curriculum Vitae</a>\n'
+            "    </div>\n"
+            '    <div style="display:flex;align-items:center;gap:12px">\n'
+            f'      <a class="cv-btn" href="{cv}">Curriculum Vitae</a>\n'
+            '      <button class="theme-toggle" id="theme-toggle" type="button" '
+            'aria-label="Toggle dark/light mode">☾</button>\n'
+            '      <button class="theme-toggle hamburger" id="hamburger" type="button" '
+            'aria-label="Open menu">☰</button>\n'
+            "    </div>\n"
+            "  </nav>\n"
+        )))
+        return parts
+
+    def nav(self, page: str) -> str:
+        return "".join(
+            html + ' aria-current="page"' if target == page else html for target, html in self._nav
+        )
+
+    def footer(self, line: str) -> str:
+        if line not in self._footers:
+            self._footers[line] = (
+                '  <footer class="site-footer">\n'
+                '    <div class="container">\n'
+                f'      <span>{esc(self.site.get("copyright", ""))} · '
+                f'<span class="zh">{esc(self.site.get("altName", ""))}</span></span>\n'
+                f"      <span>{esc(line)}</span>\n"
+                "    </div>\n"
+                "  </footer>\n"
+            )
+        return self._footers[line]
+
+    def refooter(self, html: str) -> str:
+        """A hand-written page's `html` with its site footer replaced by the built one."""
+        footer = self.footer(self.site.get("footer", ""))
+        html, count = _FOOTER.subn(lambda m: footer, html, count=1)
+        if not count:
+            raise ValueError('no <footer class="site-footer"> to replace')
+        return html
+
+    def head(self, page: str) -> str:
+        meta = self.site.get("pages", {}).get(page, {})
+        title = esc(meta.get("title", ""))
+        url = url_attr(self.site.get("url", "") + ("" if page == "index" else page_url(page)))
+        image = url_attr(self.site.get("url", "") + self.site.get("image", ""))
+        preloads = "".join(
+            f'  <link rel="preload" as="image" href="{url_attr(src)}">\n' for src in PAGE_PRELOADS.get(page, ())
+        )
+        return (
+            "<head>\n"
+            '  <meta charset="UTF-8">\n'
+            '  <meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+            f"  <title>{title}</title>\n"
+            f'  <meta name="description" content="{url_attr(meta.get("description", ""))}">\n'
+            f'  <link rel="canonical" href="{url}">\n'
+            '  <meta property="og:type" content="website">\n'
+            f'  <meta property="og:site_name" content="{url_attr(self.site.get("name", ""))}">\n'
+            '  <meta property="og:locale" content="en_US">\n'
+            f'  <meta property="og:title" content="{url_attr(meta.get("title", ""))}">\n'
+            f'  <meta property="og:description" content="{url_attr(meta.get("ogDescription", ""))}">\n'
+            f'  <meta property="og:url" content="{url}">\n'
+            f'  <meta property="og:image" content="{image}">\n'
+            '  <meta name="twitter:card" content="summary_large_image">\n'
+            f'  <meta name="twitter:image" content="{image}">\n\n'
+            + self._head_tail
+            + preloads
+            + "</head>\n"
+        )
+
+    def frame(self, page: str) -> Tuple[str, str]:
+        """The markup before and after a page's <main> element."""
+        meta = self.site.get("pages", {}).get(page, {})
+        scripts = [_JS + "nav.js"] + [_JS + name for name in PAGE_SCRIPTS.get(page, ())]
+        before = (
+            '<!DOCTYPE html>\n<html lang="en" data-theme="dark">\n'
+            + self.head(page)
+            + f'\n<body>\n  <a class="skip-link" href="#{MAIN_ID}">Skip to main content</a>\n\n'
+            + self.nav(page)
+            + "\n  "
+        )
+        after = (
+            "\n\n"
+            + self.footer(meta.get("footer") or self.site.get("footer", ""))
+            + "\n"
+            + "".join(f'  <script src="{src}" defer></script>\n' for src in scripts)
+            + "</body>\n</html>\n"
+        )
+        return before, after
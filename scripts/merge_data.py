@@ -8,19 +8,225 @@ This module handles:
 - Validation and reporting of potential formatting issues
 """
 
-import json
 import logging
 import os
+import re
 import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from difflib import SequenceMatcher
+import json_codec
 from config import CONFIG
+from near_duplicates import near_duplicate_clusters
+from publication import Publication, json_default
+from text_normalize import (
+    clean_math_notation,
+    math_notation_issues,
+    normalize_title,
+    normalize_titles,
+)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Minimum similarity for a source record to match a base paper (2/3rds)
+MATCH_THRESHOLD = 0.67
+
+_ARXIV_VERSION = re.compile(r"v\d+$")
+
+# (normalized title, year, DOI, arXiv ID, bibcode) -- see DataMerger._match_key
+MatchKey = Tuple[str, object, str, str, str]
+
+
+def _similarity(key1: MatchKey, key2: MatchKey) -> float:
+    """Similarity of two papers from their match keys (see _calculate_similarity)."""
+    title1, year1, doi1, arxiv1, bib1 = key1
+    title2, year2, doi2, arxiv2, bib2 = key2
+    # Any single exact identifier match is a definitive join key
+    if (doi1 and doi1 == doi2) or (bib1 and bib1 == bib2) or (arxiv1 and arxiv1 == arxiv2):
+        return 1.0
+    title_score = SequenceMatcher(None, title1, title2).ratio()
+    year_score = 1.0 if year1 == year2 else 0.0
+    return 0.7 * title_score + 0.3 * year_score
+
+
+def _best_match_index(target: MatchKey, candidates: Sequence[MatchKey]) -> Optional[int]:
+    """Index of the first highest-scoring candidate at or above MATCH_THRESHOLD."""
+    best_idx = None
+    best_score = 0
+    for i, key in enumerate(candidates):
+        score = _similarity(target, key)
+        if score > best_score and score >= MATCH_THRESHOLD:
+            best_score = score
+            best_idx = i
+    return best_idx
+
+
+# Source match keys, set once per pool worker by _init_match_worker
+_worker_sources: List[List[MatchKey]] = []
+
+
+def _init_match_worker(source_keys: List[List[MatchKey]]):
+    global _worker_sources
+    _worker_sources = source_keys
+
+
+def _match_block(base_keys: List[MatchKey]) -> List[Tuple[Optional[int], ...]]:
+    """Best match index in each source for every base key of one block (pool task)."""
+    return [
+        tuple(_best_match_index(key, source) for source in _worker_sources)
+        for key in base_keys
+    ]
+
+
+# Minimum (exclusive) similarity for the legacy two-source merge. Above 0.7 a
+# pair can only qualify through an identifier or a same-year title match.
+LEGACY_MATCH_THRESHOLD = 0.8
+
+
+def _candidate_pairs(
+    left: Sequence[MatchKey], right: Sequence[MatchKey], threshold: float
+) -> Dict[Tuple[int, int], float]:
+    """Every (left, right) pair scoring above `threshold` (> 0.7), with its score.
+
+    Instead of scoring all pairs, candidates come from an identifier index
+    (DOI, arXiv ID, bibcode) and from same-year buckets of titles sorted by
+    length: a title ratio of r needs lengths within a factor of (2 - r) / r, and
+    SequenceMatcher.quick_ratio() bounds the ratio before the full comparison.
+    The pruning is exact -- no pair above the threshold is skipped.
+    """
+    pairs: Dict[Tuple[int, int], float] = {}
+    by_id: Dict[Tuple[int, str], List[int]] = {}
+    for j, key in enumerate(right):
+        for field in (2, 3, 4):
+            if key[field]:
+                by_id.setdefault((field, key[field]), []).append(j)
+    for i, key in enumerate(left):
+        for field in (2, 3, 4):
+            for j in by_id.get((field, key[field]), ()) if key[field] else ():
+                pairs[(i, j)] = 1.0
+
+    # Without an identifier, score = 0.7 x title + 0.3 x same year
+    min_title = (threshold - 0.3) / 0.7
+    buckets: Dict[object, List[Tuple[int, int]]] = {}
+    for j, key in enumerate(right):
+        buckets.setdefault(key[1], []).append((len(key[0]), j))
+    for bucket in buckets.values():
+        bucket.sort()
+    lengths = {year: [n for n, _ in bucket] for year, bucket in buckets.items()}
+    matcher = SequenceMatcher(None)
+    for i, key in enumerate(left):
+        bucket = buckets.get(key[1])
+        if not bucket:
+            continue
+        n = len(key[0])
+        lo = bisect_left(lengths[key[1]], n * min_title / (2 - min_title))
+        hi = bisect_right(lengths[key[1]], n * (2 - min_title) / min_title)
+        matcher.set_seq2(key[0])  # the matcher caches its analysis of seq2
+        for _, j in bucket[lo:hi]:
+            if (i, j) in pairs:
+                continue
+            matcher.set_seq1(right[j][0])
+            if matcher.quick_ratio() * 0.7 + 0.3 <= threshold:
+                continue
+            score = _similarity(key, right[j])
+            if score > threshold:
+                pairs[(i, j)] = score
+    return pairs
+
+
+def _min_cost_assignment(cost: List[List[float]]) -> List[int]:
+    """Column assigned to each row minimizing total cost (Hungarian method).
+
+    `cost` is n x m with n <= m; runs in O(n^2 m).
+    """
+    n, m = len(cost), len(cost[0])
+    inf = float("inf")
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    owner = [0] * (m + 1)  # row (1-based) holding each column; column 0 is the root
+    way = [0] * (m + 1)
+    for row in range(1, n + 1):
+        owner[0] = row
+        col = 0
+        min_slack = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while owner[col]:
+            used[col] = True
+            r = owner[col]
+            delta, next_col = inf, 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    slack = cost[r - 1][j - 1] - u[r] - v[j]
+                    if slack < min_slack[j]:
+                        min_slack[j] = slack
+                        way[j] = col
+                    if min_slack[j] < delta:
+                        delta, next_col = min_slack[j], j
+            for j in range(m + 1):
+                if used[j]:
+                    u[owner[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_slack[j] -= delta
+            col = next_col
+        # Flip the augmenting path back to the root
+        while col:
+            prev = way[col]
+            owner[col] = owner[prev]
+            col = prev
+    assigned = [-1] * n
+    for j in range(1, m + 1):
+        if owner[j]:
+            assigned[owner[j] - 1] = j - 1
+    return assigned
+
+
+def _max_weight_matching(pairs: Dict[Tuple[int, int], float]) -> Dict[int, Tuple[int, float]]:
+    """One-to-one matching of candidate pairs with the largest total score.
+
+    Returns left index -> (right index, score). The candidate graph is split
+    into connected components and each is solved exactly by _min_cost_assignment;
+    nearly all components are a single pair.
+    """
+    parent: Dict[Tuple[str, int], Tuple[str, int]] = {}
+
+    def root(node):
+        while parent.setdefault(node, node) != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for i, j in pairs:
+        parent[root(("l", i))] = root(("r", j))
+    components: Dict[Tuple[str, int], List[Tuple[int, int]]] = {}
+    for i, j in pairs:
+        components.setdefault(root(("l", i)), []).append((i, j))
+
+    matches: Dict[int, Tuple[int, float]] = {}
+    for edges in components.values():
+        if len(edges) == 1:
+            i, j = edges[0]
+            matches[i] = (j, pairs[(i, j)])
+            continue
+        rows = sorted({i for i, _ in edges})
+        cols = sorted({j for _, j in edges})
+        flip = len(rows) > len(cols)
+        if flip:
+            rows, cols = cols, rows
+        # Non-edges cost 0, so a row left on one means "unmatched"
+        cost = [
+            [-pairs.get((c, r) if flip else (r, c), 0.0) for c in cols] for r in rows
+        ]
+        for r, c in enumerate(_min_cost_assignment(cost)):
+            i, j = (cols[c], rows[r]) if flip else (rows[r], cols[c])
+            if (i, j) in pairs:
+                matches[i] = (j, pairs[(i, j)])
+    return matches
+
 
 class DataMerger:
     """Merges and consolidates publication data from multiple sources."""
@@ -28,6 +234,7 @@ class DataMerger:
     def __init__(self):
         self.config = CONFIG
         self.validation = CONFIG["validation"]
+        self.duplicate_report: Optional[Dict] = None  # set by _check_for_duplicates
 
     def merge_publications_multisource(
         self,
@@ -35,25 +242,32 @@ class DataMerger:
         scholar_data: List[Dict],
         ads_data: List[Dict],
         openalex_data: List[Dict],
+        workers: Optional[int] = None,
     ) -> List[Dict]:
-        """Merge publication data from multiple sources."""
+        """Merge publication data from multiple sources.
+
+        Matching every base paper against every source record dominates the cost
+        on large corpora, so from CONFIG["merge"]["parallel_threshold"] base
+        papers up it runs on a process pool (`workers` processes, default from
+        CONFIG; 1 forces the serial path). The result is identical either way.
+        """
         logger.info(
             f"Merging data from {len(scholar_data)} Scholar, {len(ads_data)} ADS, and {len(openalex_data)} OpenAlex papers"
         )
         logger.debug(f"Starting with {len(paper_list)} papers in paper_list")
 
-        merged_publications = []
+        sources = (scholar_data, ads_data, openalex_data)
+        base = [paper for paper in paper_list if paper.get("title", "").strip()]
+        matches = self._match_sources(base, sources, workers)
 
-        # Process each paper from the original list
-        for i, paper in enumerate(paper_list):
-            title = paper.get("title", "").strip()
-            if not title:
-                continue
+        merged_publications = []
 
-            # Find matches in each source
-            scholar_match = self._find_best_match(paper, scholar_data)
-            ads_match = self._find_best_match(paper, ads_data)
-            openalex_match = self._find_best_match(paper, openalex_data)
+        # Merge each paper from the original list with its matches, in order
+        for paper, match_idx in zip(base, matches):
+            scholar_match, ads_match, openalex_match = (
+                source[i] if i is not None else None
+                for source, i in zip(sources, match_idx)
+            )
 
             # Merge data from all available sources
             merged_paper = self._merge_multisource(
@@ -84,6 +298,37 @@ class DataMerger:
             cleaned_publications, key=lambda x: x.get("year", 0), reverse=True
         )
 
+    def _match_sources(
+        self, base: List[Dict], sources: Sequence[List[Dict]], workers: Optional[int] = None
+    ) -> List[Tuple[Optional[int], ...]]:
+        """For each base paper, the index of its best match in each source (or None).
+
+        Match keys are computed once per record; blocks of base keys are matched
+        serially or on a process pool, and the results are reassembled in order.
+        """
+        settings = self.config["merge"]
+        if workers is None:
+            workers = settings["workers"] or os.cpu_count() or 1
+        source_keys = [[self._match_key(p) for p in source] for source in sources]
+        base_keys = [self._match_key(p) for p in base]
+
+        if workers <= 1 or len(base_keys) < settings["parallel_threshold"]:
+            _init_match_worker(source_keys)
+            try:
+                return _match_block(base_keys)
+            finally:
+                _init_match_worker([])
+
+        size = settings["block_size"]
+        blocks = [base_keys[i : i + size] for i in range(0, len(base_keys), size)]
+        logger.info(
+            f"Matching {len(base_keys)} papers in {len(blocks)} blocks on {workers} processes"
+        )
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_match_worker, initargs=(source_keys,)
+        ) as pool:
+            return [match for block in pool.map(_match_block, blocks) for match in block]
+
     def _find_best_match(
         self, target_paper: Dict, source_data: List[Dict]
     ) -> Optional[Dict]:
@@ -92,16 +337,10 @@ class DataMerger:
         if not target_title:
             return None
 
-        best_match = None
-        best_score = 0
-
-        for paper in source_data:
-            score = self._calculate_similarity(target_paper, paper)
-            if score > best_score and score >= 0.67:  # Minimum threshold (2/3rds)
-                best_score = score
-                best_match = paper
-
-        return best_match
+        idx = _best_match_index(
+            self._match_key(target_paper), [self._match_key(p) for p in source_data]
+        )
+        return source_data[idx] if idx is not None else None
 
     def _merge_multisource(
         self,
@@ -111,7 +350,7 @@ class DataMerger:
         openalex_data: Optional[Dict],
     ) -> Dict:
         """Merge a paper's data from multiple sources."""
-        merged = {}
+        merged = Publication()
 
         # Start with base paper data
         merged.update(base_paper)
@@ -139,7 +378,7 @@ class DataMerger:
             # Merge keywords
             existing_keywords = set(merged.get("keywords", []))
             openalex_keywords = set(openalex_data.get("keywords", []))
-            merged["keywords"] = list(existing_keywords | openalex_keywords)
+            merged["keywords"] = sorted(existing_keywords | openalex_keywords)
 
             sources_found.append("openalex")
             citations_by_source["openalex"] = openalex_data.get("citations", 0)
@@ -173,8 +412,8 @@ class DataMerger:
         else:
             merged["citations"] = merged.get("citations", 0)
 
-        # Remove duplicates from sources
-        merged["sources"] = list(set(sources_found))
+        # Remove duplicates from sources (sorted so output is deterministic)
+        merged["sources"] = sorted(set(sources_found))
 
         # Ensure we have essential fields
         if not merged.get("title"):
@@ -185,37 +424,36 @@ class DataMerger:
     def merge_publications(
         self, scholar_data: List[Dict], ads_data: List[Dict]
     ) -> List[Dict]:
-        """Legacy merge function for backward compatibility."""
+        """Legacy merge function for backward compatibility.
+
+        ADS and Scholar records are paired one-to-one so the total similarity
+        of the matched pairs is maximal (not greedily in ADS order); only
+        pairs scoring above LEGACY_MATCH_THRESHOLD are candidates.
+        """
         logger.info(
             f"Merging {len(scholar_data)} Scholar papers with {len(ads_data)} ADS papers"
         )
 
+        pairs = _candidate_pairs(
+            [self._match_key(p) for p in ads_data],
+            [self._match_key(p) for p in scholar_data],
+            LEGACY_MATCH_THRESHOLD,
+        )
+        matches = _max_weight_matching(pairs)
+        logger.info(f"{len(pairs)} candidate pairs, {len(matches)} matched")
+
         merged_publications = []
         scholar_used = set()
 
-        # First pass: match ADS papers with Scholar papers
-        for ads_pub in ads_data:
-            best_match = None
-            best_score = 0
-            best_scholar_idx = -1
-
-            for i, scholar_pub in enumerate(scholar_data):
-                if i in scholar_used:
-                    continue
-
-                score = self._calculate_similarity(ads_pub, scholar_pub)
-                if score > best_score and score > 0.8:  # Threshold for matching
-                    best_score = score
-                    best_match = scholar_pub
-                    best_scholar_idx = i
-
-            if best_match:
-                # Merge the two publications
-                merged_pub = self._merge_publications(ads_pub, best_match)
+        # First pass: merge matched ADS papers with their Scholar papers
+        for i, ads_pub in enumerate(ads_data):
+            if i in matches:
+                scholar_idx, score = matches[i]
+                merged_pub = self._merge_publications(ads_pub, scholar_data[scholar_idx])
                 merged_publications.append(merged_pub)
-                scholar_used.add(best_scholar_idx)
+                scholar_used.add(scholar_idx)
                 logger.debug(
-                    f"Merged: {merged_pub['title'][:50]}... (score: {best_score:.2f})"
+                    f"Merged: {merged_pub['title'][:50]}... (score: {score:.2f})"
                 )
             else:
                 # Add ADS-only publication
@@ -254,11 +492,10 @@ class DataMerger:
     @staticmethod
     def _norm_arxiv(arxiv) -> str:
         """Normalize an arXiv id (drop `arxiv:` prefix and any trailing version, e.g. v2)."""
-        import re
         arxiv = (arxiv or "").strip().lower()
         if arxiv.startswith("arxiv:"):
             arxiv = arxiv[len("arxiv:"):]
-        arxiv = re.sub(r"v\d+$", "", arxiv.strip())
+        arxiv = _ARXIV_VERSION.sub("", arxiv.strip())
         return arxiv.strip()
 
     @staticmethod
@@ -266,231 +503,138 @@ class DataMerger:
         """Normalize an ADS bibcode for comparison (strip only; bibcodes are case-sensitive)."""
         return (bibcode or "").strip()
 
-    def _calculate_similarity(self, pub1: Dict, pub2: Dict) -> float:
-        """Calculate similarity score between two publications."""
-        title1 = self._normalize_title(pub1.get("title", ""))
-        title2 = self._normalize_title(pub2.get("title", ""))
-
-        # Title similarity (most important)
-        title_score = SequenceMatcher(None, title1, title2).ratio()
-
-        # Year similarity
-        year1 = pub1.get("year")
-        year2 = pub2.get("year")
-        year_score = 1.0 if year1 == year2 else 0.0
-
-        # Identifier matching (if available). Identifiers are normalized so that
-        # differing source conventions (URL-prefixed DOIs, "arXiv:" prefixes,
-        # version suffixes, stray case/whitespace) still join. Any single exact
-        # identifier match is treated as a definitive join key. Note the `or ""`
-        # guards: a source may carry the key with an explicit None value, which
-        # would otherwise raise AttributeError on .lower()/.strip().
-        identifier_score = 0.0
-        doi1, doi2 = self._norm_doi(pub1.get("doi")), self._norm_doi(pub2.get("doi"))
-        arxiv1, arxiv2 = self._norm_arxiv(pub1.get("arxivId")), self._norm_arxiv(pub2.get("arxivId"))
-        bib1, bib2 = self._norm_bibcode(pub1.get("bibcode")), self._norm_bibcode(pub2.get("bibcode"))
-
-        if doi1 and doi2 and doi1 == doi2:
-            identifier_score = 1.0
-        elif bib1 and bib2 and bib1 == bib2:
-            identifier_score = 1.0
-        elif arxiv1 and arxiv2 and arxiv1 == arxiv2:
-            identifier_score = 1.0
-
-        # Weighted combination
-        if identifier_score > 0:
-            return identifier_score  # Perfect match via identifier
-        else:
-            return 0.7 * title_score + 0.3 * year_score
-
-    def _normalize_title(self, title: str) -> str:
-        """Normalize title for comparison."""
-        import re
-        import html
-
-        # Step 1: Handle double-encoded HTML entities (&amp;lt; → &lt; → <)
-        # Decode multiple times to handle nested encoding
-        prev_title = ""
-        while prev_title != title:
-            prev_title = title
-            title = html.unescape(title)
+    def _match_key(self, pub: Dict) -> MatchKey:
+        """The normalized fields similarity is computed from.
+
+        Identifiers are normalized so that differing source conventions
+        (URL-prefixed DOIs, "arXiv:" prefixes, version suffixes, stray
+        case/whitespace) still join. The normalizers' `or ""` guards matter: a
+        source may carry a key with an explicit None value.
+        """
+        return (
+            normalize_title(pub.get("title", "")),
+            pub.get("year"),
+            self._norm_doi(pub.get("doi")),
+            self._norm_arxiv(pub.get("arxivId")),
+            self._norm_bibcode(pub.get("bibcode")),
+        )
 
-        # Step 2: Strip HTML tags (<i>z</i> → z)
-        title = re.sub(r"<[^>]+>", "", title)
+    def _calculate_similarity(self, pub1: Dict, pub2: Dict) -> float:
+        """Calculate similarity score between two publications.
 
-        # Step 3: Standard normalization - remove punctuation and convert to lowercase
-        title = re.sub(r"[^\w\s]", "", title.lower())
-        title = re.sub(r"\s+", " ", title).strip()
-        return title
+        Any single exact identifier match (DOI, bibcode, arXiv ID) is a perfect
+        match; otherwise 0.7 x title similarity + 0.3 x same year.
+        """
+        return _similarity(self._match_key(pub1), self._match_key(pub2))
 
     def clean_mathematical_notation(self, title: str) -> str:
         """Clean up mathematical notation formatting for web display."""
-        import re
-        
-        # Remove spaces before subscript/superscript tags
-        title = re.sub(r'σ\s+<SUB>', r'σ<SUB>', title)
-        title = re.sub(r'σ\s+<SUP>', r'σ<SUP>', title)
-        
-        # General fix for any Greek letter followed by space + subscript/superscript
-        title = re.sub(r'([α-ωΑ-Ω])\s+<SUB>', r'\1<SUB>', title)
-        title = re.sub(r'([α-ωΑ-Ω])\s+<SUP>', r'\1<SUP>', title)
-        
-        # Fix other common mathematical notation (Latin letters)
-        title = re.sub(r'([A-Za-z])\s+<SUB>', r'\1<SUB>', title)
-        title = re.sub(r'([A-Za-z])\s+<SUP>', r'\1<SUP>', title)
-        
-        # Fix common mathematical constants and variables
-        title = re.sub(r'H\s+<SUB>0</SUB>', r'H<SUB>0</SUB>', title)  # Hubble constant
-        title = re.sub(r'Ω\s+<SUB>m</SUB>', r'Ω<SUB>m</SUB>', title)  # Omega matter
-        title = re.sub(r'M\s+<SUB>☉</SUB>', r'M<SUB>☉</SUB>', title)  # Solar mass
-        
-        return title
+        return clean_math_notation(title)
 
     def validate_mathematical_notation(self, publications: List[Dict]) -> List[Dict]:
         """Check for potential mathematical notation formatting issues."""
-        import re
-        
-        issues = []
-        
-        for pub in publications:
-            title = pub.get('title', '')
-            
-            # Check for spaces before sub/sup tags
-            if re.search(r'\s+<SUB>', title) or re.search(r'\s+<SUP>', title):
-                issues.append({
-                    'id': pub.get('id', pub.get('bibcode', 'unknown')),
-                    'title': title,
-                    'issue': 'Space before subscript/superscript'
-                })
-                
-            # Check for Greek letters followed by space and numbers (potential σ 8 cases)
-            if re.search(r'[α-ωΑ-Ω]\s+\d', title):
-                issues.append({
-                    'id': pub.get('id', pub.get('bibcode', 'unknown')), 
-                    'title': title,
-                    'issue': 'Possible mathematical notation with space'
-                })
-        
+        issues = [
+            {
+                "id": pub.get("id", pub.get("bibcode", "unknown")),
+                "title": pub.get("title", ""),
+                "issue": issue,
+            }
+            for pub in publications
+            for issue in math_notation_issues(pub.get("title", ""))
+        ]
+
         if issues:
             logger.warning(f"Found {len(issues)} potential mathematical notation issues:")
             for issue in issues:
                 logger.warning(f"  {issue['id']}: {issue['issue']}")
                 logger.warning(f"    Title: {issue['title'][:100]}...")
-        
+
         return issues
 
     def _check_for_duplicates(self, publications: List[Dict]) -> List[Dict]:
-        """Check for duplicate publications and warn user, return deduplicated list."""
-        from collections import defaultdict
-        from rich.console import Console
-
-        console = Console()
-
+        """Drop exact and near-duplicate publications, keeping the best of each group.
+
+        Titles are grouped by MinHash/LSH (see near_duplicates), so a preprint
+        and its retitled journal version or an erratum are caught without
+        comparing every pair; records with different arXiv IDs are never
+        grouped unless their normalized titles are identical. The group report
+        is logged as one JSON object and kept on `self.duplicate_report`.
+        """
         if not publications:
             return publications
 
-        # Group publications by normalized title
-        title_groups = defaultdict(list)
-        for i, pub in enumerate(publications):
-            normalized_title = self._normalize_title(pub.get("title", ""))
-            title_groups[normalized_title].append((i, pub))
-
-        # Find duplicates
-        duplicates_found = []
-        deduplicated_list = []
-        processed_indices = set()
-
-        for normalized_title, pubs in title_groups.items():
-            if len(pubs) > 1:
-                duplicates_found.append(pubs)
-
-                # Check if this is the Walmsley paper being flagged as duplicate
-                for idx, pub in pubs:
-                    if "Scaling Laws" in pub.get("title", "") and "Galaxy" in pub.get("title", ""):
-                        logger.warning(f"🚨 WALMSLEY flagged as DUPLICATE!")
-                        logger.warning(f"   Normalized title: {normalized_title}")
-                        logger.warning(f"   Number of duplicates: {len(pubs)}")
-                        for dup_idx, dup_pub in pubs:
-                            logger.warning(f"   Duplicate {dup_idx}: {dup_pub.get('title', 'N/A')[:80]}")
-                            logger.warning(f"      Sources: {dup_pub.get('sources', [])}")
-                            logger.warning(f"      Citations: {dup_pub.get('citations', 0)}")
-
-                # For duplicates, prefer the one with more complete data
-                best_pub = None
-                best_score = -1
-                best_idx = -1
-
-                for idx, pub in pubs:
-                    # Primary factor: publication type priority (journal > preprint > ASCL)
-                    priority = self._get_publication_priority(pub)
-                    score = priority * 100  # Weight publication type heavily
-
-                    # Secondary factor: completeness (more sources = better)
-                    score += len(pub.get("sources", [])) * 10
-
-                    # Tie-breaker: higher citation count
-                    score += (
-                        pub.get("citations", 0) / 10000.0
-                    )  # Small weight for citations
-
-                    if score > best_score:
-                        best_score = score
-                        best_pub = pub
-                        best_idx = idx
-
-                # Keep the best one
-                if best_pub:
-                    deduplicated_list.append(best_pub)
-                    processed_indices.update(idx for idx, _ in pubs)
-
-                # Report the duplicates
-                console.print(f"\n⚠️  [yellow]DUPLICATE DETECTED:[/yellow]")
-                console.print(f"   Title: {pubs[0][1].get('title', 'N/A')[:80]}...")
-                console.print(f"   Found {len(pubs)} identical publications:")
-
-                for idx, pub in pubs:
-                    is_kept = idx == best_idx
-                    status = "✅ KEPT" if is_kept else "❌ REMOVED"
-                    scholar_id = pub.get("scholar_id", "N/A")
-                    sources = ", ".join(pub.get("sources", []))
-                    citations = pub.get("citations", 0)
-                    priority = self._get_publication_priority(pub)
-                    journal = pub.get("journal", "N/A")[:30] + (
-                        "..." if len(pub.get("journal", "")) > 30 else ""
-                    )
-                    console.print(
-                        f"   {status}: Scholar ID: {scholar_id}, Sources: [{sources}], Citations: {citations}, Priority: {priority}, Journal: {journal}"
-                    )
-
-                console.print(
-                    f"   [dim]Please check Google Scholar for duplicate entries[/dim]"
-                )
-            else:
-                # No duplicates, add to deduplicated list
-                deduplicated_list.append(pubs[0][1])
-                processed_indices.add(pubs[0][0])
+        titles = normalize_titles(pub.get("title", "") for pub in publications)
+        arxiv = [self._norm_arxiv(pub.get("arxivId")) for pub in publications]
 
-        if duplicates_found:
-            total_duplicates = sum(len(group) for group in duplicates_found) - len(
-                duplicates_found
-            )
-            console.print(f"\n📊 [yellow]Duplicate Summary:[/yellow]")
-            console.print(
-                f"   Found {len(duplicates_found)} duplicate groups affecting {total_duplicates} publications"
-            )
-            console.print(f"   Automatically kept the most complete version of each")
-            console.print(
-                f"   Deduplicated: {len(publications)} → {len(deduplicated_list)} publications"
+        def distinct(i: int, j: int) -> bool:
+            return titles[i] != titles[j] and bool(arxiv[i] and arxiv[j] and arxiv[i] != arxiv[j])
+
+        groups = near_duplicate_clusters(
+            titles,
+            self.config["merge"]["near_duplicate_threshold"],
+            distinct,
+        )
+
+        # Each group is replaced by its best record, at the group's first position
+        keep = {}
+        dropped = set()
+        report_groups = []
+        for group in groups:
+            best_idx = max(
+                (idx for idx, _ in group), key=lambda idx: self._duplicate_score(publications[idx])
             )
-            console.print(
-                f"   [bold]Action needed:[/bold] Check Google Scholar profile for duplicate entries"
+            keep[group[0][0]] = publications[best_idx]
+            dropped.update(idx for idx, _ in group)
+            report_groups.append({
+                "title": publications[best_idx].get("title", ""),
+                "records": [
+                    {
+                        "index": idx,
+                        "kept": idx == best_idx,
+                        "similarity": round(similarity, 3),
+                        "title": publications[idx].get("title", ""),
+                        "scholar_id": publications[idx].get("scholar_id"),
+                        "sources": publications[idx].get("sources", []),
+                        "citations": publications[idx].get("citations", 0),
+                        "priority": self._get_publication_priority(publications[idx]),
+                        "journal": publications[idx].get("journal", ""),
+                    }
+                    for idx, similarity in group
+                ],
+            })
+
+        deduplicated_list = [
+            keep[i] if i in keep else pub
+            for i, pub in enumerate(publications)
+            if i in keep or i not in dropped
+        ]
+
+        self.duplicate_report = {
+            "groups": report_groups,
+            "before": len(publications),
+            "after": len(deduplicated_list),
+        }
+        if report_groups:
+            logger.warning(
+                f"Removed {len(publications) - len(deduplicated_list)} duplicate(s) in "
+                f"{len(report_groups)} group(s); check Google Scholar for duplicate entries: "
+                + json_codec.dumps(self.duplicate_report, indent=None)
             )
 
         return deduplicated_list
 
+    def _duplicate_score(self, pub: Dict) -> float:
+        """Preference among duplicates: publication type, then sources, then citations."""
+        # Primary factor: publication type priority (journal > preprint > ASCL)
+        score = self._get_publication_priority(pub) * 100
+        # Secondary factor: completeness (more sources = better)
+        score += len(pub.get("sources", [])) * 10
+        # Tie-breaker: higher citation count
+        return score + pub.get("citations", 0) / 10000.0
+
     def _merge_publications(self, ads_pub: Dict, scholar_pub: Dict) -> Dict:
         """Merge two publication records, preferring the most complete data."""
-        merged = {}
+        merged = Publication()
 
         # Use ADS as base (usually more complete metadata)
         merged.update(ads_pub)
@@ -751,7 +895,7 @@ class DataMerger:
 
         try:
             with open(backup_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write(json_codec.dumps(data, default=json_default))
             logger.info(f"Backup created: {backup_file}")
         except Exception as e:
             logger.error(f"Failed to create backup: {e}")
@@ -785,7 +929,7 @@ def main():
     ]
 
     merged = merger.merge_publications(scholar_data, ads_data)
-    print("Merged publications:", json.dumps(merged, indent=2))
+    print("Merged publications:", json_codec.dumps(merged, ensure_ascii=True, default=json_default))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,126 @@
+"""
+Near-duplicate titles by MinHash signatures and banded locality-sensitive hashing.
+
+Exact title grouping misses a preprint and its journal version when the title
+changed slightly, an added subtitle, or an erratum. Comparing every pair of
+titles is quadratic, so each title is reduced to the set of its character
+shingles and a MinHash signature of NUM_PERM hashes; the signature is cut into
+BANDS bands, and titles sharing any band land in the same bucket. Only titles
+sharing a bucket are compared, by the exact Jaccard similarity of their
+shingle sets. With 16 bands of 4 rows, pairs at Jaccard 0.8 share a bucket
+with probability > 0.999 and pairs at 0.3 with probability < 0.13.
+
+Titles must already be normalized (text_normalize.normalize_title).
+"""
+
+import random
+import zlib
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+SHINGLE = 4  # characters per shingle
+NUM_PERM = 64
+BANDS = 16
+_PRIME = (1 << 61) - 1
+# Fixed seed, so signatures (and clusters) are the same on every run
+_rng = random.Random(20240229)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(_PRIME)) for _ in range(NUM_PERM)]
+_ROMAN = {"i", "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix", "x"}
+
+
+def shingles(title: str) -> FrozenSet[int]:
+    """CRC-32 hashes of the title's SHINGLE-character windows."""
+    if len(title) <= SHINGLE:
+        return frozenset([zlib.crc32(title.encode("utf-8"))])
+    return frozenset(
+        zlib.crc32(title[i : i + SHINGLE].encode("utf-8"))
+        for i in range(len(title) - SHINGLE + 1)
+    )
+
+
+# Shingle -> its NUM_PERM universal hashes; common shingles recur across titles
+_hash_cache: Dict[int, Tuple[int, ...]] = {}
+
+
+def _hashes(shingle: int) -> Tuple[int, ...]:
+    hashes = _hash_cache.get(shingle)
+    if hashes is None:
+        hashes = _hash_cache[shingle] = tuple((a * shingle + b) % _PRIME for a, b in _PERMUTATIONS)
+    return hashes
+
+
+def signature(shingle_set: FrozenSet[int]) -> Tuple[int, ...]:
+    """MinHash signature: the minimum of each universal hash over the shingles."""
+    return tuple(map(min, zip(*map(_hashes, shingle_set))))
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def series_tokens(title: str) -> Tuple[str, ...]:
+    """Numbers and roman numerals in a title, in order ('paper ii', '2020 release')."""
+    return tuple(t for t in title.split() if t.isdigit() or t in _ROMAN)
+
+
+def near_duplicate_clusters(
+    titles: Sequence[str],
+    threshold: float = 0.8,
+    distinct: Optional[Callable[[int, int], bool]] = None,
+) -> List[List[Tuple[int, float]]]:
+    """Groups of indices whose titles are near-duplicates, in order of first index.
+
+    Two titles are linked when their shingle Jaccard similarity is at least
+    `threshold`, they carry the same numbers and roman numerals (so the parts
+    of a paper series stay apart), and `distinct(i, j)` (if given) is false.
+    Groups are the connected components of those links, joined strongest link
+    first; a link that would put any two `distinct` titles in one group is
+    skipped, so a title similar to both cannot chain them together. Each member
+    is (index, its best similarity to another member of its group).
+    """
+    sets = [shingles(t) for t in titles]
+    series = [series_tokens(t) for t in titles]
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    rows = NUM_PERM // BANDS
+    for i, s in enumerate(sets):
+        sig = signature(s)
+        for band in range(BANDS):
+            buckets.setdefault((band, sig[band * rows : (band + 1) * rows]), []).append(i)
+
+    parent = list(range(len(titles)))
+
+    def root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    links = []
+    checked = set()
+    for members in buckets.values():
+        for x, i in enumerate(members):
+            for j in members[x + 1 :]:
+                if (i, j) in checked:
+                    continue
+                checked.add((i, j))
+                if series[i] != series[j]:
+                    continue
+                score = jaccard(sets[i], sets[j])
+                if score >= threshold:
+                    links.append((-score, i, j))
+
+    best = [0.0] * len(titles)
+    component = {i: [i] for i in range(len(titles))}
+    for neg_score, i, j in sorted(links):
+        ri, rj = root(i), root(j)
+        if ri != rj:
+            if distinct and any(distinct(a, b) for a in component[ri] for b in component[rj]):
+                continue
+            parent[ri] = rj
+            component[rj] += component.pop(ri)
+        best[i] = max(best[i], -neg_score)
+        best[j] = max(best[j], -neg_score)
+
+    groups: Dict[int, List[Tuple[int, float]]] = {}
+    for i in range(len(titles)):
+        groups.setdefault(root(i), []).append((i, best[i]))
+    return sorted((g for g in groups.values() if len(g) > 1), key=lambda g: g[0][0])
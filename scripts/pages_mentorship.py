@@ -10,9 +10,8 @@ Each stage maps to one of the four redesign category colors (postdoc->sla,
 doctoral->ii, masters->ic, bachelors->du) used for the card accent, stage badge,
 group-heading dot, and the breakdown chart bars.
 """
-import re
-
-from pages_shared import esc, attr_esc
+from content_model import section_model
+from pages_shared import HtmlWriter, esc, attr_esc
 
 # Stage key -> (filter cat key, display label, color suffix used for accent + badge)
 _STAGES = [
@@ -33,84 +32,9 @@ _CHIP_LABEL = {
 }
 
 
-def _strip_tags(s):
-    """Remove HTML tags from a string (for plain-text search/sort keys)."""
-    return re.sub(r"<[^>]+>", "", str(s or ""))
-
-
-def _parse_year(period):
-    """Pull the latest 4-digit year out of a timelinePeriod string, else 0."""
-    years = re.findall(r"(19|20)\d{2}", str(period or ""))
-    if not years:
-        return 0
-    # findall with the alternation group returns only the prefix; re-scan fully:
-    full = re.findall(r"\b((?:19|20)\d{2})\b", str(period or ""))
-    return max(int(y) for y in full) if full else 0
-
-
-_SEASON_ORD = {"winter": 1, "spring": 2, "summer": 3, "fall": 4, "autumn": 4}
-
-
-def _end_key(period):
-    """Sort key for ordering a list by END date, newest first (use reverse=True).
-
-    Takes the text after the last dash as the end ('Present' sorts above all),
-    then (year, season) so e.g. Fall 2024 > Summer 2024 > 2023.
-    """
-    end = re.split(r"\s*[-–]\s*", str(period or "").strip())[-1].strip().lower()
-    if "present" in end:
-        return (9999, 9)
-    years = re.findall(r"(?:19|20)\d{2}", end)
-    year = int(years[-1]) if years else 0
-    season = next((o for s, o in _SEASON_ORD.items() if s in end), 0)
-    return (year, season)
-
-
-def _supervision_and_project(rec):
-    """Return (supervisionType, project) handling both single-project records and
-    the bachelors-style records that carry a projects[] array."""
-    sup = rec.get("supervisionType") or ""
-    proj = rec.get("project") or ""
-    if not proj and isinstance(rec.get("projects"), list) and rec["projects"]:
-        titles = [p.get("title", "") for p in rec["projects"] if p.get("title")]
-        proj = "; ".join(titles)
-        if not sup:
-            sups = [p.get("supervisionType", "") for p in rec["projects"] if p.get("supervisionType")]
-            if sups:
-                sup = sups[0]
-    return sup, proj
-
-
-def _cosupervisors(rec):
-    """All co-supervisor HTML strings (record-level + any inside bachelors projects[])."""
-    cs = list(rec.get("coSupervisors") or [])
-    for p in (rec.get("projects") or []):
-        cs += list(p.get("coSupervisors") or [])
-    seen, out = set(), []
-    for c in cs:
-        if c and c not in seen:
-            seen.add(c)
-            out.append(c)
-    return out
-
-
-def _card(rec, cat, label, color, completed):
-    name_html = rec.get("name") or ""          # already HTML (may contain <a>)
-    name_plain = _strip_tags(name_html).strip()
-    period = rec.get("timelinePeriod") or ""
-    sup, proj = _supervision_and_project(rec)
-    cosup = _cosupervisors(rec)
-    current_status = rec.get("currentStatus") or ""
-    career = rec.get("myCareerStage") or ""
-    tag_vals = (list(rec.get("programs") or []) + list(rec.get("awards") or [])
-                + list(rec.get("courses") or []) + [rec.get("institution") or ""])
-
-    # data-* keys (plain text for search/sort) — include role + all tag text
-    search_src = " ".join(_strip_tags(x) for x in
-                          (name_plain, sup, proj, current_status, " ".join(cosup), " ".join(tag_vals)))
-    data_search = attr_esc(search_src)
-    data_title = attr_esc(name_plain)
-    data_year = _parse_year(period)
+def _card(m, cat, label, color, completed):
+    """One mentee card (content_model.Mentee; the name is HTML and may contain <a>)."""
+    sup, proj, cosup = m.supervision, m.project, m.cosupervisors
 
     # meta line: just the project / research interests (the role is now a badge below)
     meta = esc(proj)
@@ -121,11 +45,11 @@ def _card(rec, cat, label, color, completed):
         subs.append(f'<span class="md-label">Co-supervised with</span> {", ".join(cosup)}')
     # "Where they are now" shows only for current mentees; for former mentees it was
     # too hard to keep accurate, so the status/outcome line is intentionally omitted.
-    if not completed and current_status:
-        subs.append(current_status)
+    if not completed and m.current_status:
+        subs.append(m.current_status)
     subs_html = "".join(f'<p class="item-sub">{x}</p>' for x in subs)
     # "My career stage then" is a quiet footnote at the very bottom of the card.
-    foot_html = f'<p class="item-foot">My career stage then: {esc(career)}</p>' if career else ""
+    foot_html = f'<p class="item-foot">My career stage then: {esc(m.career)}</p>' if m.career else ""
 
     # tags: role (formal/informal) + stage + Alum + programs + course/thesis + awards
     # Supervisory role sits up on the title row (see below), not in the tag cluster.
@@ -133,27 +57,26 @@ def _card(rec, cat, label, color, completed):
     if sup:
         role_cls = "role-badge role-informal" if "informal" in sup.lower() else "role-badge"
         role_html = f'<span class="badge {role_cls}">{esc(sup)}</span>'
-    tags = [f'<span class="badge b-{color}">{esc(label)}</span>']
-    institution = rec.get("institution") or ""
-    if institution:                                  # home institution for non-Toronto students
-        tags.append(f'<span class="badge tag-institution">{esc(institution)}</span>')
+    tags = HtmlWriter().write(f'<span class="badge b-{color}">{esc(label)}</span>')
+    if m.institution:                                # home institution for non-Toronto students
+        tags.write(f'<span class="badge tag-institution">{esc(m.institution)}</span>')
     # Three distinct, searchable tag families: programs, course/thesis context, awards.
-    for prog in (rec.get("programs") or []):
-        tags.append(f'<span class="badge tag-program">{esc(prog)}</span>')   # esc keeps links intact
-    for crs in (rec.get("courses") or []):
-        tags.append(f'<span class="badge tag-course">{esc(crs)}</span>')
-    for aw in (rec.get("awards") or []):
-        tags.append(f'<span class="badge tag-award">{esc(aw)}</span>')
-    tags_html = "".join(tags)
+    for prog in m.programs:
+        tags.write(f'<span class="badge tag-program">{esc(prog)}</span>')   # esc keeps links intact
+    for crs in m.courses:
+        tags.write(f'<span class="badge tag-course">{esc(crs)}</span>')
+    for aw in m.awards:
+        tags.write(f'<span class="badge tag-award">{esc(aw)}</span>')
+    tags_html = tags.getvalue()
     meta_html = f'<p class="item-meta">{meta}</p>' if meta else ""
 
     return (
         f'<article class="item accent-{color}" data-lv-item '
-        f'data-cat="{cat}" data-search="{data_search}" data-year="{data_year}" '
-        f'data-num="{data_year}" data-title="{data_title}">'
+        f'data-cat="{cat}" data-search="{m.search}" data-year="{m.year}" '
+        f'data-num="{m.year}" data-title="{m.sort_title}">'
         '<div class="item-head">'
-        f'<div class="item-headline"><h3 class="item-title">{name_html}</h3>{role_html}</div>'
-        f'<span class="item-when">{esc(period)}</span>'
+        f'<div class="item-headline"><h3 class="item-title">{m.name_html}</h3>{role_html}</div>'
+        f'<span class="item-when">{esc(m.period)}</span>'
         '</div>'
         f'{meta_html}'
         f'{subs_html}'
@@ -163,13 +86,13 @@ def _card(rec, cat, label, color, completed):
     )
 
 
-def _breakdown_chart(mbs, completed):
+def _breakdown_chart(current, former_by_stage):
     """Career-stage breakdown: one horizontal bar per stage, split into a solid
     'current' segment and a faded 'former' segment, scaled to the largest stage."""
     stats = []
     for stage_key, cat, label, color in _STAGES:
-        cur = len(mbs.get(stage_key) or [])
-        former = len(completed.get(stage_key) or [])
+        cur = len(current.get(stage_key, ()))
+        former = len(former_by_stage.get(stage_key, ()))
         stats.append((cat, color, cur, former, cur + former))
     max_total = max((t for *_, t in stats), default=1) or 1
 
@@ -204,36 +127,36 @@ def _breakdown_chart(mbs, completed):
 
 
 def _stage_groups(source, completed_flag):
-    """Render the per-stage card groups for one section (Current or Former)."""
-    groups = []
+    """Render the per-stage card groups for one section (Current or Former).
+
+    `source` maps stage key -> mentees, already ordered by end date (newest first).
+    """
+    groups = HtmlWriter()
     for stage_key, cat, label, color in _STAGES:
-        recs = source.get(stage_key) or []
+        recs = source.get(stage_key)
         if not recs:
             continue
-        # Order each group by end date automatically (newest first).
-        recs = sorted(recs, key=lambda r: _end_key(r.get("timelinePeriod")), reverse=True)
-        cards = "".join(_card(rec, cat, label, color, completed=completed_flag) for rec in recs)
-        groups.append(
+        cards = "".join(_card(m, cat, label, color, completed=completed_flag) for m in recs)
+        groups.write(
             '<div class="mentor-group" data-mentor-group>'
             f'<h3 class="mentor-group-head"><span class="dot d-{color}"></span>'
             f'{esc(_CHIP_LABEL[cat])} <span class="mentor-count" data-mentor-count>{len(recs)}</span></h3>'
             f'<div class="pub-list">{cards}</div>'
             '</div>'
         )
-    return "".join(groups)
+    return groups.getvalue()
 
 
 def generate_content(data):
-    section = (data.get("sections") or {}).get("mentorship") or {}
-    mbs = section.get("menteesByStage") or {}
-    completed = mbs.get("completed") or {}
+    model = section_model(data, "mentorship")
+    mbs, completed = model.current, model.former
 
-    n_current = sum(len(mbs.get(sk) or []) for sk, _, _, _ in _STAGES)
-    n_former = sum(len(completed.get(sk) or []) for sk, _, _, _ in _STAGES)
+    n_current = sum(len(mbs.get(sk, ())) for sk, _, _, _ in _STAGES)
+    n_former = sum(len(completed.get(sk, ())) for sk, _, _, _ in _STAGES)
     total = n_current + n_former
 
     # ---- Overview: intro highlight + stats + breakdown chart ----
-    prose = (section.get("introduction") or {}).get("content") or ""
+    prose = model.introduction
     intro_box = (f'<aside class="highlight-box"><h3>On Mentorship</h3><p>{esc(prose)}</p></aside>'
                  if prose else "")
     stats = (
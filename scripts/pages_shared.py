@@ -18,18 +18,49 @@ Per-item card convention (so listview.js can filter/search/sort):
 """
 import re
 
+# A bare & (not already the start of an entity)
+_BARE_AMP = re.compile(r"&(?!(?:amp|lt|gt|quot|#\d+);)")
+
 def esc(s):
     """Escape bare & in plain text without double-encoding existing entities."""
-    return re.sub(r"&(?!(?:amp|lt|gt|quot|#\d+);)", "&amp;", str(s or ""))
+    s = s if type(s) is str else str(s or "")
+    # Most fields carry no & at all: skip the regex
+    return _BARE_AMP.sub("&amp;", s) if "&" in s else s
+
+def esc_text(s):
+    """Full plain-text escape (&, <, >) for fields that must never carry markup."""
+    return esc(s).replace("<", "&lt;").replace(">", "&gt;")
 
 def attr_esc(s):
     """Lowercase + escape for a double-quoted HTML attribute value (data-search/title)."""
-    return esc(str(s or "")).replace('"', "&quot;").lower()
+    return esc(s).replace('"', "&quot;").lower()
 
 def url_attr(s):
     """Escape a URL for a double-quoted href/src attribute. Unlike attr_esc this does
     NOT lowercase (URLs are case-sensitive), and it escapes &, ", <, >."""
-    return esc(str(s or "")).replace('"', "&quot;").replace("<", "&lt;").replace(">", "&gt;")
+    return esc(s).replace('"', "&quot;").replace("<", "&lt;").replace(">", "&gt;")
+
+class HtmlWriter:
+    """Collects HTML in a list and joins it once (instead of repeated `html += ...`).
+
+    `write` appends markup as-is; a writer is true once anything non-empty
+    was written, so `if out:` still works.
+    """
+
+    __slots__ = ("parts",)
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, *markup):
+        self.parts.extend(markup)
+        return self
+
+    def __bool__(self):
+        return any(self.parts)
+
+    def getvalue(self):
+        return "".join(self.parts)
 
 def _chip(cat, label, count, active=False):
     dot = "" if cat == "all" else f'<span class="dot d-{cat}"></span>'
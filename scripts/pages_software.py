@@ -8,8 +8,10 @@ Layout: topline metric strip -> Featured tools board -> Data-visualization showc
 flat, date-sorted repo list with group filter chips (wired by listview.js).
 Repos absent from the curation map are bucketed into "scratch" (forks always go to scratch).
 """
-import json
 from datetime import datetime
+import json_codec
+from build_manifest import track_file
+from content_model import section_model
 from pages_shared import esc, attr_esc, url_attr
 
 try:
@@ -17,6 +19,15 @@ try:
 except Exception:  # pragma: no cover - config always present in build env
     get_data_path = None
 
+# Stats file read instead of software_data.json, if set (see use_stats_file)
+_stats_path = None
+
+
+def use_stats_file(path=None):
+    """Read repository stats from `path` instead of software_data.json; None restores the default."""
+    global _stats_path
+    _stats_path = path
+
 # GitHub language -> (short label, css token)
 _LANG = {
     "Python": ("Python", "py"),
@@ -30,9 +41,12 @@ _LANG = {
 def _load_cache():
     """Load the software_data.json stats cache; return {} if unavailable."""
     try:
-        path = get_data_path("software_data.json") if get_data_path else "assets/data/software_data.json"
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        if _stats_path is not None:
+            path = _stats_path
+        else:
+            path = get_data_path("software_data.json") if get_data_path else "assets/data/software_data.json"
+        track_file(path)
+        return json_codec.load(path)
     except Exception:
         return {}
 
@@ -93,8 +107,7 @@ def _feat_card(name, repo, cur):
         f'</article>')
 
 
-def _showcase(sw, repos):
-    sc = sw.get("showcase")
+def _showcase(sc):
     if not sc:
         return ""
     url = sc.get("url", "#")
@@ -145,15 +158,12 @@ def _list_card(name, repo, cur, group_id, group_label, accent, featured):
 
 
 def generate_content(data):
-    sw = data["sections"]["software"]
+    sw = section_model(data, "software")
     cache = _load_cache()
     repos = cache.get("repos", {})
-    curation = sw.get("curation", {})
-    groups = sw.get("groups", [])
-    group_label = {g["id"]: g["label"] for g in groups}
-    group_accent = {g["id"]: g.get("accent", "violet") for g in groups}
-    group_order = [g["id"] for g in groups]
-    featured_names = sw.get("featured", [])
+    curation = sw.curation
+    group_label, group_accent, group_order = sw.group_label, sw.group_accent, sw.group_order
+    featured_names = sw.featured
 
     def group_of(name, repo):
         cur = curation.get(name, {})
@@ -182,7 +192,7 @@ def generate_content(data):
         f'<div class="featured-grid">{fcards}</div></section>') if fcards else ""
 
     # ---------- data-viz showcase ----------
-    showcase_html = _showcase(sw, repos)
+    showcase_html = _showcase(sw.showcase)
 
     # ---------- flat, date-sorted list + group filter chips ----------
     rows = sorted(shown.items(), key=lambda kv: (kv[1].get("pushed") or ""), reverse=True)
@@ -10,86 +10,21 @@ card's left stripe + badge dot is colored to match its chip.
 
 Per-item card contract is documented in pages_shared.py.
 """
-import re
-
-from pages_shared import scaffold, esc, attr_esc
-
-
-def _strip_tags(s):
-    """Remove any HTML tags from a string (for building data-search text)."""
-    return re.sub(r"<[^>]+>", "", str(s or ""))
-
-
-def _slug(s):
-    """Lowercase, hyphenated, attribute-safe slug for data-cat / chip keys."""
-    s = _strip_tags(s).lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s).strip("-")
-    return s or "other"
-
-
-def _departments(course):
-    """Return a list of department names for a course.
-
-    Supports both 'department' (string) and 'departments' (list) keys.
-    """
-    if course.get("departments"):
-        return [d for d in course["departments"] if d]
-    dept = course.get("department")
-    return [dept] if dept else []
-
-
-def _latest_year(terms):
-    """Parse the latest 4-digit year mentioned across a list of term strings.
-
-    Handles ranges (e.g. "Full Year 2023-2024") and annotations
-    (e.g. "Winter 2022 (partial)") by scanning for every 19xx/20xx token.
-    """
-    years = [int(y) for t in (terms or []) for y in re.findall(r"(?:19|20)\d{2}", str(t))]
-    return max(years) if years else 0
-
-
-_MONTHS3 = {m: i for i, m in enumerate(
-    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)}
-_SEASONS = {"winter": 1, "spring": 4, "summer": 6, "fall": 9, "autumn": 9}
-
-
-def _term_month(term):
-    """Representative month (1-12) for a term/date string; month names win over
-    season words (winter/spring/summer/fall). 0 if nothing is recognized."""
-    t = str(term or "").lower()
-    for name, num in _MONTHS3.items():
-        if name in t:
-            return num
-    for season, num in _SEASONS.items():
-        if season in t:
-            return num
-    return 0
-
-
-def _sort_key(terms):
-    """YYYYMM-style key so same-year items order by recency: latest year, with the
-    month/season of the term(s) carrying that year. 0 if no year present."""
-    terms = terms or []
-    year = _latest_year(terms)
-    if not year:
-        return 0
-    month = max((_term_month(t) for t in terms if str(year) in str(t)), default=0)
-    return year * 100 + month
+from content_model import section_model
+from pages_shared import HtmlWriter, scaffold, esc
 
 
 def generate_content(data):
     """Build the inner HTML for #teaching-content."""
-    teaching = (data or {}).get("sections", {}).get("teaching", {}) or {}
-    courses = teaching.get("courseHistory", []) or []
-    short_courses = teaching.get("shortCourses", []) or []
+    teaching = section_model(data, "teaching")
+    courses, short_courses = teaching.courses, teaching.short_courses
 
     # ---- Department filter chips (unique departments, counted) ----
     dept_order = []          # preserve first-seen order
     dept_counts = {}         # slug -> count
     dept_label = {}          # slug -> display label
     for course in courses:
-        for dept in _departments(course):
-            slug = _slug(dept)
+        for dept, slug in zip(course.departments, course.dept_slugs):
             if slug not in dept_counts:
                 dept_counts[slug] = 0
                 dept_label[slug] = dept
@@ -101,47 +36,30 @@ def generate_content(data):
         filters.append(("workshops", "Workshops", len(short_courses)))
 
     # ---- Course cards ----
-    cards = []
+    cards = HtmlWriter()
     for course in courses:
-        code = course.get("code", "")
-        title = course.get("title", "")
-        level = course.get("level", "")
-        description = course.get("description", "")
-        terms = course.get("terms", []) or []
-        depts = _departments(course)
-
-        cat = " ".join(_slug(d) for d in depts) or "other"
-        when = esc(" · ".join(terms))
-        dept_display = " / ".join(depts)
-        title_display = " · ".join(p for p in [code, title] if p)
-        year = _latest_year(terms)
-
-        search_src = " ".join([
-            _strip_tags(code), _strip_tags(title), _strip_tags(level),
-            _strip_tags(dept_display), _strip_tags(description),
-            _strip_tags(" ".join(terms)),
-        ])
-        data_search = attr_esc(search_src)
-        data_title = attr_esc(_strip_tags(title_display))
+        depts, slugs = course.departments, course.dept_slugs
+        cat = " ".join(slugs) or "other"
+        when = esc(" · ".join(course.terms))
 
         # Description carries the meta line; level + department(s) become badges.
-        meta = esc(description) if description else ""
+        meta = esc(course.description) if course.description else ""
 
-        level_badge = f'<span class="badge">{esc(level)}</span>' if level else ""
+        level_badge = f'<span class="badge">{esc(course.level)}</span>' if course.level else ""
         dept_badges = "".join(
-            f'<span class="badge talk-badge"><span class="dot d-{_slug(d)}"></span>{esc(d)}</span>'
-            for d in depts
+            f'<span class="badge talk-badge"><span class="dot d-{slug}"></span>{esc(d)}</span>'
+            for d, slug in zip(depts, slugs)
         )
         tags = level_badge + dept_badges
         # left stripe: split blue/purple for joint (multi-dept) courses, else dept color
-        accent = "astrostat" if len(depts) >= 2 else (_slug(depts[0]) if depts else "violet")
+        accent = "astrostat" if len(depts) >= 2 else (slugs[0] if slugs else "violet")
 
-        cards.append(
+        cards.write(
             f'<article class="item accent-{accent}" data-lv-item '
-            f'data-cat="{cat}" data-search="{data_search}" '
-            f'data-year="{year}" data-num="{_sort_key(terms)}" data-title="{data_title}">'
+            f'data-cat="{cat}" data-search="{course.search}" '
+            f'data-year="{course.year}" data-num="{course.sort_num}" data-title="{course.sort_title}">'
             f'<div class="item-head">'
-            f'<h3 class="item-title">{esc(title_display)}</h3>'
+            f'<h3 class="item-title">{esc(course.title_display)}</h3>'
             f'<span class="item-when">{when}</span>'
             f'</div>'
             f'<p class="item-meta">{meta}</p>'
@@ -151,28 +69,15 @@ def generate_content(data):
 
     # ---- Workshop / short-course cards (same unified listview, "workshops" chip) ----
     for sc in short_courses:
-        title = sc.get("title", "")
-        program = sc.get("program", "")
-        location = sc.get("location", "")
-        terms = sc.get("terms", []) or []
-        when = esc(" · ".join(terms))
-        year = _latest_year(terms)
-
-        meta = " · ".join(p for p in [esc(program), esc(location)] if p)
-
-        search_src = " ".join([
-            _strip_tags(title), _strip_tags(program), _strip_tags(location),
-            _strip_tags(" ".join(terms)), "workshop short course",
-        ])
-        data_search = attr_esc(search_src)
-        data_title = attr_esc(_strip_tags(title))
-
-        cards.append(
+        when = esc(" · ".join(sc.terms))
+        meta = " · ".join(p for p in [esc(sc.program), esc(sc.location)] if p)
+
+        cards.write(
             f'<article class="item accent-workshops" data-lv-item '
-            f'data-cat="workshops" data-search="{data_search}" '
-            f'data-year="{year}" data-num="{_sort_key(terms)}" data-title="{data_title}">'
+            f'data-cat="workshops" data-search="{sc.search}" '
+            f'data-year="{sc.year}" data-num="{sc.sort_num}" data-title="{sc.sort_title}">'
             f'<div class="item-head">'
-            f'<h3 class="item-title">{esc(title)}</h3>'
+            f'<h3 class="item-title">{esc(sc.title)}</h3>'
             f'<span class="item-when">{when}</span>'
             f'</div>'
             f'<p class="item-meta">{meta}</p>'
@@ -181,7 +86,7 @@ def generate_content(data):
             f'</article>'
         )
 
-    items_html = "".join(cards)
+    items_html = cards.getvalue()
 
     listview = scaffold(
         items_html,
@@ -197,11 +102,10 @@ def generate_content(data):
     # Auto-compute the topline stats from courseHistory rather than trusting the
     # hand-entered teachingStats (which had a stale departments count). "Years
     # teaching" is the span of years taught; departments drive the chips, not a tile.
-    _years = sorted({int(y) for c in courses for t in (c.get("terms") or [])
-                     for y in re.findall(r"(?:19|20)\d{2}", str(t))})
+    _years = teaching.years
     stat_defs = [
         (len(courses), "Courses"),
-        (sum(len(c.get("terms") or []) for c in courses), "Offerings"),
+        (sum(len(c.terms) for c in courses), "Offerings"),
         ((_years[-1] - _years[0]) if _years else 0, "Years teaching"),
     ]
     tiles = "".join(
@@ -210,7 +114,7 @@ def generate_content(data):
     )
     stats_html = f'<div class="pub-stats teach-stats">{tiles}</div>' if tiles else ""
 
-    phil = teaching.get("philosophy") or {}
+    phil = teaching.philosophy
     phil_html = ""
     if phil.get("content"):
         phil_html = (
@@ -0,0 +1,62 @@
+"""
+Identity keys for publication records.
+
+A paper is identified by its ADS bibcode, DOI, and arXiv ID (normalized with the
+same rules DataMerger uses for joining sources), falling back to its normalized
+title. These keys are used to look papers up across pipeline runs even when a
+source tweaks a title's casing or punctuation.
+"""
+
+import hashlib
+from typing import Dict, Iterable, List, Optional
+
+from merge_data import DataMerger
+from text_normalize import normalize_title
+
+
+def paper_keys(pub: Dict) -> List[str]:
+    """Return a paper's lookup keys, strongest first (bibcode, DOI, arXiv, title)."""
+    keys = []
+    bibcode = DataMerger._norm_bibcode(pub.get("bibcode"))
+    if bibcode:
+        keys.append(f"bibcode:{bibcode}")
+    doi = DataMerger._norm_doi(pub.get("doi"))
+    if doi:
+        keys.append(f"doi:{doi}")
+    arxiv = DataMerger._norm_arxiv(pub.get("arxivId"))
+    if arxiv:
+        keys.append(f"arxiv:{arxiv}")
+    title = normalize_title(pub.get("title", "") or "")
+    if title:
+        keys.append(f"title:{title}")
+    return keys
+
+
+def fingerprint(pub: Dict) -> str:
+    """Stable short content fingerprint of a paper's identifiers and normalized title."""
+    return hashlib.sha1("\n".join(paper_keys(pub)).encode("utf-8")).hexdigest()[:16]
+
+
+class PaperIndex:
+    """Lookup of records by any of their identity keys (first record wins per key)."""
+
+    def __init__(self, records: Iterable[Dict] = ()):
+        self._by_key: Dict[str, Dict] = {}
+        for record in records:
+            self.add(record)
+
+    def add(self, record: Dict, keys: Optional[List[str]] = None):
+        """Index `record` under its own keys (or the explicit `keys`)."""
+        for key in keys if keys is not None else paper_keys(record):
+            self._by_key.setdefault(key, record)
+
+    def lookup(self, pub: Dict) -> Optional[Dict]:
+        """Return the indexed record matching `pub`'s strongest available key."""
+        for key in paper_keys(pub):
+            record = self._by_key.get(key)
+            if record is not None:
+                return record
+        return None
+
+    def __len__(self) -> int:
+        return len(self._by_key)
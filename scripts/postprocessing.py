@@ -26,6 +26,9 @@ import requests
 from dotenv import load_dotenv
 
 from config import get_project_root, get_data_path, get_backup_dir
+import json_codec
+from atomic_write import write_json_if_changed
+from data_store import DataStore
 
 # Set up logging
 logging.basicConfig(
@@ -73,12 +76,15 @@ class PostProcessor:
     """Consolidated post-processor for publications data.
 
     Loads publications_data.json once, runs all steps in-memory,
-    and saves once at the end.
+    and saves once at the end. When given the pipeline's DataStore, it works on
+    that in-memory snapshot and leaves the final write to the store's owner.
     """
 
-    def __init__(self, dry_run: bool = False):
+    def __init__(self, dry_run: bool = False, store: Optional[DataStore] = None):
         self.dry_run = dry_run
         self.data_path = get_data_path()
+        self._owns_store = store is None
+        self.store = store if store is not None else DataStore(self.data_path)
         self.cache_path = get_data_path("ads_library_cache.json")
         self.data: Optional[Dict] = None
         self.ads_api_key: Optional[str] = None
@@ -89,9 +95,10 @@ class PostProcessor:
 
     def load(self) -> Dict:
         """Load publications data from the canonical path."""
-        logger.info(f"Loading publications data from {self.data_path}")
-        with open(self.data_path, "r", encoding="utf-8") as f:
-            self.data = json.load(f)
+        logger.info(f"Loading publications data from {self.store.path}")
+        self.data = self.store.load()
+        if self.data is None:
+            raise FileNotFoundError(self.store.path)
         pubs = self.data.get("publications", [])
         logger.info(f"Loaded {len(pubs)} publications")
         return self.data
@@ -99,12 +106,16 @@ class PostProcessor:
     def save(self):
         """Save publications data back to the canonical path."""
         if self.dry_run:
-            logger.info("[DRY RUN] Would save to %s", self.data_path)
+            logger.info("[DRY RUN] Would save to %s", self.store.path)
             return
-        self.data_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.data_path, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
-        logger.info(f"Saved publications data to {self.data_path}")
+        self.store.set(self.data)
+        if not self._owns_store:
+            return
+        if self.store.save():
+            logger.info(f"Saved publications data to {self.store.path}")
+        else:
+            logger.info(f"Publications data unchanged: {self.store.path}")
+        logger.info(f"Data I/O: {self.store.report()}")
 
     # ------------------------------------------------------------------
     # Step 1: Flag featured publications
@@ -264,10 +275,10 @@ class PostProcessor:
 
         # Save cache
         if not self.dry_run:
-            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_path, "w") as f:
-                json.dump(merged, f, indent=2)
-            logger.info(f"Saved ADS library cache to {self.cache_path}")
+            if write_json_if_changed(self.cache_path, merged, ensure_ascii=True):
+                logger.info(f"Saved ADS library cache to {self.cache_path}")
+            else:
+                logger.info("ADS library cache unchanged")
 
         return merged
 
@@ -314,8 +325,7 @@ class PostProcessor:
     def _load_existing_cache(self) -> Dict[str, List[str]]:
         """Load existing ADS library cache."""
         try:
-            with open(self.cache_path, "r") as f:
-                return json.load(f)
+            return json_codec.load(self.cache_path)
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
 
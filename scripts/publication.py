@@ -0,0 +1,214 @@
+"""
+Compact publication record used between the fetchers and the merger.
+
+Each source (Scholar paper list, ADS, OpenAlex, Scholar details) yields one record
+per paper, and the pipeline keeps several of those lists alive at once. As plain
+dicts every record carries its own hash table and its own copy of every author,
+journal and source string. `Publication` stores the known fields in `__slots__`
+and interns the highly repeated strings, so the copies share them.
+
+A Publication behaves like a mutable mapping (get, [], in, update, pop, items...),
+so code written against publication dicts works unchanged. Key order is kept
+exactly as a dict would keep it, which makes `from_dict`/`to_dict` lossless:
+`Publication.from_dict(d).to_dict() == d`, including key order, and JSON output
+is byte-identical to dumping the original dict.
+"""
+
+import sys
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List
+
+# Every field a fetcher, the merger or post-processing writes on a paper.
+# Anything else lands in the per-record overflow dict.
+FIELDS = (
+    "id",
+    "title",
+    "year",
+    "scholar_id",
+    "source",
+    "authors",
+    "journal",
+    "bibcode",
+    "citations",
+    "url",
+    "abstract",
+    "keywords",
+    "doi",
+    "arxivId",
+    "adsUrl",
+    "openalexUrl",
+    "scholarUrl",
+    "researchArea",
+    "citations_by_source",
+    "sources",
+    "authorshipCategory",
+    "categoryProbabilities",
+    "llm_categorization",
+    "featured",
+    "identifierNote",
+)
+_FIELD_SET = frozenset(FIELDS)
+
+# Fields holding a repeated string, or a list of repeated strings
+_INTERN_STR = frozenset(("journal", "source", "researchArea", "authorshipCategory"))
+_INTERN_LIST = frozenset(("authors", "keywords", "sources"))
+
+_intern = sys.intern
+
+
+def _interned(key: str, value: Any) -> Any:
+    if key in _INTERN_STR:
+        if type(value) is str:
+            return _intern(value)
+    elif key in _INTERN_LIST:
+        if type(value) is list:
+            return [_intern(v) if type(v) is str else v for v in value]
+    return value
+
+
+class Publication(MutableMapping):
+    """Slotted, mapping-compatible publication record."""
+
+    # `_keys` holds the present keys in insertion order (interned names, shared
+    # across records); `_extra` holds fields outside FIELDS, created on demand.
+    __slots__ = FIELDS + ("_keys", "_extra")
+
+    def __init__(self, *args, **kwargs):
+        self._keys: List[str] = []
+        self._extra = None
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    # ------------------------------------------------------------------
+    # JSON boundary
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Publication":
+        # Bulk path: dict keys are unique, so no presence checks are needed
+        pub = cls.__new__(cls)
+        keys = []
+        extra = None
+        setter = object.__setattr__
+        for key, value in data.items():
+            if key in _INTERN_STR or key in _INTERN_LIST:
+                value = _interned(key, value)
+            if key in _FIELD_SET:
+                key = _intern(key)
+                setter(pub, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+            keys.append(key)
+        pub._keys = keys
+        pub._extra = extra
+        return pub
+
+    def to_dict(self) -> Dict:
+        """Plain dict with the same keys, values and key order."""
+        return {key: self[key] for key in self._keys}
+
+    # ------------------------------------------------------------------
+    # Mapping protocol
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def __setitem__(self, key: str, value: Any):
+        self._store(key, _interned(key, value))
+
+    def _store(self, key: str, value: Any):
+        if key in _FIELD_SET:
+            if not hasattr(self, key):
+                self._keys.append(_intern(key))
+            setattr(self, key, value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        if key not in self._extra:
+            self._keys.append(key)
+        self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in _FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+        self._keys.remove(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in _FIELD_SET:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def update(self, other=(), **kwargs):
+        # Values coming from another record are already interned: share them
+        # as dict.update would instead of re-interning list copies.
+        if isinstance(other, Publication):
+            for key in other._keys:
+                self._store(key, other[key])
+            other = ()
+        super().update(other, **kwargs)
+
+    def copy(self) -> "Publication":
+        """Shallow copy (values shared, like dict.copy)."""
+        pub = Publication()
+        pub.update(self)
+        return pub
+
+    def __repr__(self) -> str:
+        return f"Publication({self.to_dict()!r})"
+
+    # Slotted objects need explicit pickle support (used by process pools)
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict):
+        self._keys = []
+        self._extra = None
+        for key, value in state.items():
+            self[key] = value
+
+
+def from_dicts(records: Iterable[Dict]) -> List[Publication]:
+    """Convert JSON-boundary dicts to records (records pass through unchanged)."""
+    return [r if isinstance(r, Publication) else Publication.from_dict(r) for r in records]
+
+
+def to_dicts(records: Iterable[Any]) -> List[Dict]:
+    """Convert records back to plain dicts for the JSON boundary."""
+    return [r.to_dict() if isinstance(r, Publication) else r for r in records]
+
+
+def json_default(obj: Any) -> Any:
+    """`default=` hook so json.dump serializes records exactly like their dicts."""
+    if isinstance(obj, Publication):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,191 @@
+"""
+Year × category × role aggregate of the publication list, for the build.
+
+Every publication chart and stat block is a sum over some slice of the same
+three axes (publication year, researchArea, authorshipCategory), so one pass
+over the hot index builds a dense cube of
+
+    papers     paper count per cell
+    citations  citation sum per cell
+    mass       probability-weighted area mass per cell × area (each paper's
+               categoryProbabilities normalized over the four areas)
+
+stored as flat row-major lists, plus the display order of dated papers, the
+featured papers, and the pipeline metrics the charts plot. The cube is cached
+in .build_cache/ under the SHA-256 of publications_data.json, the index
+version (papers are listed by index key) and the digest of the code that
+builds it (this module and publication_store), so a rebuild with unchanged
+data and code reads one small file instead of the publication index.
+
+Year 0 holds papers without a year; charts and counts that only consider dated
+papers leave it out (`dated=True`).
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import json_codec
+import publication_store
+from atomic_write import write_json_if_changed
+from build_manifest import sha256
+from config import get_build_cache_dir
+from digest_cache import file_sha256
+from publication_store import INDEX_VERSION, PublicationStore
+
+CUBE_VERSION = 1
+
+# Mass axis, in the build's badge order
+AREAS = (
+    "Statistical Learning & AI",
+    "Interpretability & Insight",
+    "Inference & Computation",
+    "Discovery & Understanding",
+)
+# Pipeline metrics the charts and home stat blocks read
+METRIC_KEYS = (
+    "totalPapers",
+    "totalCitations",
+    "hIndex",
+    "i10Index",
+    "citationsPerYear",
+    "riqByCategory",
+)
+NO_ROLE = "other"
+
+
+def _year(pub: Dict) -> int:
+    return int(pub.get("year") or 0)
+
+
+def build_cube(pubs: List[Dict], metrics: Dict, source: Optional[str] = None) -> Dict:
+    """Aggregate hot-index records into the cube's JSON form."""
+    years = sorted({_year(p) for p in pubs})
+    categories = sorted({p.get("researchArea", "") for p in pubs})
+    roles = sorted({p.get("authorshipCategory") or NO_ROLE for p in pubs})
+    y_at = {y: i for i, y in enumerate(years)}
+    c_at = {c: i for i, c in enumerate(categories)}
+    r_at = {r: i for i, r in enumerate(roles)}
+    n_cells = len(years) * len(categories) * len(roles)
+    papers = [0] * n_cells
+    citations = [0] * n_cells
+    mass = [0.0] * (n_cells * len(AREAS))
+
+    # Dated papers newest first, then most cited (the card order)
+    dated = sorted(
+        (p for p in pubs if p.get("year")),
+        key=lambda p: (-int(p.get("year", 0) or 0), -int(p.get("citations", 0) or 0)),
+    )
+    undated = [p for p in pubs if not p.get("year")]
+    for p in dated + undated:
+        cell = (
+            y_at[_year(p)] * len(categories) + c_at[p.get("researchArea", "")]
+        ) * len(roles) + r_at[p.get("authorshipCategory") or NO_ROLE]
+        papers[cell] += 1
+        citations[cell] += int(p.get("citations", 0) or 0)
+        cp = p.get("categoryProbabilities") or {}
+        tot = sum(float(cp.get(name, 0)) for name in AREAS)
+        if tot > 0:
+            for a, name in enumerate(AREAS):
+                mass[cell * len(AREAS) + a] += float(cp.get(name, 0)) / tot
+
+    return {
+        "version": CUBE_VERSION,
+        "indexVersion": INDEX_VERSION,
+        "source": source,
+        "years": years,
+        "categories": categories,
+        "roles": roles,
+        "areas": list(AREAS),
+        "papers": papers,
+        "citations": citations,
+        "mass": mass,
+        "order": [p["key"] for p in dated],
+        "featured": [p["key"] for p in dated if p.get("featured")],
+        "metrics": {k: metrics[k] for k in METRIC_KEYS if k in metrics},
+    }
+
+
+class PublicationCube:
+    """Read access to a cube (see build_cube) by marginal sums."""
+
+    AXES = ("year", "category", "role")
+
+    def __init__(self, cube: Dict):
+        self.cube = cube
+        self.years: List[int] = cube["years"]
+        self.categories: List[str] = cube["categories"]
+        self.roles: List[str] = cube["roles"]
+        self.areas: List[str] = cube["areas"]
+        self.order: List[str] = cube["order"]
+        self.featured: List[str] = cube["featured"]
+        self.metrics: Dict = cube["metrics"]
+
+    def _cells(self, dated: bool) -> Iterable[Tuple[int, Tuple[int, str, str]]]:
+        cell = 0
+        for y in self.years:
+            for c in self.categories:
+                for r in self.roles:
+                    if y or not dated:
+                        yield cell, (y, c, r)
+                    cell += 1
+
+    def marginal(self, measure: str, *axes: str, dated: bool = False) -> Dict:
+        """Sum `measure` ("papers" or "citations") over every axis not in `axes`.
+
+        Keys are the axis values (tuples when several axes are kept).
+        """
+        values = self.cube[measure]
+        picks = [self.AXES.index(a) for a in axes]
+        out: Dict = {}
+        for cell, coords in self._cells(dated):
+            if values[cell]:
+                key = tuple(coords[i] for i in picks)
+                key = key[0] if len(key) == 1 else key
+                out[key] = out.get(key, 0) + values[cell]
+        return out
+
+    def total(self, measure: str, dated: bool = False) -> int:
+        values = self.cube[measure]
+        return sum(values[cell] for cell, _ in self._cells(dated))
+
+    def area_mass(self, dated: bool = True) -> Dict[str, float]:
+        """Probability-weighted mass per area, summed over the selected cells."""
+        n = len(self.areas)
+        mass = self.cube["mass"]
+        out = {name: 0.0 for name in self.areas}
+        for cell, _ in self._cells(dated):
+            for a, name in enumerate(self.areas):
+                out[name] += mass[cell * n + a]
+        return out
+
+
+def code_digest() -> str:
+    """Digest of the sources the cached cube depends on (this module, publication_store)."""
+    return sha256(" ".join(
+        file_sha256(module) or "" for module in (__file__, publication_store.__file__)
+    ).encode("utf-8"))
+
+
+def load_cube(store: Optional[PublicationStore] = None) -> PublicationCube:
+    """The cube for the current publications data, from the build cache when fresh."""
+    store = store or PublicationStore()
+    digest = store.source_digest()
+    code = code_digest()
+    cache_path = get_build_cache_dir() / "publication_cube.json"
+    if digest and cache_path.exists():
+        try:
+            cached = json_codec.load(cache_path)
+        except ValueError:
+            cached = None
+        if (
+            cached
+            and cached.get("version") == CUBE_VERSION
+            and cached.get("indexVersion") == INDEX_VERSION
+            and cached.get("source") == digest
+            and cached.get("code") == code
+        ):
+            return PublicationCube(cached)
+    cube = build_cube(store.publications, store.metrics, digest)
+    cube["code"] = code
+    if digest:
+        write_json_if_changed(cache_path, cube, indent=None, separators=(",", ":"))
+    return PublicationCube(cube)
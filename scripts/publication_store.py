@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Hot/cold split of publications_data.json for fast readers.
+
+publications_data.json stays the pipeline's source of truth, but most of its
+bytes (abstracts, full author lists, llm_categorization, per-source details)
+are never looked at when rendering the site. Alongside it the pipeline writes
+
+    assets/data/publications/index.json       hot index: metrics, the interned
+                                              author table, and one compact
+                                              record per paper (the fields the
+                                              build renders and author ids)
+    assets/data/publications/cold/<h>.json    cold shards: every other field,
+                                              keyed by record, 16 shards by
+                                              record key so a change to one
+                                              paper rewrites one shard
+
+Records are keyed on the paper's most stable identifier (arXiv ID, then DOI,
+then bibcode; the title fingerprint only when it has none), so retitling a
+paper leaves it in its shard.
+
+The index records the SHA-256 of the data file it was split from. Readers go
+through `PublicationStore`, which serves the hot index when it matches the
+data file and otherwise splits the data file in memory, so a stale or missing
+index costs speed, never correctness. The data file's digest comes from
+digest_cache, so a build only rehashes it after it changed.
+
+Usage: python scripts/publication_store.py   # regenerate from publications_data.json
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import canonical_json
+import json_codec
+from atomic_write import write_json_if_changed
+from authors import DISPLAY_AUTHORS, AuthorTable, format_authors_html
+from config import get_data_path
+from digest_cache import file_sha256
+from merge_data import DataMerger
+from paper_index import fingerprint
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# Bumped whenever record keys change (4: keys from stable identifiers)
+INDEX_VERSION = 4
+SHARD_COUNT = 16
+
+# Fields carried in the hot index, as stored in publications_data.json
+HOT_FIELDS = (
+    "id",
+    "title",
+    "year",
+    "journal",
+    "citations",
+    "bibcode",
+    "doi",
+    "arxivId",
+    "adsUrl",
+    "researchArea",
+    "authorshipCategory",
+    "categoryProbabilities",
+    "featured",
+)
+# Fields the hot index adds to each record. `authors` itself is stored only as
+# authorIds into the index's author table; the card's authorsDisplay and the
+# search authorsText are rendered from it on load, so they follow the code.
+DERIVED_FIELDS = ("key", "authorIds", "authorCount", "authorsDisplay", "authorsText")
+# Top-level keys copied into the hot index
+INDEX_TOP_LEVEL = ("lastUpdated", "contentHash", "metrics", "citationsByPublicationYear")
+
+
+def get_store_dir() -> Path:
+    return get_data_path("publications")
+
+
+def record_key(pub: Dict) -> str:
+    """A paper's key in the store: its first identifier that never changes once
+    assigned (arXiv ID, DOI, bibcode; a bibcode changes on journal publication),
+    else its title fingerprint."""
+    arxiv = DataMerger._norm_arxiv(pub.get("arxivId"))
+    if arxiv:
+        return f"arxiv:{arxiv}"
+    doi = DataMerger._norm_doi(pub.get("doi"))
+    if doi:
+        return f"doi:{doi}"
+    bibcode = DataMerger._norm_bibcode(pub.get("bibcode"))
+    if bibcode:
+        return f"bibcode:{bibcode}"
+    return fingerprint(pub)
+
+
+def _shard_name(key: str) -> str:
+    return f"{hashlib.sha1(key.encode('utf-8')).digest()[0] % SHARD_COUNT:x}"
+
+
+def split(data: Dict, source_sha256: str = "") -> Tuple[Dict, Dict[str, Dict]]:
+    """Split publications data into (hot index, {shard name: {key: cold fields}})."""
+    index = {"version": INDEX_VERSION, "sourceSha256": source_sha256}
+    index.update((k, data[k]) for k in INDEX_TOP_LEVEL if k in data)
+    table = AuthorTable()
+    hot_records = []
+    shards: Dict[str, Dict] = {f"{i:x}": {} for i in range(SHARD_COUNT)}
+    seen = set()
+    for pub in data.get("publications", []):
+        key = base = record_key(pub)
+        n = 1
+        while key in seen:
+            n += 1
+            key = f"{base}-{n}"
+        seen.add(key)
+        hot = {"key": key}
+        hot.update((f, pub[f]) for f in HOT_FIELDS if f in pub)
+        if "authors" in pub:
+            authors = pub["authors"] or []
+            hot["authorIds"] = table.ids(authors)
+            hot["authorCount"] = len(authors)
+        hot_records.append(hot)
+        shards[_shard_name(key)][key] = {
+            f: v for f, v in pub.items() if f not in HOT_FIELDS and f != "authors"
+        }
+    index["authors"] = table.names
+    index["publications"] = hot_records
+    return index, shards
+
+
+def join(hot: Dict, cold: Dict) -> Dict:
+    """Reassemble a full publication record from its hot and cold parts
+    (`cold` as returned by PublicationStore.cold, i.e. with `authors`)."""
+    record = {f: v for f, v in hot.items() if f not in DERIVED_FIELDS}
+    record.update(cold)
+    return canonical_json.canonical_publication(record)
+
+
+def write(data: Dict, raw: bytes, root: Optional[Path] = None) -> int:
+    """Write the hot index and cold shards for `data` (whose file bytes are `raw`).
+
+    Unchanged files are left alone; returns the number of files written.
+    """
+    root = Path(root) if root else get_store_dir()
+    index, shards = split(data, hashlib.sha256(raw).hexdigest())
+    written = 0
+    for name, records in shards.items():
+        written += write_json_if_changed(root / "cold" / f"{name}.json", records, sort_keys=True)
+    # The index is read on every build and never edited by hand: keep it compact
+    written += write_json_if_changed(root / "index.json", index, indent=None, separators=(",", ":"))
+    return written
+
+
+class PublicationStore:
+    """Read access to publications data through the hot index.
+
+    `publications` are hot records (see HOT_FIELDS/DERIVED_FIELDS); `cold()`
+    and `expand()` fetch the remaining fields, loading one shard at a time, and
+    resolve the full author list from the author table.
+    """
+
+    def __init__(self, source: Optional[Path] = None, root: Optional[Path] = None):
+        self.source = Path(source) if source else get_data_path()
+        self.root = Path(root) if root else get_store_dir()
+        self._index: Optional[Dict] = None
+        self._shards: Dict[str, Dict] = {}
+        self._full: Optional[Dict] = None
+        self._digest: Optional[str] = None
+        self.authors = AuthorTable()
+
+    def _load(self) -> Dict:
+        if self._index is None:
+            self._index = self._read_index()
+            self.authors = AuthorTable(self._index.get("authors", []))
+            names = self.authors.names
+            for pub in self._index["publications"]:
+                ids = pub.get("authorIds", ())
+                pub["authorsDisplay"] = format_authors_html(
+                    [names[i] for i in ids[:DISPLAY_AUTHORS]], len(ids)
+                )
+                pub["authorsText"] = " ".join([names[i] for i in ids])
+        return self._index
+
+    def source_digest(self) -> Optional[str]:
+        """SHA-256 of the data file (None if it does not exist); cache key for derived data."""
+        if self._digest is None:
+            self._digest = file_sha256(self.source)
+        return self._digest
+
+    def _read_index(self) -> Dict:
+        digest = self.source_digest()
+        index_path = self.root / "index.json"
+        if index_path.exists():
+            index = json_codec.load(index_path)
+            if index.get("version") == INDEX_VERSION and (
+                digest is None or index.get("sourceSha256") == digest
+            ):
+                return index
+            logger.warning(
+                f"{index_path} is stale; reading {self.source.name} "
+                f"(run scripts/publication_store.py to refresh)"
+            )
+        if digest is None:
+            return {"version": INDEX_VERSION, "publications": []}
+        # Fall back to the full file, split in memory
+        self._full = json_codec.load(self.source)
+        index, self._shards = split(self._full)
+        return index
+
+    @property
+    def index(self) -> Dict:
+        return self._load()
+
+    @property
+    def metrics(self) -> Dict:
+        return self._load().get("metrics", {}) or {}
+
+    @property
+    def publications(self) -> List[Dict]:
+        return self._load().get("publications", [])
+
+    def cold(self, pub: Dict) -> Dict:
+        """Cold fields of hot record `pub`, plus its full `authors` list."""
+        self._load()
+        name = _shard_name(pub["key"])
+        if name not in self._shards:
+            path = self.root / "cold" / f"{name}.json"
+            self._shards[name] = json_codec.load(path) if path.exists() else {}
+        cold = self._shards[name].get(pub["key"], {})
+        if "authorIds" in pub:
+            cold = dict(cold, authors=self.authors.lookup(pub["authorIds"]))
+        return cold
+
+    def expand(self, pub: Dict, fields: Optional[Iterable[str]] = None) -> Dict:
+        """Hot record `pub` plus its cold `fields` (all of them by default)."""
+        cold = self.cold(pub)
+        if fields is not None:
+            cold = {f: cold[f] for f in fields if f in cold}
+        return dict(pub, **cold)
+
+    def load_full(self) -> Dict:
+        """The complete data, as publications_data.json holds it."""
+        if self._full is None:
+            if self.source.exists():
+                self._full = json_codec.load(self.source)
+            else:
+                index = self._load()
+                self._full = {k: index[k] for k in INDEX_TOP_LEVEL if k in index}
+                self._full["publications"] = [join(p, self.cold(p)) for p in index["publications"]]
+        return self._full
+
+
+def main():
+    source = get_data_path()
+    raw = source.read_bytes()
+    written = write(json_codec.loads(raw), raw)
+    logger.info(f"Split {source.name} into {get_store_dir()}: {written} file(s) written")
+
+
+if __name__ == "__main__":
+    main()
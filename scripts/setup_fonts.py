@@ -3,7 +3,9 @@ and generate assets/css/fonts.css (@font-face rules). Re-runnable; idempotent.
 
 Run: npm install  (once, to populate node_modules)  ->  python scripts/setup_fonts.py
 """
-import os, shutil
+import os
+
+from atomic_write import stats as write_stats, write_if_changed
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 NM = os.path.join(ROOT, "node_modules", "@fontsource")
@@ -31,7 +33,8 @@ def main():
                 print(f"  MISSING: {src}")
                 continue
             dst_name = f"{pkg}-{weight}-{suffix}.woff2"
-            shutil.copyfile(src, os.path.join(FONTS_DIR, dst_name))
+            with open(src, "rb") as f:
+                write_if_changed(os.path.join(FONTS_DIR, dst_name), f.read())
             faces.append((family, weight, style, dst_name))
 
     lines = [
@@ -49,10 +52,9 @@ def main():
             f"  src: url('../fonts/{fn}') format('woff2');",
             "}",
         ]
-    with open(CSS_OUT, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines) + "\n")
+    write_if_changed(CSS_OUT, "\n".join(lines) + "\n")
     print(f"Vendored {len(faces)} font files -> {FONTS_DIR}")
-    print(f"Wrote {CSS_OUT}")
+    print(f"Wrote {CSS_OUT} ({write_stats.report()})")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,174 @@
+"""
+Text normalization shared by the fetchers, the merger and the build.
+
+Sources spell the same title differently: ADS sends HTML entities and
+<SUB>/<SUP> tags, OpenAlex MathML, arXiv-derived records LaTeX ($\\sigma_8$,
+{\\"o}), and accents come precomposed or not at all. `normalize_title` maps
+all of them to one comparison key:
+
+    1. HTML entities decoded (repeatedly, for double-encoded &amp;lt;)
+    2. tags stripped (<i>z</i> -> z)
+    3. LaTeX canonicalized: accent macros to accented letters, symbol
+       commands to Unicode (\\sigma -> σ), font wrappers and math delimiters
+       dropped
+    4. NFKD compatibility decomposition with combining marks removed
+       (Schrödinger -> Schrodinger, ﬁ -> fi)
+    5. lowercased, punctuation removed, whitespace collapsed
+
+Every pattern is compiled once here, and each step is skipped when the text
+cannot need it (no markup characters, pure ASCII). `normalize_title` is
+LRU-cached (titles recur across sources and pipeline stages);
+`normalize_titles` normalizes a whole list, each distinct entry once.
+
+The display-side helpers (`clean_math_notation`, `math_notation_issues`)
+tidy and check <SUB>/<SUP> spacing in titles kept for display.
+"""
+
+import html
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+CACHE_SIZE = 65536
+
+_TAG = re.compile(r"<[^>]+>")
+_NON_WORD = re.compile(r"[^\w\s]+")
+_NON_ASCII = re.compile(r"[^\x00-\x7f]+")
+# Characters that mark a string as carrying entities, tags or LaTeX
+_MARKUP = re.compile(r"[&<\\$]")
+
+# LaTeX accent macros (\"o, \'{e}, \c{c}) -> combining marks
+_LATEX_ACCENTS = {
+    '"': "\u0308", "'": "\u0301", "`": "\u0300", "^": "\u0302", "~": "\u0303",
+    "=": "\u0304", ".": "\u0307", "c": "\u0327", "v": "\u030c", "u": "\u0306",
+    "H": "\u030b", "r": "\u030a", "k": "\u0328",
+}
+_LATEX_ACCENT = re.compile(
+    r"""\\([\"'`^~=.]|[cvuHrk](?![A-Za-z]))\s*(?:\{\s*([A-Za-z])\s*\}|([A-Za-z]))"""
+)
+_GREEK = (
+    "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu nu xi "
+    "omicron pi rho sigma tau upsilon phi chi psi omega"
+).split()
+_LATEX_SYMBOLS: Dict[str, str] = {
+    **{name: chr(0x3B1 + i + (i >= 17)) for i, name in enumerate(_GREEK)},
+    **{name.capitalize(): chr(0x391 + i + (i >= 17)) for i, name in enumerate(_GREEK)},
+    "varepsilon": "ε", "vartheta": "θ", "varphi": "φ", "varsigma": "ς",
+    "odot": "☉", "sun": "☉", "oplus": "⊕", "star": "⋆", "ast": "∗",
+    "sim": "∼", "approx": "≈", "simeq": "≃", "propto": "∝", "times": "×",
+    "pm": "±", "mp": "∓", "le": "≤", "leq": "≤", "ge": "≥", "geq": "≥",
+    "lesssim": "≲", "gtrsim": "≳", "ll": "≪", "gg": "≫", "neq": "≠",
+    "infty": "∞", "prime": "′", "deg": "°", "circ": "∘", "AA": "Å",
+    "aa": "å", "o": "ø", "O": "Ø", "ss": "ß", "ae": "æ", "AE": "Æ", "l": "ł",
+}
+# Commands that only style their argument
+_LATEX_WRAPPERS = (
+    "mathrm text textrm rm it bf sf tt mathit mathbf mathsf mathcal mathbb "
+    "textit textbf textsf emph ensuremath operatorname mbox hbox"
+).split()
+_LATEX_COMMAND = re.compile(r"\\([A-Za-z]+)\s?")
+_LATEX_ESCAPE = re.compile(r"\\([&%_# ,;:!])")
+_LATEX_MATH = re.compile(r"\$([^$]*)\$")
+_MATH_SYNTAX = re.compile(r"[_^{}~]")
+
+# Display: spaces between a Latin or Greek letter and <SUB>/<SUP>
+_MATH_SPACE = re.compile(r"([A-Za-zα-ωΑ-Ω])\s+<(SUB|SUP)>")
+_SPACE_BEFORE_SCRIPT = re.compile(r"\s+<SU[BP]>")
+_GREEK_SPACE_DIGIT = re.compile(r"[α-ωΑ-Ω]\s+\d")
+
+
+def decode_entities(text: str) -> str:
+    """Decode HTML entities until none are left (&amp;lt; -> &lt; -> <)."""
+    prev = None
+    while prev != text:
+        prev, text = text, html.unescape(text)
+    return text
+
+
+def strip_tags(text: str) -> str:
+    return _TAG.sub("", str(text or ""))
+
+
+def _latex_command(match: "re.Match") -> str:
+    name = match.group(1)
+    if name in _LATEX_SYMBOLS:
+        return _LATEX_SYMBOLS[name]
+    if name in _LATEX_WRAPPERS:
+        return ""
+    return name + " " if match.group(0).endswith(" ") else name
+
+
+def canonical_latex(text: str) -> str:
+    """LaTeX to plain Unicode text: accents, symbols, font wrappers, math syntax."""
+    if "\\" not in text and "$" not in text:
+        return text
+    text = _LATEX_ACCENT.sub(
+        lambda m: unicodedata.normalize("NFC", (m.group(2) or m.group(3)) + _LATEX_ACCENTS[m.group(1)]),
+        text,
+    )
+    text = _LATEX_ESCAPE.sub(lambda m: " " if m.group(1) in " ,;:!" else m.group(1), text)
+    text = _LATEX_COMMAND.sub(_latex_command, text)
+    return _LATEX_MATH.sub(lambda m: _MATH_SYNTAX.sub("", m.group(1)), text)
+
+
+def canonical_markup(text: str) -> str:
+    """Entities decoded, tags stripped and LaTeX canonicalized (case kept)."""
+    if not _MARKUP.search(text):
+        return text
+    return canonical_latex(strip_tags(decode_entities(text)))
+
+
+@lru_cache(maxsize=4096)
+def _fold_run(run: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", run)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def fold_accents(text: str) -> str:
+    """NFKD compatibility decomposition without combining marks.
+
+    Only runs of non-ASCII characters are decomposed (NFKD never reorders
+    across an ASCII character), and the few distinct runs are cached.
+    """
+    if text.isascii():
+        return text
+    return _NON_ASCII.sub(lambda m: _fold_run(m.group()), text)
+
+
+def _normalize(title: str) -> str:
+    text = fold_accents(canonical_markup(title)).lower()
+    # str.split() and re's \s agree on what is whitespace
+    return " ".join(_NON_WORD.sub("", text).split())
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_title(title: str) -> str:
+    """Comparison key for a title (see the module docstring for the steps)."""
+    return _normalize(str(title or ""))
+
+
+def normalize_titles(titles: Iterable[str]) -> List[str]:
+    """normalize_title over a whole list, computing each distinct title once.
+
+    Bypasses the LRU cache, so a one-off batch (every abstract, a fetched
+    author list) does not evict the titles that recur across pipeline stages.
+    """
+    titles = [str(t or "") for t in titles]
+    keys = {t: _normalize(t) for t in dict.fromkeys(titles)}
+    return [keys[t] for t in titles]
+
+
+def clean_math_notation(title: str) -> str:
+    """Remove spaces before <SUB>/<SUP> after a letter (σ <SUB>8</SUB> -> σ<SUB>8</SUB>)."""
+    return _MATH_SPACE.sub(r"\1<\2>", title)
+
+
+def math_notation_issues(title: str) -> List[str]:
+    """Likely mathematical-notation formatting problems in a display title."""
+    issues = []
+    if _SPACE_BEFORE_SCRIPT.search(title):
+        issues.append("Space before subscript/superscript")
+    if _GREEK_SPACE_DIGIT.search(title):
+        issues.append("Possible mathematical notation with space")
+    return issues
@@ -12,10 +12,8 @@ process_publications.py into a single, efficient pipeline that:
 Much faster than the original pipeline by avoiding unnecessary detailed fetches.
 """
 
-import json
 import logging
 import os
-import shutil
 import sys
 import time
 from datetime import datetime
@@ -32,7 +30,7 @@ from rich.progress import (
 from rich.table import Table
 from dotenv import load_dotenv
 
-from config import CONFIG, get_project_root, get_data_path, get_backup_dir
+from config import CONFIG, get_project_root
 
 # Load environment variables from .env file
 env_path = get_project_root() / ".env"
@@ -46,6 +44,14 @@ from fetch_google_scholar import GoogleScholarFetcher
 from fetch_ads import ADSFetcher
 from fetch_openalex import OpenAlexFetcher
 from merge_data import DataMerger
+from atomic_write import stats as write_stats
+from backup_store import BackupStore
+from data_store import DataStore
+from publication import to_dicts
+from paper_index import PaperIndex
+from categorization_queue import CategorizationCache, CategorizationQueue
+from citation_history import CitationHistory
+from text_normalize import normalize_title
 
 # Set up logging
 logging.basicConfig(
@@ -77,6 +83,11 @@ class UnifiedPublicationPipeline:
         self.ads_data = []
         self.openalex_data = []
         self.merged_data = None
+        self.merged_backup_ref = None
+
+        # publications_data.json, loaded once and written once per run
+        self.store = DataStore()
+        self.backups = BackupStore()
 
     def run(self):
         """Main execution method."""
@@ -127,18 +138,13 @@ class UnifiedPublicationPipeline:
         """Stage 0: Backup existing publications data before making any changes."""
         console.print("\n[bold green][0/7][/bold green] Backing up existing data...")
 
-        existing_file = get_data_path()
-
-        if existing_file.exists():
-            backup_dir = get_backup_dir()
-            backup_dir.mkdir(parents=True, exist_ok=True)
-
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = backup_dir / f"publications_PRE_UPDATE_{timestamp}.json"
-
+        if self.store.path.exists():
             try:
-                shutil.copy2(existing_file, backup_path)
-                console.print(f"  ✓ Existing data backed up to {backup_path}")
+                digest, stored = self.backups.save(
+                    self.store.load(), label="pre-update", raw=self.store.original_bytes
+                )
+                status = "stored" if stored else "unchanged since last backup"
+                console.print(f"  ✓ Existing data backed up as {digest[:12]} ({status})")
             except Exception as e:
                 console.print(f"  ⚠️  Backup failed: {e}", style="yellow")
                 raise RuntimeError(f"Failed to backup existing data: {e}")
@@ -297,13 +303,13 @@ class UnifiedPublicationPipeline:
                         bib = pub.get("bib", {})
                         title = bib.get("title", "").strip()
                         if title:
-                            normalized = self.scholar_fetcher._normalize_title(title)
+                            normalized = normalize_title(title)
                             pub_lookup[normalized] = pub
 
                     # Fetch details for papers that need it
                     for paper in papers_needing_details:
                         title = paper.get("title", "").strip()
-                        normalized = self.scholar_fetcher._normalize_title(title)
+                        normalized = normalize_title(title)
 
                         if normalized in pub_lookup:
                             pub = pub_lookup[normalized]
@@ -338,24 +344,17 @@ class UnifiedPublicationPipeline:
         Fields like llm_categorization, categoryProbabilities, researchArea,
         and featured are set by separate processes (LLM agents, post-processing)
         and would be lost during the merge step since fetchers don't produce them.
+        Existing papers are matched by bibcode/DOI/arXiv ID first and normalized
+        title last, so casing or punctuation changes in a title don't drop them.
+        Papers with no existing match fall back to the categorization cache.
+        Returns the number of distinct papers that got any field back.
         """
-        # Load existing data from the canonical path
-        existing_path = get_data_path()
-        if not existing_path.exists():
-            return 0
-
         try:
-            with open(existing_path, "r", encoding="utf-8") as f:
-                existing_data = json.load(f)
-        except Exception:
-            return 0
-
-        # Build lookup by normalized title
-        existing_lookup = {}
-        for pub in existing_data.get("publications", []):
-            key = pub.get("title", "").strip().lower()
-            if key:
-                existing_lookup[key] = pub
+            self.store.load()
+        except Exception as e:
+            logger.warning(f"Could not read existing data: {e}")
+        existing_pubs = (self.store.original or {}).get("publications", [])
+        existing_index = PaperIndex(existing_pubs)
 
         # Fields to preserve from existing data
         preserve_fields = [
@@ -364,22 +363,32 @@ class UnifiedPublicationPipeline:
             "researchArea",
         ]
 
-        carried = 0
+        updated = set()
         for pub in merged_publications:
-            key = pub.get("title", "").strip().lower()
-            existing = existing_lookup.get(key)
+            existing = existing_index.lookup(pub)
             if not existing:
                 continue
 
+            copied = False
             for field in preserve_fields:
                 if field in existing and field not in pub:
                     pub[field] = existing[field]
-
-            # Only count if we actually carried something
-            if any(field in pub for field in preserve_fields if field in existing):
-                carried += 1
-
-        return carried
+                    copied = True
+            if copied:
+                updated.add(id(pub))
+
+        # Anything still uncategorized may have been categorized under another
+        # title/identifier in an earlier run; restore it instead of recomputing.
+        cache = CategorizationCache().load()
+        cache.seed(existing_pubs)
+        pending = [p for p in merged_publications if CategorizationQueue.needs_categorization(p)]
+        restored = CategorizationQueue.restore_from_cache(cache, pending)
+        cache.save()
+        if restored:
+            console.print(f"  ✓ Restored {restored} categorizations from cache")
+            updated.update(id(p) for p in pending if not CategorizationQueue.needs_categorization(p))
+
+        return len(updated)
 
     def _stage_5_merge_data(self):
         """Stage 5: Merge all data sources."""
@@ -427,7 +436,8 @@ class UnifiedPublicationPipeline:
         self.merged_data = {
             "lastUpdated": datetime.now().isoformat() + "Z",
             "metrics": merged_metrics,
-            "publications": merged_publications,
+            # Records leave the pipeline as plain dicts (the JSON boundary)
+            "publications": to_dicts(merged_publications),
             "citationsByPublicationYear": self._calculate_citations_by_year(
                 merged_publications
             ),
@@ -443,18 +453,14 @@ class UnifiedPublicationPipeline:
         """Stage 6: Save the scraped/merged data."""
         console.print("\n[bold green][6/7][/bold green] Saving scraped data...")
 
-        output_path = get_data_path()
-        backup_dir = get_backup_dir()
-        backup_dir.mkdir(parents=True, exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_path = backup_dir / f"publications_backup_{timestamp}.json"
+        output_path = self.store.path
 
         # Save backup
+        backup_ref = "(backup failed)"
         try:
-            with open(backup_path, "w", encoding="utf-8") as f:
-                json.dump(self.merged_data, f, indent=2, ensure_ascii=False)
-            console.print(f"  ✓ Backup saved to {backup_path}")
+            digest, _ = self.backups.save(self.merged_data, label="merged")
+            backup_ref = self.merged_backup_ref = digest[:12]
+            console.print(f"  ✓ Merged data backed up as {backup_ref}")
         except Exception as e:
             console.print(f"  ⚠️  Backup failed: {e}", style="yellow")
 
@@ -463,8 +469,7 @@ class UnifiedPublicationPipeline:
         existing_count = 0
         if output_path.exists():
             try:
-                with open(output_path, "r", encoding="utf-8") as f:
-                    existing_count = len(json.load(f).get("publications", []))
+                existing_count = self.store.original_count
             except Exception as e:
                 console.print(
                     f"  ⚠️  Could not read existing data for safety check: {e}",
@@ -485,17 +490,17 @@ class UnifiedPublicationPipeline:
                 style="bold red",
             )
             console.print(
-                f"  ❌ The merged result is preserved in the backup: {backup_path}",
+                f"  ❌ The merged result is preserved in backup {backup_ref} "
+                f"(restore with: python scripts/backup_store.py restore {backup_ref} --to <path>)",
                 style="bold red",
             )
             return
 
-        # Save main file
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(self.merged_data, f, indent=2, ensure_ascii=False)
+        # Hand the merged data to the store; post-processing works on it in
+        # memory and the file is written once at the end of the run.
+        self.store.set(self.merged_data)
 
-        console.print(f"  ✓ Data saved to {output_path}")
+        console.print(f"  ✓ Merged data staged for {output_path}")
 
     def _stage_7_post_processing(self):
         """Stage 7: Run consolidated post-processing."""
@@ -503,11 +508,37 @@ class UnifiedPublicationPipeline:
 
         from postprocessing import PostProcessor
 
-        processor = PostProcessor()
-        processor.run_all()
+        processor = PostProcessor(store=self.store)
+        try:
+            processor.run_all()
+        except Exception:
+            # Post-processing only enriches the merged data; don't lose the
+            # merge with it (the network-bound steps are the likely failures).
+            if self.store.save():
+                console.print(
+                    f"  ❌ Post-processing failed; merged data saved to {self.store.path} without it",
+                    style="bold red",
+                )
+            if self.merged_backup_ref:
+                console.print(
+                    f"  ❌ The merged result is also in backup {self.merged_backup_ref} "
+                    f"(restore with: python scripts/backup_store.py restore {self.merged_backup_ref} --to <path>)",
+                    style="bold red",
+                )
+            raise
 
+        if self.store.save():
+            console.print(f"  ✓ Data saved to {self.store.path}")
         console.print("  ✓ Post-processing complete")
 
+        rows = CitationHistory().record(self.store.data)
+        console.print(f"  ✓ Citation history: {rows} change(s) recorded")
+        console.print(
+            f"  ℹ️  Data I/O: {self.store.report()}; "
+            f"backups wrote {self.backups.bytes_written / 1024:.1f} KB"
+        )
+        console.print(f"  ℹ️  File writes: {write_stats.report()}")
+
     def _calculate_citations_by_year(self, publications: List[Dict]) -> Dict:
         """Calculate citations by publication year."""
         citations_by_year = {}
@@ -528,9 +559,7 @@ class UnifiedPublicationPipeline:
         """Display final statistics."""
         console.print("\n[bold cyan]📊 FINAL STATISTICS[/bold cyan]")
 
-        # Load the final processed data
-        with open(get_data_path(), "r", encoding="utf-8") as f:
-            final_data = json.load(f)
+        final_data = self.store.load() or {}
 
         metrics = final_data.get("metrics", {})
         publications = final_data.get("publications", [])
@@ -0,0 +1,35 @@
+"""Near-duplicate grouping must not chain distinct papers through a linking record."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from merge_data import DataMerger  # noqa: E402
+from near_duplicates import near_duplicate_clusters  # noqa: E402
+
+# A ~ B and B ~ C are both above the 0.8 threshold
+A = "a deep learning model for galaxy morphology classification"
+B = "a deep learning model for galaxy morphology classifications"
+C = "deep learning models for galaxy morphology classifications"
+
+
+def test_chain_without_distinct_is_one_group():
+    groups = near_duplicate_clusters([A, B, C])
+    assert [[i for i, _ in g] for g in groups] == [[0, 1, 2]]
+
+
+def test_distinct_ends_are_not_chained():
+    groups = near_duplicate_clusters([A, B, C], distinct=lambda i, j: {i, j} == {0, 2})
+    assert [[i for i, _ in g] for g in groups] == [[0, 1]]
+
+
+def test_check_for_duplicates_keeps_both_arxiv_papers():
+    # A (arXiv X) ~ B (no arXiv) ~ C (arXiv Y): B joins one of them, never both
+    pubs = [
+        {"title": A.capitalize(), "arxivId": "2101.00001"},
+        {"title": B.capitalize()},
+        {"title": C.capitalize(), "arxivId": "2202.00002"},
+    ]
+    kept = DataMerger()._check_for_duplicates(pubs)
+    assert sorted(p.get("arxivId", "") for p in kept) == ["2101.00001", "2202.00002"]